@@ -0,0 +1,377 @@
+##
+# Benchmark suite for the simple games.
+# Measures single-game latency and batch throughput (games per second) for
+# every ruleset/strategy pair, the time taken by a full generation of
+# `GeneticAlgorithm.evolve`, and the peak memory used per population size.
+#
+# Every benchmark is seeded, so two runs on the same machine play the same
+# games. Results are written as JSON and can be compared against a stored
+# baseline run:
+#
+#   python benchmark.py --output results.json
+#   python benchmark.py --baseline results.json --output new.json
+#
+# Date: 2026-10-18
+##
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from statistics import median
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from classes.game import Game
+from classes.genetic_algorithm import GeneticAlgorithm
+from classes.player import Player
+from classes.referee import Referee
+from graph_coloring.classes.gc_ruleset import GCRuleset
+from graph_coloring.classes.gc_data_strategy import GCDataStrategy
+from graph_coloring.classes.gc_random_init_strategy import GCRandomInitStrategy
+from graph_coloring.classes.gc_random_strategy import GCRandomStrategy
+from graph_coloring.classes.gc_simple_smart_strategy import GCSimpleSmartStrategy
+from toothpick_takeaway.classes.toothpick_ruleset import ToothpickRuleset
+from toothpick_takeaway.classes.toothpick_strategy import ToothpickStrategy
+from unbalanced_rook.classes.rook_ruleset import RookRuleset
+from unbalanced_rook.classes.rook_strategy import RookStrategy
+
+# Version of the JSON layout; bump it when results stop being comparable
+FORMAT_VERSION = 1
+
+# Whether a larger value of each metric is an improvement
+HIGHER_IS_BETTER = {
+    "games_per_sec": True,
+    "latency_ms": False,
+    "seconds_per_generation": False,
+    "spawns_per_sec": True,
+    "breeds_per_sec": True,
+    "peak_bytes": False,
+    }
+
+# The 14-node graph studied in `14Nodes.ipynb`
+FOURTEEN_NODES = [[5], [6], [7], [8], [5], [0, 4, 6, 10], [1, 5, 7, 11], [2, 6, 8, 12],
+        [3, 7, 9, 13], [8], [5], [6], [7], [8]]
+
+def path(num_vertices):
+    """
+    Builds the adjacency lists of a path.
+
+    Args:
+        num_vertices : The number of vertices in the path
+
+    Return:
+        A list of neighbor lists, one per vertex
+    """
+    return [[adj for adj in (vtx - 1, vtx + 1) if 0 <= adj < num_vertices]
+            for vtx in range(num_vertices)]
+
+def cycle(num_vertices):
+    """
+    Builds the adjacency lists of a cycle.
+
+    Args:
+        num_vertices : The number of vertices in the cycle
+
+    Return:
+        A list of neighbor lists, one per vertex
+    """
+    return [[(vtx - 1) % num_vertices, (vtx + 1) % num_vertices] for vtx in range(num_vertices)]
+
+def graph_coloring(adjacency, num_colors):
+    """
+    Builds a graph coloring game, along with its strategies and the data they are built from.
+
+    Args:
+        adjacency : The neighbor lists of the graph
+        num_colors : The number of colors available
+
+    Return:
+        A tuple of the ruleset, a dictionary of strategy constructors and the strategy data
+    """
+    initial_state = [{"color": 0, "adj": adj} for adj in adjacency]
+    ruleset = GCRuleset("Graph Coloring Ruleset", initial_state, num_colors)
+    data = {"vertices": range(len(initial_state)), "colors": range(1, num_colors + 1)}
+
+    strategies = {
+        "random": lambda: GCRandomStrategy("Random"),
+        "random_init": lambda: GCRandomInitStrategy("Random Init", data),
+        "data": lambda: GCDataStrategy("Data", {"vertices": list(data["vertices"]),
+            "colors": list(data["colors"])}),
+        "simple_smart": lambda: GCSimpleSmartStrategy("Simple Smart"),
+        }
+
+    return ruleset, strategies, data
+
+def suites():
+    """
+    Lists every game benchmarked.
+
+    Return:
+        A list of `(name, ruleset, strategies, strategy data)` tuples; the data is None
+        for games that cannot be evolved
+    """
+    games = []
+    for size in (9, 10):
+        games.append(("gc_path{}".format(size),) + graph_coloring(path(size), 2))
+    for size in (9, 10):
+        games.append(("gc_cycle{}".format(size),) + graph_coloring(cycle(size), 3))
+    games.append(("gc_14nodes",) + graph_coloring(FOURTEEN_NODES, 3))
+
+    games.append(("toothpick", ToothpickRuleset("Toothpick Ruleset", 10, 2),
+        {"random": lambda: ToothpickStrategy("Random")}, None))
+    games.append(("rook", RookRuleset("Rook Ruleset", {"D": 0, "R": 0}, {"D": 10, "R": 10}),
+        {"random": lambda: RookStrategy("Random")}, None))
+
+    return games
+
+def bench_games(ruleset, p1_strat, p2_strat, num_games):
+    """
+    Measures how long games between two strategies take.
+
+    Args:
+        ruleset : The ruleset of the game
+        p1_strat : Strategy of Player 1
+        p2_strat : Strategy of Player 2
+        num_games : Number of games to play in each measurement
+
+    Return:
+        A dictionary with the median latency of a single game, as played in the
+        notebooks, and the throughput of a batch of games played without a move log
+    """
+    players = [Player("Player 1", p1_strat), Player("Player 2", p2_strat)]
+
+    # Single games, on a recording board
+    board = ruleset.create_board()
+    game = Game(Referee(board, ruleset), board, players)
+    latencies = []
+    for _ in range(num_games):
+        start = time.perf_counter()
+        game.play()
+        latencies.append(time.perf_counter() - start)
+
+    # A batch of games, on a board that keeps no history, as tournaments play them
+    board = ruleset.create_board(record=False)
+    game = Game(Referee(board, ruleset), board, players)
+    start = time.perf_counter()
+    for _ in range(num_games):
+        game.play()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "latency_ms": 1000.0 * median(latencies),
+        "games_per_sec": num_games / elapsed if elapsed else float("inf"),
+        }
+
+def genetic_algorithm(ruleset, data, pop_size, iterations):
+    """
+    Builds the genetic algorithm benchmarked on a game.
+
+    Args:
+        ruleset : The ruleset of the game
+        data : Data used to generate random strategies
+        pop_size : Size of each population
+        iterations : Number of generations
+
+    Return:
+        The genetic algorithm
+    """
+    return GeneticAlgorithm(ruleset, GCRandomInitStrategy, data, pop_size=pop_size,
+            iterations=iterations, num_games=10)
+
+def bench_generation(ruleset, data, pop_size, iterations, spawns):
+    """
+    Measures the time taken by whole generations of evolution and by breeding alone.
+
+    Args:
+        ruleset : The ruleset of the game
+        data : Data used to generate random strategies
+        pop_size : Size of each population
+        iterations : Number of generations to evolve
+        spawns : Number of children to breed
+
+    Return:
+        A dictionary with the average time per generation and the breeding
+        throughput, one child at a time and in batches
+    """
+    ga = genetic_algorithm(ruleset, data, pop_size, iterations)
+    start = time.perf_counter()
+    ga.evolve()
+    per_generation = (time.perf_counter() - start) / iterations
+
+    parents = ga.generate_population(pop_size, 1)
+    start = time.perf_counter()
+    for num in range(spawns):
+        parent1, parent2 = random.sample(parents, 2)
+        ga.spawn(parent1, parent2, "Player 1", "Evolved Strategy #{}".format(num))
+    elapsed = time.perf_counter() - start
+
+    # The same number of children, bred as one cohort of random pairs
+    pairs = [random.sample(range(pop_size), 2) for _ in range(spawns)]
+    start = time.perf_counter()
+    ga.breed(parents, pairs, "Player 1")
+    batch_elapsed = time.perf_counter() - start
+
+    return {
+        "seconds_per_generation": per_generation,
+        "spawns_per_sec": spawns / elapsed if elapsed else float("inf"),
+        "breeds_per_sec": spawns / batch_elapsed if batch_elapsed else float("inf"),
+        }
+
+def bench_memory(ruleset, data, pop_size):
+    """
+    Measures the peak memory allocated while evolving one generation.
+
+    Args:
+        ruleset : The ruleset of the game
+        data : Data used to generate random strategies
+        pop_size : Size of each population
+
+    Return:
+        A dictionary with the peak number of bytes allocated
+    """
+    ga = genetic_algorithm(ruleset, data, pop_size, 1)
+
+    tracemalloc.start()
+    try:
+        ga.evolve()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"peak_bytes": peak}
+
+def run(seed = 0, quick = False, verbose = False):
+    """
+    Runs every benchmark.
+
+    Args:
+        seed : (Optional) Seed of the random number generator, reset before every benchmark
+        quick : (Optional) Whether to use fewer games and smaller populations
+        verbose : (Optional) Whether to print each result as it is measured
+
+    Return:
+        A dictionary of the run's settings and results, ready to be written as JSON
+    """
+    num_games = 100 if quick else 1000
+    pop_sizes = (20, 50) if quick else (50, 100, 200)
+    iterations = 2 if quick else 5
+    spawns = 1000 if quick else 10000
+
+    results = {}
+
+    def record(name, measure, *args):
+        random.seed(seed)
+        results[name] = measure(*args)
+        if verbose:
+            print(name, json.dumps(results[name]))
+
+    for game, ruleset, strategies, data in suites():
+        for p1_name, p1_strat in strategies.items():
+            for p2_name, p2_strat in strategies.items():
+                record("games/{}/{}-vs-{}".format(game, p1_name, p2_name),
+                        bench_games, ruleset, p1_strat(), p2_strat(), num_games)
+
+        if data is None:
+            continue
+
+        record("evolve/{}/pop{}".format(game, pop_sizes[0]),
+                bench_generation, ruleset, data, pop_sizes[0], iterations, spawns)
+
+        for pop_size in pop_sizes:
+            record("memory/{}/pop{}".format(game, pop_size), bench_memory, ruleset, data, pop_size)
+
+    return {
+        "format": FORMAT_VERSION,
+        "settings": {"seed": seed, "quick": quick, "num_games": num_games,
+            "pop_sizes": list(pop_sizes), "iterations": iterations, "spawns": spawns},
+        "machine": {"python": platform.python_version(), "implementation": platform.python_implementation(),
+            "system": platform.platform(), "processor": platform.processor()},
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+        }
+
+def compare(baseline, current, threshold = 0.1):
+    """
+    Compares two benchmark runs metric by metric.
+
+    Args:
+        baseline : The results of the baseline run
+        current : The results of the new run
+        threshold : (Optional) Relative change beyond which a metric counts as changed
+
+    Return:
+        A list of `(benchmark, metric, baseline value, new value, change, verdict)` tuples,
+        where the change is relative and positive changes are improvements
+    """
+    rows = []
+    for name, metrics in sorted(current["results"].items()):
+        old_metrics = baseline["results"].get(name)
+        if old_metrics is None:
+            continue
+
+        for metric, value in sorted(metrics.items()):
+            old = old_metrics.get(metric)
+            if not old:
+                continue
+
+            change = (value - old) / old
+            if not HIGHER_IS_BETTER.get(metric, True):
+                change = -change
+
+            if change > threshold:
+                verdict = "faster" if metric != "peak_bytes" else "smaller"
+            elif change < -threshold:
+                verdict = "REGRESSION"
+            else:
+                verdict = "same"
+
+            rows.append((name, metric, old, value, change, verdict))
+
+    return rows
+
+def main():
+    """
+    Runs the benchmarks from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the simple games.")
+    parser.add_argument("--output", "-o", help="file to write the results to, as JSON")
+    parser.add_argument("--baseline", "-b", help="results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1,
+            help="relative change reported as a regression (default: 0.1)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument("--quick", action="store_true", help="fewer games and smaller populations")
+    parser.add_argument("--verbose", "-v", action="store_true", help="print results as they are measured")
+    args = parser.parse_args()
+
+    current = run(args.seed, args.quick, args.verbose)
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(current, output, indent=2, sort_keys=True)
+    else:
+        print(json.dumps(current, indent=2, sort_keys=True))
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+
+        if baseline.get("format") != FORMAT_VERSION:
+            sys.exit("Baseline was written by a different version of the benchmarks")
+        if baseline.get("settings") != current["settings"]:
+            print("Warning: the baseline was run with different settings", file=sys.stderr)
+
+        rows = compare(baseline, current, args.threshold)
+        for name, metric, old, new, change, verdict in rows:
+            print("{:<55} {:<22} {:>14.4g} {:>14.4g} {:>+8.1%}  {}".format(
+                name, metric, old, new, change, verdict))
+
+        # Let scripts detect regressions from the exit status
+        if any(row[5] == "REGRESSION" for row in rows):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
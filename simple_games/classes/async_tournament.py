@@ -0,0 +1,87 @@
+##
+# This class conducts a tournament like `Tournament`, but plays its matches
+# concurrently on an event loop, so players that wait on something (such as
+# an `EngineStrategy` waiting on an external engine) don't hold up every other
+# match. At most `max_concurrency` games are played at once, and a player who
+# takes longer than `move_timeout` seconds over a move loses the game.
+#
+# Games interleave, so strategies that use the global random number
+# generator are not reproducible from the match seeds, unlike in `Tournament`.
+#
+# Date: 2026-10-18
+##
+
+import asyncio
+from . import tournament as t
+from . import referee as r
+from . import game as g
+from . import player as p
+from . import engine as e
+
+class AsyncTournament(t.Tournament):
+
+    def __init__(self, ruleset, min_games, fitness, max_concurrency = 100, move_timeout = None, seed = None, cache = None):
+        """
+        Constructs a new, empty tournament
+
+        Args:
+            ruleset : The ruleset of the game in the tournament
+            min_games : Minimal number of games each player must compete in during a tournament
+            fitness : Initial fitness needed for a player to survive
+            max_concurrency : (Optional) Maximum number of games played at once
+            move_timeout : (Optional) Number of seconds a player may take per move
+            seed : (Optional) Master seed that every match seed is drawn from
+            cache : (Optional) A `MatchCache` consulted before any match is played
+        """
+        super().__init__(ruleset, min_games, fitness, seed=seed, cache=cache)
+        self.max_concurrency = max_concurrency
+        self.move_timeout = move_timeout
+
+    def play_uncached(self, p1_pop, p2_pop, pairings):
+        """
+        Plays every pairing concurrently on the shared event loop.
+
+        Args:
+            p1_pop : Player 1 population
+            p2_pop : Player 2 population
+            pairings : A list of `(p1 index, p2 index, seed)` tuples
+
+        Return:
+            A list of booleans; True wherever Player 1 won the pairing
+        """
+        if not pairings:
+            return []
+
+        return e.run(self.play_async([player.strategy for player in p1_pop],
+                [player.strategy for player in p2_pop], pairings))
+
+    async def play_async(self, p1_strats, p2_strats, pairings):
+        """
+        Plays every pairing, at most `max_concurrency` at a time.
+
+        Args:
+            p1_strats : Strategies of the Player 1 population
+            p2_strats : Strategies of the Player 2 population
+            pairings : A list of `(p1 index, p2 index, seed)` tuples
+
+        Return:
+            A list of booleans; True wherever Player 1 won the pairing
+        """
+        # Every game in progress needs its own board; finished games hand theirs on
+        boards = []
+        limit = asyncio.Semaphore(self.max_concurrency)
+
+        async def play(i, j):
+            async with limit:
+                board = boards.pop() if boards else self.ruleset.create_board(record=False)
+                try:
+                    p1 = p.Player("Player 1", p1_strats[i])
+                    p2 = p.Player("Player 2", p2_strats[j])
+                    game = g.Game(r.Referee(board, self.ruleset), board, [p1, p2])
+                    await game.play_async(self.move_timeout)
+                finally:
+                    boards.append(board)
+
+                return p1.wins > 0
+
+        return await asyncio.gather(*(play(i, j) for i, j, _ in pairings))
@@ -7,21 +7,34 @@
 ##
 
 from copy import deepcopy
+from . import move_log as ml
 
 class Board:
 
-    def __init__(self, initial_state = None, bounds = None):
+    def __init__(self, initial_state = None, bounds = None, record = True, rules = None):
         """
         The board constructor initializes the game state and sets game bounds.
 
         Args:
             initial_state : The initial game state
             bounds : The bounds of the board, if applicable (size, minimum, etc.)
+            record : (Optional) Whether to keep a history of the moves made
+            rules : (Optional) The ruleset of the game, used to list legal moves
         """
         self.initial_state = initial_state
         self.state = initial_state
         self.bounds = bounds
         self.data = {}
+        self.log = ml.MoveLog(enabled=record)
+        self.rules = rules
+
+        # Legal moves in the current position, cached by `legal_moves()`
+        self.moves = None
+
+        # Zobrist key of the current position, kept up to date by the ruleset;
+        # None for boards whose ruleset does not compute keys
+        self.key = None
+        self.initial_key = None
 
     def reset(self):
         """
@@ -29,3 +42,33 @@ class Board:
         """
         self.state = deepcopy(self.initial_state)
         self.data = {}
+        self.log.clear()
+        self.moves = None
+        self.key = self.initial_key
+
+    def record(self, code):
+        """
+        Logs a move in the board's move history.
+        Players alternate turns, so the mover is known from the number of moves made.
+
+        Args:
+            code : The move, encoded as an integer by the ruleset
+        """
+        self.log.append(self.log.count % 2, code)
+
+        # The position is about to change
+        self.moves = None
+
+    def legal_moves(self):
+        """
+        Lists every legal move in the current position, as determined by the
+        board's ruleset. The list is computed once per position and shared by
+        everyone asking, so it must not be modified.
+
+        Return:
+            A list of legal moves, or None if the board has no ruleset
+        """
+        if self.rules is None:
+            return None
+
+        return self.rules.legal_moves(self)
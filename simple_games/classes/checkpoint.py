@@ -0,0 +1,368 @@
+##
+# Checkpoints of a genetic algorithm's progress, so that a long evolution can
+# be resumed after a crash.
+# A checkpoint holds both populations (genomes, wins, losses and generations),
+# the fitness threshold, the state of the random number generator and the
+# contents of the match cache. It is stored in a compact binary format: a
+# short header followed by a zlib-compressed body of typed arrays.
+#
+# Checkpoints are written to a temporary file that then replaces the previous
+# checkpoint, so a crash while writing never leaves a corrupt file behind.
+# A `Checkpointer` does the compression and writing on a background thread.
+#
+# Date: 2026-10-18
+##
+
+import os
+import struct
+import tempfile
+import zlib
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+# Identifies checkpoint files, followed by the version of the format
+MAGIC = b"GACKPT"
+VERSION = 1
+
+class Checkpointer:
+
+    def __init__(self, path):
+        """
+        Creates a background writer of checkpoints.
+
+        Args:
+            path : The file every checkpoint is written to
+        """
+        self.path = path
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.pending = None
+
+    def save(self, state):
+        """
+        Writes a checkpoint in the background.
+        Waits for the previous checkpoint first, so at most one is ever in flight.
+
+        Args:
+            state : The checkpoint, as built by `GeneticAlgorithm.snapshot()`;
+                    it must not be modified afterwards
+        """
+        self.wait()
+        self.pending = self.executor.submit(save, self.path, state)
+
+    def wait(self):
+        """
+        Waits for the checkpoint being written, if any.
+        Errors raised while writing it are raised here.
+        """
+        if self.pending is not None:
+            pending, self.pending = self.pending, None
+            pending.result()
+
+    def close(self):
+        """
+        Waits for the last checkpoint, then stops the background thread.
+        """
+        try:
+            self.wait()
+        finally:
+            self.executor.shutdown()
+
+def save(path, state):
+    """
+    Writes a checkpoint atomically.
+
+    Args:
+        path : The file to write to
+        state : The checkpoint, as built by `GeneticAlgorithm.snapshot()`
+    """
+    data = dumps(state)
+    directory = os.path.dirname(os.path.abspath(path))
+
+    handle, temp_path = tempfile.mkstemp(dir=directory, prefix=".checkpoint-")
+    try:
+        with os.fdopen(handle, "wb") as temp:
+            temp.write(data)
+            temp.flush()
+            os.fsync(temp.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+def load(path):
+    """
+    Reads a checkpoint.
+
+    Args:
+        path : The file to read from
+
+    Return:
+        The checkpoint, in the form built by `GeneticAlgorithm.snapshot()`
+    """
+    with open(path, "rb") as checkpoint:
+        return loads(checkpoint.read())
+
+def dumps(state):
+    """
+    Encodes a checkpoint in the binary checkpoint format.
+
+    Args:
+        state : The checkpoint, as built by `GeneticAlgorithm.snapshot()`
+
+    Return:
+        The checkpoint, as bytes
+    """
+    writer = Writer()
+    writer.pack("<Id", state["iteration"], state["fitness"])
+
+    # The state of a Mersenne Twister: a version, 625 integers and a cached Gaussian
+    version, internal, gauss = state["rng_state"]
+    writer.pack("<B", version)
+    writer.array(array("I", internal))
+    writer.pack("<?d", gauss is not None, gauss or 0.0)
+
+    writer.strings(state["traits"])
+    for pop in (state["p1"], state["p2"]):
+        write_population(writer, pop, len(state["traits"]))
+
+    cache = state["cache"]
+    writer.pack("<?", cache is not None)
+    if cache is not None:
+        writer.pack("<qqqq", cache["capacity"], cache["hits"], cache["misses"], cache["evictions"])
+        keys = cache["entries"]
+        writer.array(array("q", (key[0] for key, _ in keys)))
+        writer.array(array("q", (key[1] for key, _ in keys)))
+        writer.array(array("q", (key[2] for key, _ in keys)))
+        writer.array(array("b", (p1_won for _, p1_won in keys)))
+
+    return MAGIC + struct.pack("<H", VERSION) + zlib.compress(b"".join(writer.parts))
+
+def loads(data):
+    """
+    Decodes a checkpoint written by `dumps()`.
+
+    Args:
+        data : The checkpoint, as bytes
+
+    Return:
+        The checkpoint, in the form built by `GeneticAlgorithm.snapshot()`
+    """
+    if not data.startswith(MAGIC):
+        raise ValueError("Not a checkpoint file")
+
+    version, = struct.unpack_from("<H", data, len(MAGIC))
+    if version != VERSION:
+        raise ValueError("Unsupported checkpoint version: {}".format(version))
+
+    reader = Reader(zlib.decompress(data[len(MAGIC) + 2:]))
+    state = {}
+    state["iteration"], state["fitness"] = reader.unpack("<Id")
+
+    rng_version, = reader.unpack("<B")
+    internal = tuple(reader.array("I"))
+    has_gauss, gauss = reader.unpack("<?d")
+    state["rng_state"] = (rng_version, internal, gauss if has_gauss else None)
+
+    state["traits"] = reader.strings()
+    for pop_id in ("p1", "p2"):
+        state[pop_id] = read_population(reader, len(state["traits"]))
+
+    has_cache, = reader.unpack("<?")
+    state["cache"] = None
+    if has_cache:
+        capacity, hits, misses, evictions = reader.unpack("<qqqq")
+        keys = zip(reader.array("q"), reader.array("q"), reader.array("q"))
+        outcomes = reader.array("b")
+        state["cache"] = {
+            "capacity": capacity,
+            "hits": hits,
+            "misses": misses,
+            "evictions": evictions,
+            "entries": [(key, bool(p1_won)) for key, p1_won in zip(keys, outcomes)],
+            }
+
+    return state
+
+def dumps_population(traits, pop):
+    """
+    Encodes a single population, uncompressed.
+    Used to send players between processes without pickling them.
+
+    Args:
+        traits : The names of the traits in every genome
+        pop : The population, as built by `GeneticAlgorithm.population_state()`
+
+    Return:
+        The population, as bytes
+    """
+    writer = Writer()
+    writer.strings(traits)
+    write_population(writer, pop, len(traits))
+
+    return b"".join(writer.parts)
+
+def loads_population(data):
+    """
+    Decodes a population encoded by `dumps_population()`.
+
+    Args:
+        data : The population, as bytes
+
+    Return:
+        A tuple of the trait names and the population
+    """
+    reader = Reader(data)
+    traits = reader.strings()
+
+    return traits, read_population(reader, len(traits))
+
+def write_population(writer, pop, num_traits):
+    """
+    Encodes a population's players as parallel arrays.
+
+    Args:
+        writer : The `Writer` to encode into
+        pop : The population, as built by `GeneticAlgorithm.population_state()`
+        num_traits : The number of traits in every genome
+    """
+    writer.strings(pop["names"])
+    writer.strings(pop["strategy_names"])
+    writer.array(array("I", pop["generations"]))
+    writer.array(array("q", pop["wins"]))
+    writer.array(array("q", pop["losses"]))
+
+    # Each trait is stored as the lengths of every player's genes, then all the genes
+    for trait in range(num_traits):
+        genes = [genome[trait] for genome in pop["genomes"]]
+        writer.array(array("I", (len(gene) for gene in genes)))
+        writer.array(array("q", (value for gene in genes for value in gene)))
+
+def read_population(reader, num_traits):
+    """
+    Decodes a population encoded by `write_population()`.
+
+    Args:
+        reader : The `Reader` to decode from
+        num_traits : The number of traits in every genome
+
+    Return:
+        The population, in the form built by `GeneticAlgorithm.population_state()`
+    """
+    pop = {}
+    pop["names"] = reader.strings()
+    pop["strategy_names"] = reader.strings()
+    pop["generations"] = reader.array("I")
+    pop["wins"] = reader.array("q")
+    pop["losses"] = reader.array("q")
+
+    traits = []
+    for _ in range(num_traits):
+        lengths = reader.array("I")
+        flat = reader.array("q")
+        genes = []
+        start = 0
+        for length in lengths:
+            genes.append(flat[start:start + length])
+            start += length
+        traits.append(genes)
+    pop["genomes"] = list(zip(*traits)) if traits else [() for _ in pop["names"]]
+
+    return pop
+
+class Writer:
+
+    def __init__(self):
+        """
+        Creates an empty buffer of encoded fields.
+        """
+        self.parts = []
+
+    def pack(self, fmt, *values):
+        """
+        Appends fixed-size fields.
+
+        Args:
+            fmt : The `struct` format of the fields
+            values : The values of the fields
+        """
+        self.parts.append(struct.pack(fmt, *values))
+
+    def array(self, values):
+        """
+        Appends a typed array, preceded by its length.
+
+        Args:
+            values : The array to append
+        """
+        self.parts.append(struct.pack("<Q", len(values)))
+        self.parts.append(values.tobytes())
+
+    def strings(self, values):
+        """
+        Appends a list of strings, as their lengths followed by their UTF-8 encodings.
+
+        Args:
+            values : The strings to append
+        """
+        encoded = [value.encode("utf-8") for value in values]
+        self.array(array("I", (len(value) for value in encoded)))
+        self.parts.append(b"".join(encoded))
+
+class Reader:
+
+    def __init__(self, data):
+        """
+        Creates a reader of fields encoded by a `Writer`.
+
+        Args:
+            data : The encoded fields
+        """
+        self.data = data
+        self.offset = 0
+
+    def unpack(self, fmt):
+        """
+        Reads fixed-size fields.
+
+        Args:
+            fmt : The `struct` format of the fields
+
+        Return:
+            A tuple of the values of the fields
+        """
+        values = struct.unpack_from(fmt, self.data, self.offset)
+        self.offset += struct.calcsize(fmt)
+
+        return values
+
+    def array(self, typecode):
+        """
+        Reads a typed array.
+
+        Args:
+            typecode : The type code of the array
+
+        Return:
+            The array
+        """
+        length, = self.unpack("<Q")
+        values = array(typecode)
+        end = self.offset + length * values.itemsize
+        values.frombytes(self.data[self.offset:end])
+        self.offset = end
+
+        return values
+
+    def strings(self):
+        """
+        Reads a list of strings.
+
+        Return:
+            The strings
+        """
+        strings = []
+        for length in self.array("I"):
+            strings.append(self.data[self.offset:self.offset + length].decode("utf-8"))
+            self.offset += length
+
+        return strings
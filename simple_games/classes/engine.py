@@ -0,0 +1,231 @@
+##
+# External engines: programs that play a game in a separate process, speaking
+# a line-based protocol over their standard input and output.
+#
+# For every move, the engine is sent one line:
+#
+#   move {"state": <board state>, "bounds": <board bounds>, "player": <0 or 1>}
+#
+# and answers with a line holding its move as JSON, such as `2` in Toothpick
+# Takeaway or `{"vertex": 3, "color": 1}` in graph coloring. An answer that is
+# not valid JSON counts as an illegal move. The engine is sent `quit` when it
+# is no longer needed.
+#
+# Starting a process is slow, so engines are kept in an `EnginePool` and reused
+# from game to game. All engines run on one shared background event loop.
+#
+# Date: 2026-10-18
+##
+
+import asyncio
+import json
+import threading
+
+class Engine:
+
+    def __init__(self, command):
+        """
+        Creates a handle to an engine process; the process is started by `start()`.
+
+        Args:
+            command : The program and arguments that start the engine
+        """
+        self.command = list(command)
+        self.process = None
+
+    async def start(self):
+        """
+        Starts the engine process.
+        """
+        self.process = await asyncio.create_subprocess_exec(*self.command,
+                stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE)
+
+    async def request(self, line):
+        """
+        Sends a line to the engine and waits for its answer.
+
+        Args:
+            line : The line to send, without a newline
+
+        Return:
+            The engine's answer, without the newline
+
+        Raises:
+            EOFError : If the engine exited
+        """
+        self.process.stdin.write(line.encode() + b"\n")
+        await self.process.stdin.drain()
+
+        answer = await self.process.stdout.readline()
+        if not answer:
+            raise EOFError("Engine {} exited".format(self.command))
+
+        return answer.decode().strip()
+
+    async def move(self, board, player_index):
+        """
+        Asks the engine for a move.
+
+        Args:
+            board : The board being played on
+            player_index : Index of the player to move; 0 or 1
+
+        Return:
+            The engine's move, or None if its answer is not valid JSON
+        """
+        position = {"state": board.state, "bounds": board.bounds, "player": player_index}
+        answer = await self.request("move " + json.dumps(position, separators=(",", ":")))
+
+        try:
+            return json.loads(answer)
+        except ValueError:
+            return None
+
+    async def close(self):
+        """
+        Asks the engine to quit, killing it if it does not exit promptly.
+        """
+        if self.process is None or self.process.returncode is not None:
+            return
+
+        try:
+            self.process.stdin.write(b"quit\n")
+            await self.process.stdin.drain()
+            self.process.stdin.close()
+            await asyncio.wait_for(self.process.wait(), 1.0)
+        except (asyncio.TimeoutError, ConnectionError):
+            self.kill()
+            await self.process.wait()
+
+    def kill(self):
+        """
+        Kills the engine process immediately.
+        """
+        if self.process is not None and self.process.returncode is None:
+            self.process.kill()
+
+class EnginePool:
+
+    def __init__(self, command, size = 8):
+        """
+        Creates a pool of engine processes, started as they are needed.
+
+        Args:
+            command : The program and arguments that start an engine
+            size : (Optional) Maximum number of engine processes running at once
+        """
+        self.command = list(command)
+        self.size = size
+        self.idle = []
+        self.running = 0
+        self.available = None
+
+    async def acquire(self):
+        """
+        Takes an idle engine from the pool, starting one if the pool is not
+        full, or else waiting for one to be released.
+
+        Return:
+            An engine
+        """
+        if self.available is None:
+            self.available = asyncio.Semaphore(self.size)
+
+        await self.available.acquire()
+        if self.idle:
+            return self.idle.pop()
+
+        engine = Engine(self.command)
+        try:
+            await engine.start()
+        except BaseException:
+            self.available.release()
+            raise
+        self.running += 1
+
+        return engine
+
+    def release(self, engine, healthy = True):
+        """
+        Returns an engine to the pool.
+        Engines that timed out or failed may still answer an old request, so
+        they are killed rather than reused.
+
+        Args:
+            engine : The engine to return
+            healthy : (Optional) Whether the engine can be reused
+        """
+        if healthy and engine.process.returncode is None:
+            self.idle.append(engine)
+        else:
+            engine.kill()
+            self.running -= 1
+
+        self.available.release()
+
+    async def move(self, board, player_index):
+        """
+        Asks any engine in the pool for a move.
+
+        Args:
+            board : The board being played on
+            player_index : Index of the player to move; 0 or 1
+
+        Return:
+            The engine's move, or None if its answer is not valid JSON
+        """
+        engine = await self.acquire()
+        try:
+            move = await engine.move(board, player_index)
+        except BaseException:
+            # Includes being cancelled by a move timeout
+            self.release(engine, healthy=False)
+            raise
+
+        self.release(engine)
+
+        return move
+
+    async def close(self):
+        """
+        Stops every idle engine.
+        """
+        idle, self.idle = self.idle, []
+        self.running -= len(idle)
+        await asyncio.gather(*(engine.close() for engine in idle))
+
+# The event loop shared by every engine and asynchronous tournament
+_loop = None
+_loop_lock = threading.Lock()
+
+def event_loop():
+    """
+    Gets the shared event loop, starting it on a background thread the first time.
+    Engines are tied to the loop that started them, so sharing one loop lets
+    pools outlive any single tournament.
+
+    Return:
+        The running event loop
+    """
+    global _loop
+
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="engine-loop", daemon=True).start()
+
+    return _loop
+
+def run(coroutine):
+    """
+    Runs a coroutine on the shared event loop and waits for its result.
+    Safe to call from anywhere but the shared loop itself, including notebooks
+    whose own event loop is running.
+
+    Args:
+        coroutine : The coroutine to run
+
+    Return:
+        The coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coroutine, event_loop()).result()
@@ -0,0 +1,48 @@
+##
+# A strategy that asks an external engine for its moves, through a pool of
+# engine processes (see `engine.py`). Any number of games can wait on the
+# engines at once, so it is best played with an `AsyncTournament`.
+#
+# Date: 2026-10-18
+##
+
+from .strategy_interface import StrategyInterface
+from . import engine as e
+
+class EngineStrategy(StrategyInterface):
+
+    def __init__(self, name, pool):
+        """
+        Strategy constructor.
+
+        Args:
+            name : The name of the strategy
+            pool : The `EnginePool` to ask for moves
+        """
+        super().__init__(name)
+        self.pool = pool
+
+    async def move_async(self, board):
+        """
+        Asks an engine for a move without blocking other games.
+
+        Args:
+            board : The board being played on
+
+        Return:
+            A proposed move.
+        """
+        # Players alternate turns, so the mover is known from the number of moves made
+        return await self.pool.move(board, board.log.count % 2)
+
+    def move(self, board):
+        """
+        Asks an engine for a move, waiting for its answer.
+
+        Args:
+            board : The board being played on
+
+        Return:
+            A proposed move.
+        """
+        return e.run(self.move_async(board))
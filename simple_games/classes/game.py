@@ -6,9 +6,11 @@
 #
 # Date: 2021-02-06
 ##
+from types import SimpleNamespace
+
 class Game:
 
-    def __init__(self, referee, board, players):
+    def __init__(self, referee, board, players, profiler = None):
         """
         Creates a new game with the given referee, board, and players.
 
@@ -16,15 +18,17 @@ class Game:
             referee : The current game referee
             board : The game board
             players : A list of two players
+            profiler : (Optional) A `Profiler` to time each phase of play with
         """
         self.referee = referee
         self.board = board
         self.players = players
+        self.profiler = profiler
 
     def play(self, narrated = False):
         """
         Plays a game on the current board, moderated by the referee, with the
-        two players provided.
+        two players provided. If the game has a profiler, every phase is timed.
 
         Args:
             narrated : Whether to enable debug-friendly narration in the game
@@ -32,20 +36,108 @@ class Game:
         Return:
             The game board being played on
         """
+        referee = self.referee
+        board = self.board
+        profiler = self.profiler
+
+        if profiler is None:
+            ask_for_move = referee.ask_for_move
+        else:
+            game_start = profiler.clock()
+            ask_for_move = lambda player, board: referee.ask_for_move_profiled(player, board, profiler)
+
+        turns = self.turns(narrated)
+        try:
+            player = next(turns)
+            while True:
+                player = turns.send(ask_for_move(player, board))
+        except StopIteration:
+            pass
+
+        if profiler is not None:
+            profiler.add_game(profiler.clock() - game_start)
+
+        return board
+
+    async def play_async(self, timeout = None):
+        """
+        Plays a game like `play()`, awaiting each player's move so that many
+        games can be played at once, such as against external engines.
+        Awaited moves take as long as the other games let them, so these games
+        are never profiled.
+
+        Args:
+            timeout : (Optional) Number of seconds each player may take per move;
+                      a player who runs out of time loses, as for an illegal move
+
+        Return:
+            The game board being played on
+        """
+        board = self.board
+
+        turns = self.turns(profiled=False)
+        try:
+            player = next(turns)
+            while True:
+                player = turns.send(await self.referee.ask_for_move_async(player, board, timeout))
+        except StopIteration:
+            pass
+
+        return board
+
+    def turns(self, narrated = False, profiled = True):
+        """
+        Runs the game loop shared by `play()` and `play_async()`.
+        The loop yields the player whose turn it is, and is sent back their
+        move, or None if the move failed. Every phase but asking for the move
+        is timed by the game's profiler, if it has one.
+
+        Args:
+            narrated : (Optional) Whether to enable debug-friendly narration in the game
+            profiled : (Optional) Whether to use the game's profiler
+
+        Return:
+            A generator of the players to move
+        """
+        referee = self.referee
+        board = self.board
+        players = self.players
+
+        reset = board.reset
+        is_game_over = referee.is_game_over
+        update_board = referee.update_board
+        declare_winner = referee.declare_winner
+
+        # Players are told of the game through their hooks
+        hooks = players
+
+        # Timing wraps each phase, leaving the loop itself the same
+        profiler = self.profiler if profiled else None
+        if profiler is not None:
+            rules = referee.rules
+            reset = profiler.timed(rules, "reset", reset)
+            is_game_over = profiler.timed(rules, "is_game_over", is_game_over)
+            update_board = profiler.timed(rules, "update_board", update_board)
+            declare_winner = profiler.timed(rules, "declare_winner", declare_winner)
+            hooks = [SimpleNamespace(**{name: profiler.timed(each.strategy, "hooks", getattr(each, name))
+                    for name in ("on_game_start", "on_move", "on_game_end")}) for each in players]
 
         # Reset the board for additional playthroughs
-        self.board.reset()
+        reset()
 
         # Keep a turn counter for assigning current player
         turn = 0
-        player = self.players[turn]
-        opponent = self.players[turn + 1]
+        player = players[turn]
+        opponent = players[turn + 1]
+
+        for hook in hooks:
+            hook.on_game_start(board)
 
         winner = None
-        while not self.referee.is_game_over(self.board):
+        while not is_game_over(board):
 
             # Request a move from the current player
-            move = self.referee.ask_for_move(player, self.board)
+            move = yield player
 
             if narrated:
                 print("{} -> {}".format(player.name, move))
@@ -57,20 +149,24 @@ class Game:
                 break
 
             # Tell the referee to update the board with the (valid) move
-            else:
-                self.referee.update_board(self.board, player, move)
+            update_board(board, player, move)
+
+            # Both players learn of the move
+            for hook in hooks:
+                hook.on_move(board, move)
 
             # Next turn
-            opponent = self.players[turn]
+            opponent = players[turn]
             turn = (turn + 1) % 2
-            player = self.players[turn]
+            player = players[turn]
 
         # Declare a winner using the game's rules and board
         # If either player made an illegal move, the winner has already been
         # decided and this function just updates the board's history
-        winner = self.referee.declare_winner(self.board, self.players, winner)
+        winner = declare_winner(board, players, winner)
+
+        for each, hook in zip(players, hooks):
+            hook.on_game_end(board, each is winner)
 
         if narrated:
             print("Winner: " + str(winner.name))
-
-        return self.board
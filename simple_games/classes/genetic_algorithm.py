@@ -8,18 +8,24 @@
 # Date: 2021-03-20
 ##
 
+import random as rand
 from random import sample, random, randrange
-from copy import deepcopy
+from copy import copy
 from . import tournament as t
 from . import player as p
+from . import genome as g
+from . import match_cache as mc
+from . import checkpoint as ck
+from . import population as pl
 
+import numpy as np
 import pandas as pd
 
 COLUMNS = ["Name", "Gen", "Vertices", "Colors", "Fitness", "Wins", "Losses"]
 
 class GeneticAlgorithm:
 
-    def __init__(self, ruleset, random_on_init_strat, strat_data, pop_size = 1000, iterations = 100, num_games = 10, fitness = 0.5, max_fitness = 0.9, fitness_increment = 0.025, mutation_rate = 0.025):
+    def __init__(self, ruleset, random_on_init_strat, strat_data, pop_size = 1000, iterations = 100, num_games = 10, fitness = 0.5, max_fitness = 0.9, fitness_increment = 0.025, mutation_rate = 0.025, workers = 1, engine = None, cache_size = 0, profiler = None, round_robin = False, block_size = None):
         """
         Creates a new Evolution object.
 
@@ -34,6 +40,12 @@ class GeneticAlgorithm:
             max_fitness : (Optional) Maximum fitness required for survival
             fitness_increment : (Optional) How much to increment the fitness after each iteration
             mutation_rate : (Optional) Chance that a mutation will occur during reproduction
+            workers : (Optional) Number of processes each tournament plays its matches on
+            engine : (Optional) A batch engine each tournament plays its matches through, such as `GCBatchEngine`
+            cache_size : (Optional) Number of match outcomes to remember across generations; 0 disables the cache
+            profiler : (Optional) A `Profiler` timing the games of every tournament played in this process
+            round_robin : (Optional) Whether tournaments play every pairing once into an outcome matrix
+            block_size : (Optional) With `round_robin`, pairs random blocks of this many players instead
         """
         self.ruleset = ruleset
         self.random_on_init_strat = random_on_init_strat
@@ -45,6 +57,20 @@ class GeneticAlgorithm:
         self.max_fitness = max_fitness
         self.fitness_increment = fitness_increment
         self.mutation_rate = mutation_rate
+        self.workers = workers
+        self.engine = engine
+        self.cache = mc.MatchCache(cache_size) if cache_size else None
+        self.profiler = profiler
+        self.round_robin = round_robin
+        self.block_size = block_size
+
+        # Outcome matrix of the last round-robin tournament
+        self.outcomes = None
+
+        # Progress of the current evolution
+        self.iteration = 0
+        self.p1_pop = []
+        self.p2_pop = []
 
 
 
@@ -59,10 +85,11 @@ class GeneticAlgorithm:
             player_to_gen : 1 or 2, depending on what population we are generating
 
         Return:
-            A list of players with random strategies
+            A `Population` of players with random strategies
         """
-        # A list to hold the strategies
+        # A list to hold the strategies, and a set of their genomes for uniqueness checks
         strategies = []
+        genomes = set()
         generated = 0
         failures = 0
         max_attempts = 10 * pop_size
@@ -71,10 +98,13 @@ class GeneticAlgorithm:
 
             # Generate a random strategy 
             strat = self.random_on_init_strat("Basic Data Strategy", self.strat_data)
+            genome = g.Genome.from_data(strat.data)
 
             # Only append unique strategies
-            if strat not in strategies:
+            if genome not in genomes:
+                strat.set_data(genome)
                 strategies.append(strat)
+                genomes.add(genome)
                 generated += 1
             else:
                 failures += 1
@@ -84,15 +114,13 @@ class GeneticAlgorithm:
                 print("Error: Failed to create unique players {} times. Aborting".format(failures))
                 break
 
-        # A list to hold the players
-        players = []
+        # Every strategy is copied from the first, so no further random numbers are drawn
+        template = strategies[0] if strategies else self.random_on_init_strat("Basic Data Strategy", self.strat_data)
+        players = pl.Population(template, capacity=len(strategies))
         # Generate a new player for every strategy
         for strat in strategies:
-            player = p.Player("Player {}".format(player_to_gen), strat)
-
             # Strategies are unique, so we don't need to check player uniqueness
-            players.append(player)
-            generated += 1
+            players.add("Player {}".format(player_to_gen), strat.name, strat.data.values())
 
         return players
 
@@ -111,9 +139,9 @@ class GeneticAlgorithm:
             A new `Player` with traits from both parents
         """
         # Get all the data 
-        traits = parent1.strategy.data.keys()
+        traits = tuple(parent1.strategy.data.keys())
 
-        child_traits = {}
+        child_traits = []
         for trait in traits:
             # Obtain the current trait from both parents
             p1_trait = parent1.strategy.data[trait]
@@ -123,10 +151,11 @@ class GeneticAlgorithm:
             crossover = randrange(0, len(p1_trait))
 
             # Choose up to the crossover from parent 1
-            p1_inherit = p1_trait[:crossover]
+            p1_inherit = list(p1_trait[:crossover])
+            inherited = set(p1_inherit)
 
             # Choose the rest of the genes from parent 2
-            p2_inherit = [gene for gene in p2_trait if gene not in p1_inherit]
+            p2_inherit = [gene for gene in p2_trait if gene not in inherited]
 
             # Assemble child's trait
             child_trait = p1_inherit + p2_inherit
@@ -137,18 +166,60 @@ class GeneticAlgorithm:
                 child_trait[index1], child_trait[index2] = child_trait[index2], child_trait[index1]
 
             # Construct the child's traits
-            child_traits[trait] = child_trait
+            child_traits.append(child_trait)
 
-        child_strat = deepcopy(parent1.strategy)
+        # Genomes are immutable, so the child can share everything else with its parent
+        child_strat = copy(parent1.strategy)
         child_strat.set_name(child_strat_name)
-        child_strat.set_data(child_traits)
+        child_strat.set_data(g.Genome(traits, child_traits))
 
         child = p.Player(child_name, child_strat)
         child.generation = max(parent1.generation, parent2.generation) + 1
 
         return child
 
-    def evolve(self, verbose = False, to_df = False):
+    def breed(self, pop, parents, child_name, first_strat_num = 1, rng = None):
+        """
+        Breeds a whole cohort of children at once, like `spawn()` does one child.
+        Crossover and mutation are applied to every child with array operations
+        on the population's gene matrices, so no strategies are built.
+
+        Args:
+            pop : The `Population` holding the parents
+            parents : An array of `(parent 1 index, parent 2 index)` pairs, one per child
+            child_name : The name of every child
+            first_strat_num : (Optional) Number of the first child's strategy; the rest are numbered in order
+            rng : (Optional) NumPy random number generator; seeded from `random` if omitted
+
+        Return:
+            A `Population` of the children
+        """
+        if rng is None:
+            rng = np.random.default_rng(rand.randrange(2 ** 32))
+
+        parents = np.asarray(parents, dtype=np.int64).reshape(-1, 2)
+        first, second = parents[:, 0], parents[:, 1]
+        num_children = len(parents)
+
+        genomes = []
+        for matrix in pop.genes:
+            length = matrix.shape[1]
+
+            # Randomly generated crossover points, one per child
+            points = rng.integers(0, max(length, 1), num_children)
+            children = order_crossover(matrix[first], matrix[second], points)
+            swap_mutation(children, self.mutation_rate, rng)
+
+            genomes.append(children)
+
+        children = pop.empty(num_children)
+        children.add_many([child_name] * num_children,
+                ["Evolved Strategy #{}".format(first_strat_num + k) for k in range(num_children)],
+                genomes, np.maximum(pop.generations[first], pop.generations[second]) + 1)
+
+        return children
+
+    def evolve(self, verbose = False, to_df = False, checkpoint = None, checkpoint_every = 1):
         """
         Generates random populations of players and evolves them across a specified
         number of generations.
@@ -158,53 +229,245 @@ class GeneticAlgorithm:
         Args:
             verbose : (Optional) Whether to print debug information
             to_df : (Optional) Whether to return players in a DataFrame
+            checkpoint : (Optional) File to save checkpoints to, for `resume()`
+            checkpoint_every : (Optional) Number of generations between checkpoints
 
         Return:
             Two lists, containing the elite P1 and P2 populations, respectively
         """
-        # Create populations of players with random strategies
-        p1_pop = self.generate_population(self.pop_size, 1)
-        p2_pop = self.generate_population(self.pop_size, 2)
+        for _ in self.generations(verbose, checkpoint=checkpoint, checkpoint_every=checkpoint_every):
+            pass
+
+        return self.results(to_df)
+
+    def resume(self, path, verbose = False, to_df = False, checkpoint_every = 1):
+        """
+        Resumes an evolution from a checkpoint saved by `evolve()`.
+        The genetic algorithm must be constructed with the same parameters as
+        the interrupted one; the remaining generations then play out exactly as
+        they would have without the interruption. Checkpoints keep being saved to the same file.
+
+        Args:
+            path : The checkpoint file
+            verbose : (Optional) Whether to print debug information
+            to_df : (Optional) Whether to return players in a DataFrame
+            checkpoint_every : (Optional) Number of generations between checkpoints
+
+        Return:
+            Two lists, containing the elite P1 and P2 populations, respectively
+        """
+        self.restore(ck.load(path))
+
+        for _ in self.generations(verbose, checkpoint=path, checkpoint_every=checkpoint_every, resume=True):
+            pass
+
+        return self.results(to_df)
+
+    def results(self, to_df = False):
+        """
+        Gets the populations left by the last evolution.
+
+        Args:
+            to_df : (Optional) Whether to return players in a DataFrame
+
+        Return:
+            The P1 and P2 populations, as lists or DataFrames
+        """
+        # Return the elite players
+        if to_df:
+            return to_df_sorted(self.p1_pop), to_df_sorted(self.p2_pop)
+        else:
+            return self.p1_pop, self.p2_pop
+
+    def generations(self, verbose = False, num_elite = 10, checkpoint = None, checkpoint_every = 1, resume = False):
+        """
+        Evolves the populations like `evolve()`, one generation at a time.
+        After each tournament, a summary of the surviving populations is
+        yielded, so long runs can be monitored or logged without keeping every
+        generation in memory. Once exhausted, the final populations are held in
+        `p1_pop` and `p2_pop`.
+
+        Args:
+            verbose : (Optional) Whether to print debug information
+            num_elite : (Optional) Number of elite genomes to include in each summary
+            checkpoint : (Optional) File to save checkpoints to, in the background
+            checkpoint_every : (Optional) Number of generations between checkpoints
+            resume : (Optional) Whether to continue from the state loaded by `restore()`
 
-        for i in range(self.iterations):
+        Return:
+            A generator of dictionaries, one per generation, holding the
+            generation number, the fitness needed to survive, and a summary of
+            both populations (see `summarize()`)
+        """
+        if not resume:
+            # Create populations of players with random strategies
+            self.p1_pop = self.generate_population(self.pop_size, 1)
+            self.p2_pop = self.generate_population(self.pop_size, 2)
+            self.iteration = 0
+
+        checkpointer = ck.Checkpointer(checkpoint) if checkpoint else None
+        try:
+            yield from self.iterate(verbose, num_elite, checkpointer, checkpoint_every)
+        finally:
+            if checkpointer is not None:
+                checkpointer.close()
+
+    def iterate(self, verbose, num_elite, checkpointer, checkpoint_every):
+        """
+        Runs the remaining generations of an evolution; see `generations()`.
+
+        Args:
+            verbose : Whether to print debug information
+            num_elite : Number of elite genomes to include in each summary
+            checkpointer : A `Checkpointer` to save checkpoints with, or None
+            checkpoint_every : Number of generations between checkpoints
+
+        Return:
+            A generator of per-generation summaries
+        """
+        for i in range(self.iteration, self.iterations):
             # Create a new tournament for each iteration
-            tournament = t.Tournament(self.ruleset, self.num_games, self.fitness)
+            tournament = t.Tournament(self.ruleset, self.num_games, self.fitness, self.workers,
+                    engine=self.engine, cache=self.cache, profiler=self.profiler,
+                    round_robin=self.round_robin, block_size=self.block_size)
 
             # Compete both populations against each other
-            p1_pop, p2_pop = tournament.compete(p1_pop, p2_pop)
+            self.p1_pop, self.p2_pop = tournament.compete(self.p1_pop, self.p2_pop)
+            self.outcomes = tournament.outcomes
 
             if verbose:
                 print("\nITERATION: {}, FITNESS: {}".format(i, round(self.fitness, 4)))
-                print("\tP1 Pop: " + str(len(p1_pop)))
-                print("\tP2 Pop: " + str(len(p2_pop)))
+                print("\tP1 Pop: " + str(len(self.p1_pop)))
+                print("\tP2 Pop: " + str(len(self.p2_pop)))
+
+                if self.cache is not None:
+                    print("\tCache: {hits} hits, {misses} misses, {hit_rate:.1%} hit rate".format(**self.cache.stats()))
+
+            summary = {
+                "generation": i,
+                "fitness": self.fitness,
+                "p1": summarize(self.p1_pop, num_elite),
+                "p2": summarize(self.p2_pop, num_elite),
+                }
 
             # Repopulate p1_pop
-            self.repopulate(p1_pop, 1, i, verbose)
-            self.repopulate(p2_pop, 2, i, verbose)
+            self.repopulate(self.p1_pop, 1, i, verbose)
+            self.repopulate(self.p2_pop, 2, i, verbose)
 
             # Never increase fitness beyond 90%
             if self.fitness < self.max_fitness:
                 self.fitness += self.fitness_increment
 
-        # Return the elite players
-        if to_df:
+            self.iteration = i + 1
+            if checkpointer is not None and (self.iteration % checkpoint_every == 0
+                    or self.iteration == self.iterations):
+                checkpointer.save(self.snapshot())
 
-            # Format lists into DataFrames
-            p1_df = pd.DataFrame(columns=COLUMNS)
-            for p1 in p1_pop:
-                p1_df = update_df(p1_df, p1)
+            yield summary
 
-            p2_df = pd.DataFrame(columns=COLUMNS)
-            for p2 in p2_pop:
-                p2_df = update_df(p2_df, p2)
+    def snapshot(self):
+        """
+        Captures everything needed to resume the evolution after the current generation.
 
-            # Sort the values
-            p1_df.sort_values(by=["Fitness", "Wins"], ascending=False, inplace=True)
-            p2_df.sort_values(by=["Fitness", "Wins"], ascending=False, inplace=True)
+        Return:
+            A checkpoint, as a dictionary
+        """
+        traits = tuple(self.strat_data.keys())
+
+        cache = None
+        if self.cache is not None:
+            cache = dict(self.cache.stats(), capacity=self.cache.capacity,
+                    entries=list(self.cache.entries.items()))
+
+        return {
+            "iteration": self.iteration,
+            "fitness": self.fitness,
+            "rng_state": rand.getstate(),
+            "traits": traits,
+            "p1": self.population_state(self.p1_pop),
+            "p2": self.population_state(self.p2_pop),
+            "cache": cache,
+            }
+
+    def restore(self, state):
+        """
+        Restores the evolution captured by `snapshot()`.
 
-            return p1_df, p2_df
-        else:
-            return p1_pop, p2_pop
+        Args:
+            state : The checkpoint, as a dictionary
+        """
+        # Restored before the random state, since creating strategies draws random numbers
+        self.p1_pop = self.restore_population(state["traits"], state["p1"])
+        self.p2_pop = self.restore_population(state["traits"], state["p2"])
+        self.iteration = state["iteration"]
+        self.fitness = state["fitness"]
+
+        cache = state["cache"]
+        if cache is not None:
+            self.cache = mc.MatchCache(cache["capacity"])
+            self.cache.entries.update(cache["entries"])
+            self.cache.hits = cache["hits"]
+            self.cache.misses = cache["misses"]
+            self.cache.evictions = cache["evictions"]
+
+        rand.setstate(state["rng_state"])
+
+    def population_state(self, pop):
+        """
+        Captures the players of a population as parallel lists.
+
+        Args:
+            pop : The population to capture
+
+        Return:
+            A dictionary of the players' names, strategy names, generations,
+            wins, losses and genomes; each genome is a tuple of its traits
+        """
+        traits = tuple(self.strat_data.keys())
+
+        if isinstance(pop, pl.Population):
+            # Converted to lists, as the population's arrays change in place while a checkpoint is written
+            return {
+                "names": list(pop.names),
+                "strategy_names": list(pop.strategy_names),
+                "generations": pop.generations[:len(pop)].tolist(),
+                "wins": pop.wins[:len(pop)].tolist(),
+                "losses": pop.losses[:len(pop)].tolist(),
+                "genomes": (list(zip(*(pop.matrix(trait).tolist() for trait in traits))) if traits
+                        else [() for _ in range(len(pop))]),
+                }
+
+        return {
+            "names": [player.name for player in pop],
+            "strategy_names": [player.strategy.name for player in pop],
+            "generations": [player.generation for player in pop],
+            "wins": [player.wins for player in pop],
+            "losses": [player.losses for player in pop],
+            # Genomes are immutable, so they are shared rather than copied
+            "genomes": [tuple(player.strategy.data[trait] for trait in traits) for player in pop],
+            }
+
+    def restore_population(self, traits, pop_state):
+        """
+        Rebuilds the players captured by `population_state()`.
+        Draws random numbers, as it creates a strategy to copy from.
+
+        Args:
+            traits : The names of the traits in every genome
+            pop_state : The captured population
+
+        Return:
+            A `Population` of players
+        """
+        template = self.random_on_init_strat("Basic Data Strategy", self.strat_data)
+
+        pop = pl.Population(template, traits, len(pop_state["names"]))
+        for name, strat_name, generation, wins, losses, genome in zip(pop_state["names"],
+                pop_state["strategy_names"], pop_state["generations"], pop_state["wins"],
+                pop_state["losses"], pop_state["genomes"]):
+            pop.add(name, strat_name, genome, generation, wins, losses)
+
+        return pop
 
     def repopulate(self, pop, pop_id, iteration, verbose = False):
         """
@@ -216,42 +479,176 @@ class GeneticAlgorithm:
             iteration: The iteration of the players being generated
             verbose : (Optional) Whether to print debug information
         """
-        # Keep track of number of strategies
-        strat_counter = 0
-
-        while len(pop) < self.pop_size:
-            strat_counter += 1
-
+        if len(pop) < self.pop_size:
             # If the population is too low, repopulate randomly
             if len(pop) < 2:
                 if verbose:
                     print("WARNING: Player {} population too low! Repopulating randomly".format(pop_id))
                 pop += self.generate_population(self.pop_size // 2, pop_id)
 
-            # Get two random parents
-            parent1, parent2 = sample(pop, 2)
-
-            # Name the child and its strategy
-            child_name = "Player {}".format(pop_id)
-            child_strat_name = "Evolved Strategy #{}".format(strat_counter)
-
-            # Create the child
-            child = self.spawn(parent1, parent2, child_name, child_strat_name)
+            # Every child gets two distinct random parents from the survivors
+            rng = np.random.default_rng(rand.randrange(2 ** 32))
+            num_children = self.pop_size - len(pop)
+            parent1 = rng.integers(0, len(pop), num_children)
+            parent2 = (parent1 + rng.integers(1, len(pop), num_children)) % len(pop)
 
-            # Add the new child to the population
-            pop.append(child)
+            pop += self.breed(pop, np.stack((parent1, parent2), axis=1), "Player {}".format(pop_id), rng=rng)
 
         pop.sort(reverse=True)
 
-def update_df(df, player):
-    new_row = {
-        "Name": player.name,
-        "Gen": player.generation,
-        "Vertices": player.strategy.data["vertices"],
-        "Colors": player.strategy.data["colors"],
-        "Fitness": player.fitness(),
-        "Wins": player.wins,
-        "Losses": player.losses,
+def order_crossover(p1_genes, p2_genes, points):
+    """
+    Crosses over pairs of gene orderings: each child takes its first parent's
+    genes up to its crossover point, then the rest of the genes in the order
+    they appear in its second parent.
+    Every row of both matrices must be an ordering of the same genes.
+
+    Args:
+        p1_genes : Matrix of the first parents' genes, one row per child
+        p2_genes : Matrix of the second parents' genes, one row per child
+        points : Array of the crossover points, one per child
+
+    Return:
+        A matrix of the children's genes
+    """
+    children = p1_genes.copy()
+    num_children, length = children.shape
+    if num_children == 0 or length == 0:
+        return children
+
+    rows = np.broadcast_to(np.arange(num_children)[:, None], children.shape)
+
+    # The position of every second parent's gene within the first parent
+    genes = np.sort(p1_genes[0])
+    lowest, span = int(genes[0]), int(genes[-1]) - int(genes[0]) + 1
+    if span <= 4 * length:
+        # Genes such as vertices and colors are nearly consecutive, so each
+        # first parent's positions can be scattered into a table of every gene
+        table = np.empty((num_children, span), dtype=np.int64)
+        table[rows, p1_genes - lowest] = np.arange(length)
+        positions = table[rows, p2_genes - lowest]
+    else:
+        positions = np.take_along_axis(np.argsort(p1_genes, axis=1), np.searchsorted(genes, p2_genes), axis=1)
+
+    # Genes the first parent did not pass on fill the rest of the child, in order
+    rest = positions >= points[:, None]
+    targets = points[:, None] + np.cumsum(rest, axis=1) - 1
+    children[rows[rest], targets[rest]] = p2_genes[rest]
+
+    return children
+
+def swap_mutation(children, rate, rng):
+    """
+    Mutates gene orderings in place: each child has a `rate` chance of having two of its genes swapped.
+
+    Args:
+        children : Matrix of the children's genes, one row per child
+        rate : Chance that a child is mutated
+        rng : NumPy random number generator
+    """
+    num_children, length = children.shape
+    if length < 2:
+        return
+
+    rows = np.flatnonzero(rng.random(num_children) < rate)
+    index1 = rng.integers(0, length, len(rows))
+    index2 = (index1 + rng.integers(1, length, len(rows))) % length
+
+    children[rows, index1], children[rows, index2] = children[rows, index2], children[rows, index1]
+
+def summarize(pop, num_elite = 10):
+    """
+    Summarizes a population after a tournament.
+
+    Args:
+        pop : The population to summarize
+        num_elite : (Optional) Number of elite genomes to include
+
+    Return:
+        A dictionary holding the population's size, the minimum, quartiles,
+        maximum and mean of its fitness, and the genomes of its fittest players, best first
+    """
+    fitness = pl.fitness(pop)
+    fitnesses = np.sort(fitness).tolist()
+    size = len(fitnesses)
+
+    def quantile(q):
+        return fitnesses[min(size - 1, int(q * size))] if size else 0.0
+
+    # A stable sort keeps tied players in population order, like `heapq.nlargest()`
+    elite = pl.select(pop, np.argsort(-fitness, kind="stable")[:num_elite])
+
+    return {
+        "size": size,
+        "fitness": {
+            "min": quantile(0.0),
+            "q1": quantile(0.25),
+            "median": quantile(0.5),
+            "q3": quantile(0.75),
+            "max": fitnesses[-1] if size else 0.0,
+            "mean": sum(fitnesses) / size if size else 0.0,
+            },
+        "elite": [player.strategy.data for player in elite],
         }
 
-    return df.append(new_row, ignore_index=True)
+def to_df(pop):
+    """
+    Formats a population as a DataFrame.
+    Every column is allocated once and filled in place, then the DataFrame is
+    built in a single step.
+
+    Args:
+        pop : The population to format
+
+    Return:
+        A DataFrame with one row per player, with the columns in `COLUMNS`
+    """
+    size = len(pop)
+    names = np.empty(size, dtype=object)
+    gens = np.empty(size, dtype=np.int64)
+    vertices = np.empty(size, dtype=object)
+    colors = np.empty(size, dtype=object)
+    fitnesses = np.empty(size, dtype=np.float64)
+    wins = np.empty(size, dtype=np.int64)
+    losses = np.empty(size, dtype=np.int64)
+
+    if isinstance(pop, pl.Population):
+        names[:] = pop.names
+        gens[:] = pop.generations[:size]
+        # Assigned row by row, so every cell holds a list rather than a number
+        for row, (vertex_genes, color_genes) in enumerate(zip(pop.matrix("vertices").tolist(),
+                pop.matrix("colors").tolist())):
+            vertices[row] = vertex_genes
+            colors[row] = color_genes
+        fitnesses[:] = pop.fitness()
+        wins[:] = pop.wins[:size]
+        losses[:] = pop.losses[:size]
+        return pd.DataFrame(dict(zip(COLUMNS, (names, gens, vertices, colors, fitnesses, wins, losses))),
+                columns=COLUMNS)
+
+    for row, player in enumerate(pop):
+        names[row] = player.name
+        gens[row] = player.generation
+        vertices[row] = list(player.strategy.data["vertices"])
+        colors[row] = list(player.strategy.data["colors"])
+        fitnesses[row] = player.fitness()
+        wins[row] = player.wins
+        losses[row] = player.losses
+
+    return pd.DataFrame(dict(zip(COLUMNS, (names, gens, vertices, colors, fitnesses, wins, losses))),
+            columns=COLUMNS)
+
+def to_df_sorted(pop):
+    """
+    Formats a population as a DataFrame, fittest players first.
+
+    Args:
+        pop : The population to format
+
+    Return:
+        A DataFrame sorted by fitness, then wins, in descending order
+    """
+    df = to_df(pop)
+    df.sort_values(by=["Fitness", "Wins"], ascending=False, inplace=True)
+
+    return df
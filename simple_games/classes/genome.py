@@ -0,0 +1,152 @@
+##
+# This class models the genome of a strategy: an immutable mapping from trait
+# names (such as "vertices" or "colors") to orderings of integer genes.
+# Each trait is stored in a compact typed array and the hash is computed once,
+# so genomes can be deduplicated with sets in constant time.
+# A genome can be used anywhere a strategy's `data` dictionary is read.
+#
+# Date: 2026-10-18
+##
+
+from array import array
+from collections.abc import Mapping
+
+class Genome(Mapping):
+
+    __slots__ = ("names", "traits", "_hash")
+
+    def __init__(self, names, traits):
+        """
+        Creates a new genome.
+
+        Args:
+            names : A tuple of trait names
+            traits : A sequence of gene orderings, one per trait name
+        """
+        self.names = names
+        self.traits = tuple(to_array(trait) for trait in traits)
+        # Hashing tuples of integers gives the same value in every process
+        self._hash = hash(tuple(tuple(trait) for trait in self.traits))
+
+    @classmethod
+    def from_data(cls, data):
+        """
+        Converts a strategy's data dictionary into a genome.
+
+        Args:
+            data : A dictionary of gene orderings, or a genome
+
+        Return:
+            The equivalent genome
+        """
+        if isinstance(data, Genome):
+            return data
+
+        return cls(tuple(data.keys()), data.values())
+
+    def __getitem__(self, name):
+        """
+        Gets the gene ordering of a trait.
+
+        Args:
+            name : The name of the trait
+
+        Return:
+            The trait's genes, as an array
+        """
+        try:
+            return self.traits[self.names.index(name)]
+        except ValueError:
+            raise KeyError(name) from None
+
+    def __iter__(self):
+        """
+        Iterates over the trait names.
+        """
+        return iter(self.names)
+
+    def __len__(self):
+        """
+        Overrides the default implementation of `len()`.
+
+        Return:
+            The number of traits
+        """
+        return len(self.names)
+
+    def __hash__(self):
+        """
+        Overrides the default implementation of `hash()`.
+
+        Return:
+            The hash computed when the genome was created
+        """
+        return self._hash
+
+    def __eq__(self, other):
+        """
+        Overrides the default implementation of `==`.
+        Genomes are compared gene by gene; any other mapping is compared trait by trait.
+
+        Args:
+            other : The genome or dictionary being compared with
+
+        Return:
+            True if both contain the same genes, else False
+        """
+        if isinstance(other, Genome):
+            return (self._hash == other._hash and self.names == other.names
+                    and self.traits == other.traits)
+
+        if isinstance(other, Mapping):
+            return (list(self.names) == list(other.keys())
+                    and all(list(trait) == list(other[name]) for name, trait in self.items()))
+
+        return NotImplemented
+
+    def __ne__(self, other):
+        """
+        Overrides the default implementation of `!=`.
+
+        Args:
+            other : The genome or dictionary being compared with
+
+        Return:
+            True if the genes differ, else False
+        """
+        equal = self.__eq__(other)
+
+        return equal if equal is NotImplemented else not equal
+
+    def __repr__(self):
+        """
+        Overrides the default implementation of `repr()`.
+        Genomes are displayed like the dictionaries they replace.
+
+        Return:
+            A formatted string of every trait and its genes
+        """
+        return repr({name: list(trait) for name, trait in self.items()})
+
+def to_array(genes):
+    """
+    Packs genes into the smallest unsigned typed array that can hold them.
+
+    Args:
+        genes : A sequence of non-negative integers
+
+    Return:
+        The genes, as an array
+    """
+    if isinstance(genes, array):
+        return genes
+
+    genes = list(genes)
+    largest = max(genes, default=0)
+
+    if largest < 1 << 16:
+        return array("H", genes)
+    if largest < 1 << 32:
+        return array("I", genes)
+
+    return array("q", genes)
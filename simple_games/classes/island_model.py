@@ -0,0 +1,229 @@
+##
+# This class runs an island model of the genetic algorithm.
+# Several independent pairs of P1/P2 populations (islands) evolve in separate
+# processes, each running the usual compete/repopulate cycle of a
+# `GeneticAlgorithm`. Every few generations, the best players of every island
+# migrate to its neighbors in a topology (a ring, by default), replacing the
+# neighbors' worst players.
+#
+# Islands only ever exchange genomes, packed into compact arrays, so the cost
+# of migration does not grow with the size of the populations.
+#
+# Date: 2026-10-18
+##
+
+import multiprocessing as mp
+import random
+import traceback
+from . import genetic_algorithm as ga
+from . import checkpoint as ck
+
+class IslandModel:
+
+    def __init__(self, ruleset, random_on_init_strat, strat_data, islands = 4, migration_interval = 5, migrants = 5, topology = "ring", seed = None, **kwargs):
+        """
+        Creates a new island model.
+
+        Args:
+            ruleset : The ruleset of the game being evolved upon
+            random_on_init_strat : A random-on-initialize strategy constructor used to give each player a random strategy
+            strat_data : Data to be fed to the strategy
+            islands : (Optional) Number of islands, each evolved in its own process
+            migration_interval : (Optional) Number of generations between migrations
+            migrants : (Optional) Number of players each population sends to every neighbor
+            topology : (Optional) Where each island sends its migrants: "ring", "complete",
+                       or a list holding the neighbors of every island
+            seed : (Optional) Seed of the islands' random number generators; island `i` uses `seed + i`
+            kwargs : (Optional) Any other parameter of `GeneticAlgorithm`, such as `pop_size` or `iterations`
+        """
+        self.ruleset = ruleset
+        self.random_on_init_strat = random_on_init_strat
+        self.strat_data = strat_data
+        self.islands = islands
+        self.migration_interval = migration_interval
+        self.migrants = migrants
+        self.topology = topology
+        self.seed = seed
+        self.kwargs = kwargs
+
+        # The final populations of every island
+        self.island_pops = []
+
+    def neighbors(self, island):
+        """
+        Gets the islands an island sends its migrants to.
+
+        Args:
+            island : Index of the island
+
+        Return:
+            A list of island indices
+        """
+        if self.topology == "ring":
+            targets = [(island + 1) % self.islands]
+        elif self.topology == "complete":
+            targets = range(self.islands)
+        else:
+            targets = self.topology[island]
+
+        return [target for target in targets if target != island]
+
+    def evolve(self, verbose = False, to_df = False):
+        """
+        Evolves every island, migrating players between them, then gathers the results.
+
+        Args:
+            verbose : (Optional) Whether to print a summary of every island at each migration
+            to_df : (Optional) Whether to return players in a DataFrame
+
+        Return:
+            The P1 and P2 players of every island, merged and sorted by fitness
+        """
+        seed = self.seed if self.seed is not None else random.randrange(2 ** 32)
+        connections = []
+        processes = []
+
+        for island in range(self.islands):
+            parent_end, child_end = mp.Pipe()
+            process = mp.Process(target=run_island, args=(child_end, island, seed + island,
+                    self.migration_interval, self.migrants, (self.ruleset, self.random_on_init_strat,
+                    self.strat_data), self.kwargs))
+            process.start()
+            child_end.close()
+            connections.append(parent_end)
+            processes.append(process)
+
+        try:
+            results = self.exchange(connections, verbose)
+        finally:
+            for connection in connections:
+                connection.close()
+            for process in processes:
+                process.join()
+
+        # Rebuild the players of every island in this process
+        builder = ga.GeneticAlgorithm(self.ruleset, self.random_on_init_strat, self.strat_data, **self.kwargs)
+        self.island_pops = []
+        for p1_data, p2_data in results:
+            self.island_pops.append(tuple(builder.restore_population(*ck.loads_population(data))
+                    for data in (p1_data, p2_data)))
+
+        p1_pop = sorted((player for p1, _ in self.island_pops for player in p1), reverse=True)
+        p2_pop = sorted((player for _, p2 in self.island_pops for player in p2), reverse=True)
+
+        if to_df:
+            return ga.to_df_sorted(p1_pop), ga.to_df_sorted(p2_pop)
+
+        return p1_pop, p2_pop
+
+    def exchange(self, connections, verbose):
+        """
+        Routes migrants between the islands until every island is done.
+
+        Args:
+            connections : The pipe to every island
+            verbose : Whether to print a summary of every island at each migration
+
+        Return:
+            The encoded final P1 and P2 populations of every island
+        """
+        while True:
+            messages = [receive(connection) for connection in connections]
+
+            if all(message[0] == "done" for message in messages):
+                return [message[1:] for message in messages]
+
+            # Every island sends its migrants after the same generation
+            p1_inbox = [[] for _ in connections]
+            p2_inbox = [[] for _ in connections]
+            for island, (_, summary, p1_data, p2_data) in enumerate(messages):
+                if verbose:
+                    print("ISLAND {}, GENERATION {}: P1 Pop: {}, best {:.3f}; P2 Pop: {}, best {:.3f}".format(
+                        island, summary["generation"], summary["p1"]["size"], summary["p1"]["fitness"]["max"],
+                        summary["p2"]["size"], summary["p2"]["fitness"]["max"]))
+
+                for target in self.neighbors(island):
+                    p1_inbox[target].append(p1_data)
+                    p2_inbox[target].append(p2_data)
+
+            for connection, p1_data, p2_data in zip(connections, p1_inbox, p2_inbox):
+                connection.send((p1_data, p2_data))
+
+def receive(connection):
+    """
+    Receives a message from an island, re-raising any error the island ran into.
+
+    Args:
+        connection : The pipe to the island
+
+    Return:
+        The message, as a tuple whose first item is its kind
+    """
+    message = connection.recv()
+
+    if message[0] == "error":
+        raise RuntimeError("An island failed:\n" + message[1])
+
+    return message
+
+def run_island(connection, island, seed, migration_interval, migrants, args, kwargs):
+    """
+    Evolves a single island; the target of every island's process.
+
+    Args:
+        connection : The pipe to the main process
+        island : Index of the island
+        seed : Seed of the island's random number generator
+        migration_interval : Number of generations between migrations
+        migrants : Number of players each population sends to every neighbor
+        args : The positional arguments of the island's `GeneticAlgorithm`
+        kwargs : The keyword arguments of the island's `GeneticAlgorithm`
+    """
+    try:
+        random.seed(seed)
+        algorithm = ga.GeneticAlgorithm(*args, **kwargs)
+        traits = tuple(algorithm.strat_data.keys())
+
+        for summary in algorithm.generations():
+            if algorithm.iteration % migration_interval or algorithm.iteration == algorithm.iterations:
+                continue
+
+            # Populations are sorted best first, so the best players lead them
+            connection.send(("migrants", summary,
+                ck.dumps_population(traits, algorithm.population_state(algorithm.p1_pop[:migrants])),
+                ck.dumps_population(traits, algorithm.population_state(algorithm.p2_pop[:migrants]))))
+
+            p1_data, p2_data = connection.recv()
+            immigrate(algorithm, algorithm.p1_pop, p1_data)
+            immigrate(algorithm, algorithm.p2_pop, p2_data)
+
+        connection.send(("done",
+            ck.dumps_population(traits, algorithm.population_state(algorithm.p1_pop)),
+            ck.dumps_population(traits, algorithm.population_state(algorithm.p2_pop))))
+    except Exception:
+        connection.send(("error", "Island {}: {}".format(island, traceback.format_exc())))
+    finally:
+        connection.close()
+
+def immigrate(algorithm, pop, batches):
+    """
+    Replaces the worst players of a population with migrants from other islands.
+    Migrants arrive with no wins or losses, so they are judged afresh in their new island.
+    At most half of the population is replaced.
+
+    Args:
+        algorithm : The island's genetic algorithm
+        pop : The population receiving the migrants, sorted best first
+        batches : The encoded migrants from every neighbor
+    """
+    arrivals = []
+    for data in batches:
+        arrivals += algorithm.restore_population(*ck.loads_population(data))
+
+    arrivals = arrivals[:len(pop) // 2]
+    for player in arrivals:
+        player.wins = 0
+        player.losses = 0
+
+    if arrivals:
+        pop[-len(arrivals):] = arrivals
@@ -0,0 +1,122 @@
+##
+# This class caches the outcomes of matches between deterministic strategies.
+# Two deterministic strategies always play the same game against each other,
+# so once a pairing has been played its outcome can be reused in later
+# tournaments instead of replaying it.
+# Entries are keyed by the genome hashes of both strategies and an identifier
+# of the ruleset, and the least recently used entries are evicted first.
+#
+# Date: 2026-10-18
+##
+
+from collections import OrderedDict
+from zlib import crc32
+
+class MatchCache:
+
+    def __init__(self, capacity = 100000):
+        """
+        Creates a new, empty match cache.
+
+        Args:
+            capacity : (Optional) Maximum number of match outcomes to keep
+        """
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, p1_strat, p2_strat, ruleset_id):
+        """
+        Builds the cache key of a match.
+
+        Args:
+            p1_strat : Strategy of Player 1
+            p2_strat : Strategy of Player 2
+            ruleset_id : Identifier of the ruleset, from `ruleset_key()`
+
+        Return:
+            The key of the match, or None if either strategy is not deterministic
+        """
+        if not (p1_strat.deterministic and p2_strat.deterministic):
+            return None
+
+        return (p1_strat.genome_hash(), p2_strat.genome_hash(), ruleset_id)
+
+    def get(self, key):
+        """
+        Looks up the outcome of a match and marks it as recently used.
+
+        Args:
+            key : The key of the match
+
+        Return:
+            True if Player 1 won the match, False if Player 2 won, or None if it is not cached
+        """
+        p1_won = self.entries.get(key)
+
+        if p1_won is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+
+        return p1_won
+
+    def put(self, key, p1_won):
+        """
+        Stores the outcome of a match, evicting the least recently used
+        outcome if the cache is full.
+
+        Args:
+            key : The key of the match
+            p1_won : Whether Player 1 won the match
+        """
+        self.entries[key] = bool(p1_won)
+        self.entries.move_to_end(key)
+
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self):
+        """
+        Summarizes how effective the cache has been.
+
+        Return:
+            A dictionary of hit, miss and eviction counts, the hit rate and the current size
+        """
+        lookups = self.hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": float(self.hits) / float(lookups) if lookups else 0.0,
+            "size": len(self.entries),
+            }
+
+    def __len__(self):
+        """
+        Overrides the default implementation of `len()`.
+
+        Return:
+            The number of cached match outcomes
+        """
+        return len(self.entries)
+
+def ruleset_key(ruleset):
+    """
+    Computes an identifier of a ruleset and the board it is played on.
+    The identifier is stable across processes, unlike `hash()` of a string.
+
+    Args:
+        ruleset : The ruleset to identify
+
+    Return:
+        An integer identifying the ruleset
+    """
+    description = repr((type(ruleset).__name__, ruleset.name, ruleset.initial_state, ruleset.bounds))
+
+    return crc32(description.encode())
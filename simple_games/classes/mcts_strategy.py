@@ -0,0 +1,310 @@
+##
+# A strategy that searches for its moves with Monte Carlo tree search, for any
+# ruleset that can list its legal moves. Every iteration of the search walks
+# down the tree from the current position, picking children by UCT (upper
+# confidence bounds applied to trees), adds one untried move at the end of the
+# walk, and plays a batch of random games from there through the ruleset's
+# `playouts()` if it has one, or `playout()` otherwise. The results are added
+# to every node on the walk. The most visited move is played.
+#
+# The strategy learns of every move through the game's hooks, and keeps the
+# subtree below the move actually played, so the search of one move carries
+# over to the next. Positions are rebuilt on a scratch board by replaying the
+# game's moves, and checked against the real board's Zobrist key when it has one.
+# Outside of a `Game`, the moves are read from the board's log, so the board
+# must record its moves.
+#
+# Date: 2026-10-18
+##
+
+from math import log, sqrt
+import random
+import time
+
+import numpy as np
+
+from .strategy_interface import StrategyInterface
+
+class MCTSNode:
+
+    __slots__ = ("move", "parent", "children", "untried", "player", "winner", "visits", "wins")
+
+    def __init__(self, move = None, parent = None, player = 0):
+        """
+        Node constructor.
+
+        Args:
+            move : (Optional) The move leading to this node from its parent
+            parent : (Optional) The parent node
+            player : (Optional) Index of the player who made the move
+        """
+        self.move = move
+        self.parent = parent
+        self.children = []
+        self.player = player
+
+        # Moves not expanded yet, listed when the node is first reached; None until then
+        self.untried = None
+
+        # Index of the winning player if the game is over here, else None
+        self.winner = None
+
+        # Games played through this node, and how many of them `player` won
+        self.visits = 0
+        self.wins = 0
+
+    def select(self, exploration):
+        """
+        Picks the child with the best upper confidence bound.
+
+        Args:
+            exploration : Weight of the exploration term
+
+        Return:
+            The chosen child
+        """
+        scale = exploration * sqrt(log(self.visits))
+
+        return max(self.children, key=lambda child: child.wins / child.visits + scale / sqrt(child.visits))
+
+    def child(self, move):
+        """
+        Finds the child reached by a move.
+
+        Args:
+            move : The move
+
+        Return:
+            The child, or None if the move was never tried
+        """
+        for child in self.children:
+            if child.move == move:
+                return child
+
+        return None
+
+class MCTSStrategy(StrategyInterface):
+
+    def __init__(self, name, ruleset = None, iterations = 200, time_limit = None, exploration = sqrt(2),
+            batch_size = 32, seed = None):
+        """
+        Strategy constructor.
+        The search stops when either budget runs out; at least one must be given.
+
+        Args:
+            name : The name of the strategy
+            ruleset : (Optional) The ruleset of the game; the board's ruleset is used if omitted
+            iterations : (Optional) Number of iterations per move, or None for no limit
+            time_limit : (Optional) Number of seconds per move, or None for no limit
+            exploration : (Optional) Weight of exploration in UCT
+            batch_size : (Optional) Number of random games played from every new node
+            seed : (Optional) Seed of the random games, for repeatable searches
+        """
+        super().__init__(name)
+
+        if iterations is None and time_limit is None:
+            raise ValueError("MCTSStrategy needs an iteration or time budget")
+
+        self.rules = ruleset
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.batch_size = batch_size
+        self.rng = random.Random(seed)
+        self.batch_rng = np.random.default_rng(seed)
+
+        # The game being played: its board, the moves made so far, and the tree of the current position
+        self.board = None
+        self.history = []
+        self.root = None
+
+        # Board the searches are simulated on
+        self.scratch = None
+
+    def on_game_start(self, board):
+        """
+        Starts a new tree for a new game.
+
+        Args:
+            board : The board being played on
+        """
+        self.board = board
+        self.history = []
+        self.root = None
+
+    def on_move(self, board, move):
+        """
+        Records a move made by either player, and keeps the subtree below it.
+
+        Args:
+            board : The board being played on
+            move : The move that was made
+        """
+        # A strategy playing both sides is told of every move twice
+        if board is not self.board or len(self.history) >= board.log.count:
+            return
+
+        self.history.append(move)
+
+        if self.root is not None:
+            self.root = self.root.child(move)
+            if self.root is not None:
+                self.root.parent = None
+
+    def on_game_end(self, board, won):
+        """
+        Drops the tree of the game that just ended.
+
+        Args:
+            board : The board being played on
+            won : Whether the strategy's player won the game
+        """
+        self.board = None
+        self.history = []
+        self.root = None
+
+    def move(self, board):
+        """
+        Searches for the best move in the board's position.
+
+        Args:
+            board : The board being played on
+
+        Return:
+            The most visited move, or None if there are no legal moves
+        """
+        rules = self.rules if self.rules is not None else board.rules
+        if rules is None:
+            raise ValueError("MCTSStrategy needs a ruleset, either its own or the board's")
+
+        if self.scratch is None or self.scratch.rules is not rules:
+            self.scratch = rules.create_board(record=False)
+
+        self.sync(rules, board)
+        root = self.root
+
+        if self.time_limit is not None:
+            deadline = time.perf_counter() + self.time_limit
+
+        iteration = 0
+        while iteration == 0 or ((self.iterations is None or iteration < self.iterations)
+                and (self.time_limit is None or time.perf_counter() < deadline)):
+            self.search(rules, root)
+            iteration += 1
+
+        if not root.children:
+            return None
+
+        return max(root.children, key=lambda child: child.visits).move
+
+    def sync(self, rules, board):
+        """
+        Makes sure the moves and tree held match the board's position, and
+        rebuilds them from the board's log if they do not.
+
+        Args:
+            rules : The ruleset of the game
+            board : The board being played on
+        """
+        self.replay(rules, self.history)
+
+        if (board is not self.board or len(self.history) != board.log.count
+                or (board.key is not None and self.scratch.key != board.key)):
+            if not board.log.enabled:
+                raise ValueError("MCTSStrategy needs the game's hooks, or a board that records its moves")
+
+            self.board = board
+            self.history = [rules.decode_move(code) for _, code in board.log]
+            self.root = None
+
+        if self.root is None:
+            self.root = MCTSNode(player=(len(self.history) - 1) % 2)
+
+    def replay(self, rules, moves):
+        """
+        Sets up the scratch board in the position reached by a list of moves.
+
+        Args:
+            rules : The ruleset of the game
+            moves : The moves made since the start of the game
+        """
+        scratch = self.scratch
+        scratch.reset()
+
+        for move in moves:
+            rules.update_board(scratch, None, move)
+
+    def search(self, rules, root):
+        """
+        Runs one iteration of the search: selection, expansion, a batch of
+        random games, and backpropagation of their results.
+
+        Args:
+            rules : The ruleset of the game
+            root : The node of the current position
+        """
+        scratch = self.scratch
+        path = []
+
+        # Selection: follow UCT through fully expanded nodes
+        node = root
+        while node.winner is None and node.untried is not None and not node.untried and node.children:
+            node = node.select(self.exploration)
+            path.append(node.move)
+
+        # Expansion: list the node's moves when first reached, then add one
+        if node.winner is None:
+            self.replay(rules, self.history + path)
+
+            if node.untried is None:
+                self.expand(rules, node)
+
+        if node.winner is None and node.untried:
+            move = node.untried.pop()
+            rules.update_board(scratch, None, move)
+            path.append(move)
+
+            child = MCTSNode(move, node, 1 - node.player)
+            node.children.append(child)
+            node = child
+            self.expand(rules, node)
+
+        # Simulation: a batch of random games, or the known result of a finished one
+        count = self.batch_size
+        if node.winner is not None:
+            wins = count if node.winner == 0 else 0
+        else:
+            wins = rules.playouts(scratch, count, self.batch_rng)
+
+            if wins is None:
+                wins = 0
+                for game in range(count):
+                    if game:
+                        self.replay(rules, self.history + path)
+                    wins += rules.playout(scratch, self.rng) == 0
+
+        # Backpropagation: every node counts the wins of the player who moved into it
+        while node is not None:
+            node.visits += count
+            node.wins += wins if node.player == 0 else count - wins
+            node = node.parent
+
+    def expand(self, rules, node):
+        """
+        Lists the moves of a node's position, held on the scratch board, in a
+        random order, or records the winner if the game is over there.
+
+        Args:
+            rules : The ruleset of the game
+            node : The node
+        """
+        if rules.is_game_over(self.scratch):
+            node.winner = rules.declare_winner(self.scratch, (0, 1))
+            return
+
+        node.untried = list(rules.legal_moves(self.scratch))
+        self.rng.shuffle(node.untried)
+
+        # A player with no legal move can only make an illegal one, and loses
+        if not node.untried:
+            node.winner = node.player
@@ -0,0 +1,83 @@
+##
+# This class models an append-only log of the moves made in a game.
+# Moves are stored as integers (encoded by the game's ruleset) alongside the
+# index of the player who made them, in preallocated typed arrays.
+# Recording can be switched off entirely, in which case only the number of
+# moves made is kept.
+#
+# Date: 2026-10-18
+##
+
+from array import array
+
+class MoveLog:
+
+    def __init__(self, capacity = 64, enabled = True):
+        """
+        The move log constructor preallocates room for `capacity` moves.
+
+        Args:
+            capacity : (Optional) Number of moves to preallocate room for
+            enabled : (Optional) Whether moves are recorded at all
+        """
+        self.enabled = enabled
+        self.count = 0
+        self.players = array("b", bytes(max(capacity, 1)))
+        self.moves = array("q", bytes(8 * max(capacity, 1)))
+
+    def append(self, player_index, code):
+        """
+        Logs a move.
+        When recording is disabled, only the move counter is updated.
+
+        Args:
+            player_index : Index of the player who made the move; 0 or 1
+            code : The move, encoded as an integer by the ruleset
+        """
+        if self.enabled:
+            # Double the capacity whenever the log fills up
+            if self.count == len(self.moves):
+                self.players.extend(self.players)
+                self.moves.extend(self.moves)
+
+            self.players[self.count] = player_index
+            self.moves[self.count] = code
+
+        self.count += 1
+
+    def clear(self):
+        """
+        Empties the log without releasing its storage.
+        """
+        self.count = 0
+
+    def last_player(self):
+        """
+        Gets the index of the player who made the most recent move.
+        Players alternate turns, so this is known even when recording is disabled.
+
+        Return:
+            0 or 1, or None if no moves have been made
+        """
+        return (self.count - 1) % 2 if self.count else None
+
+    def __len__(self):
+        """
+        Overrides the default implementation of `len()`.
+
+        Return:
+            The number of moves made
+        """
+        return self.count
+
+    def __iter__(self):
+        """
+        Iterates over the recorded moves in the order they were made.
+
+        Return:
+            An iterator of `(player index, encoded move)` tuples
+        """
+        if not self.enabled:
+            return iter(())
+
+        return zip(self.players[:self.count], self.moves[:self.count])
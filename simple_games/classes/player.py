@@ -7,6 +7,8 @@
 ##
 class Player:
 
+    __slots__ = ("name", "strategy", "generation", "wins", "losses")
+
     def __init__(self, name, strategy):
         """
         The player constructor.
@@ -34,6 +36,47 @@ class Player:
         """
         return self.strategy.move(board)
 
+    async def move_async(self, board):
+        """
+        Asks the player's strategy for a move without blocking other games.
+
+        Args:
+            board : The board object for the current game
+
+        Return:
+            The move made.
+        """
+        return await self.strategy.move_async(board)
+
+    def on_game_start(self, board):
+        """
+        Tells the player's strategy that a game is starting.
+
+        Args:
+            board : The board object for the current game
+        """
+        self.strategy.on_game_start(board)
+
+    def on_move(self, board, move):
+        """
+        Tells the player's strategy that a move has been applied, by either player.
+
+        Args:
+            board : The board object for the current game
+            move : The move that was made
+        """
+        self.strategy.on_move(board, move)
+
+    def on_game_end(self, board, won):
+        """
+        Tells the player's strategy that the game is over.
+
+        Args:
+            board : The board object for the current game
+            won : Whether this player won
+        """
+        self.strategy.on_game_end(board, won)
+
     def fitness(self):
         """
         Computes the fitness (win percentage) of the player.
@@ -0,0 +1,595 @@
+##
+# A population of players stored as parallel arrays rather than as separate
+# objects. Each trait of the genome is a 2D NumPy matrix with one row per
+# player (its gene ordering), and the wins, losses and generations of the
+# players are NumPy vectors, so fitness, sorting and selection are single
+# array operations.
+#
+# Indexing or iterating over a population gives lightweight `PlayerView`s,
+# which expose the API of a `Player` while reading from and writing to the
+# arrays. A view's strategy is only built when it is first read, by copying
+# the population's template strategy and giving it the view's genome.
+# Views refer to a position in the population, so they should not be kept
+# across a `sort()`.
+#
+# Date: 2026-10-18
+##
+
+from array import array
+from collections.abc import Sequence
+from copy import copy
+from . import genome as g
+from . import player as p
+
+import numpy as np
+
+# Type of the genes of a trait, by the typecode `to_array()` picks for them
+GENE_TYPES = {"H": np.uint16, "I": np.uint32, "q": np.int64}
+
+class Population(Sequence):
+
+    def __init__(self, template, traits = None, capacity = 0):
+        """
+        Creates an empty population.
+
+        Args:
+            template : A strategy that every player's strategy is copied from; its
+                       genome gives the length and type of every trait
+            traits : (Optional) The names of the traits in every genome; defaults to those of the template
+            capacity : (Optional) Number of players to allocate room for
+        """
+        self.template = template
+        self.traits = tuple(traits) if traits is not None else tuple(template.data.keys())
+        self.size = 0
+
+        self.names = []
+        self.strategy_names = []
+        self.generations = np.zeros(capacity, dtype=np.int64)
+        self.wins = np.zeros(capacity, dtype=np.int64)
+        self.losses = np.zeros(capacity, dtype=np.int64)
+
+        # One matrix per trait, with one row of genes per player
+        template_genome = g.Genome.from_data(template.data)
+        self.typecodes = tuple(template_genome[trait].typecode for trait in self.traits)
+        self.genes = tuple(np.zeros((capacity, len(template_genome[trait])), dtype=GENE_TYPES[code])
+                for trait, code in zip(self.traits, self.typecodes))
+
+    @classmethod
+    def from_players(cls, players, template = None):
+        """
+        Gathers players into a population.
+
+        Args:
+            players : A sequence of players
+            template : (Optional) The template strategy; defaults to the first player's strategy
+
+        Return:
+            A population holding a copy of every player
+        """
+        pop = cls(template if template is not None else players[0].strategy, capacity=len(players))
+        pop.extend(players)
+
+        return pop
+
+    def empty(self, capacity = 0):
+        """
+        Creates an empty population with the same template and traits.
+
+        Args:
+            capacity : (Optional) Number of players to allocate room for
+
+        Return:
+            An empty population
+        """
+        return Population(self.template, self.traits, capacity)
+
+    def reserve(self, capacity):
+        """
+        Makes room for at least `capacity` players, at least doubling the
+        allocated room whenever it grows.
+
+        Args:
+            capacity : Number of players to make room for
+        """
+        allocated = len(self.wins)
+        if capacity <= allocated:
+            return
+
+        capacity = max(capacity, 2 * allocated)
+
+        def grow(values):
+            grown = np.zeros((capacity,) + values.shape[1:], dtype=values.dtype)
+            grown[:self.size] = values[:self.size]
+            return grown
+
+        self.generations = grow(self.generations)
+        self.wins = grow(self.wins)
+        self.losses = grow(self.losses)
+        self.genes = tuple(grow(matrix) for matrix in self.genes)
+
+    def add(self, name, strategy_name, genome, generation = 0, wins = 0, losses = 0):
+        """
+        Adds a player to the end of the population.
+
+        Args:
+            name : The player's label
+            strategy_name : The name of the player's strategy
+            genome : The player's gene orderings, one per trait, in order
+            generation : (Optional) The player's generation
+            wins : (Optional) The player's wins
+            losses : (Optional) The player's losses
+        """
+        self.reserve(self.size + 1)
+        self.names.append(None)
+        self.strategy_names.append(None)
+        self.size += 1
+        self.set(self.size - 1, name, strategy_name, genome, generation, wins, losses)
+
+    def set(self, index, name, strategy_name, genome, generation = 0, wins = 0, losses = 0):
+        """
+        Overwrites the player at a position in the population.
+
+        Args:
+            index : The position of the player
+            name : The player's label
+            strategy_name : The name of the player's strategy
+            genome : The player's gene orderings, one per trait, in order
+            generation : (Optional) The player's generation
+            wins : (Optional) The player's wins
+            losses : (Optional) The player's losses
+        """
+        self.names[index] = name
+        self.strategy_names[index] = strategy_name
+        self.generations[index] = generation
+        self.wins[index] = wins
+        self.losses[index] = losses
+
+        for matrix, genes in zip(self.genes, genome):
+            matrix[index] = genes
+
+    def copy_player(self, index, player):
+        """
+        Overwrites the player at a position in the population with a copy of a player.
+        Players of another population are copied array to array, without building their strategy.
+
+        Args:
+            index : The position of the player to overwrite
+            player : The player to copy
+        """
+        if not isinstance(player, PlayerView):
+            strat = player.strategy
+            self.set(index, player.name, strat.name, [strat.data[trait] for trait in self.traits],
+                    player.generation, player.wins, player.losses)
+            return
+
+        source, k = player.population, player.index
+        self.names[index] = source.names[k]
+        self.strategy_names[index] = source.strategy_names[k]
+        self.generations[index] = source.generations[k]
+        self.wins[index] = source.wins[k]
+        self.losses[index] = source.losses[k]
+
+        for matrix, source_matrix in zip(self.genes, source.genes):
+            matrix[index] = source_matrix[k]
+
+    def append(self, player):
+        """
+        Adds a copy of a player to the end of the population.
+
+        Args:
+            player : The player to add
+        """
+        self.reserve(self.size + 1)
+        self.names.append(None)
+        self.strategy_names.append(None)
+        self.size += 1
+        self.copy_player(self.size - 1, player)
+
+    def extend(self, players):
+        """
+        Adds a copy of every player to the end of the population.
+
+        Args:
+            players : A sequence of players
+        """
+        if isinstance(players, Population):
+            self.concatenate(players)
+            return
+
+        self.reserve(self.size + len(players))
+        for player in players:
+            self.append(player)
+
+    def concatenate(self, other):
+        """
+        Adds a copy of every player of another population, array to array.
+
+        Args:
+            other : The population to copy from
+        """
+        start, count = self.size, other.size
+        self.reserve(start + count)
+
+        self.names += other.names[:count]
+        self.strategy_names += other.strategy_names[:count]
+        self.generations[start:start + count] = other.generations[:count]
+        self.wins[start:start + count] = other.wins[:count]
+        self.losses[start:start + count] = other.losses[:count]
+        for matrix, other_matrix in zip(self.genes, other.genes):
+            matrix[start:start + count] = other_matrix[:count]
+
+        self.size += count
+
+    def add_many(self, names, strategy_names, genomes, generations, wins = None, losses = None):
+        """
+        Adds a cohort of players to the end of the population at once.
+
+        Args:
+            names : The players' labels
+            strategy_names : The names of the players' strategies
+            genomes : One matrix per trait, in order, with one row of genes per player
+            generations : Array of the players' generations
+            wins : (Optional) Array of the players' wins; 0 if omitted
+            losses : (Optional) Array of the players' losses; 0 if omitted
+        """
+        start, count = self.size, len(names)
+        self.reserve(start + count)
+
+        self.names += names
+        self.strategy_names += strategy_names
+        self.generations[start:start + count] = generations
+        self.wins[start:start + count] = wins if wins is not None else 0
+        self.losses[start:start + count] = losses if losses is not None else 0
+        for matrix, genes in zip(self.genes, genomes):
+            matrix[start:start + count] = genes
+
+        self.size += count
+
+    def __iadd__(self, players):
+        """
+        Overrides the default implementation of `+=`, like `list.extend()`.
+
+        Args:
+            players : A sequence of players
+
+        Return:
+            The population itself
+        """
+        self.extend(players)
+
+        return self
+
+    def take(self, indices):
+        """
+        Gathers some players into a new population, in the order given.
+
+        Args:
+            indices : A sequence of positions in the population
+
+        Return:
+            A new population holding copies of the chosen players
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        pop = self.empty()
+
+        pop.names = [self.names[k] for k in indices.tolist()]
+        pop.strategy_names = [self.strategy_names[k] for k in indices.tolist()]
+        pop.generations = self.generations[indices]
+        pop.wins = self.wins[indices]
+        pop.losses = self.losses[indices]
+        pop.genes = tuple(matrix[indices] for matrix in self.genes)
+        pop.size = len(indices)
+
+        return pop
+
+    def reorder(self, indices):
+        """
+        Rearranges the players in place.
+
+        Args:
+            indices : A permutation of the positions in the population
+        """
+        ordered = self.take(indices)
+
+        self.names = ordered.names
+        self.strategy_names = ordered.strategy_names
+        self.generations = ordered.generations
+        self.wins = ordered.wins
+        self.losses = ordered.losses
+        self.genes = ordered.genes
+
+    def fitness(self):
+        """
+        Computes the fitness (win percentage) of every player.
+        Players who have played no games have a fitness of 0.0.
+
+        Return:
+            An array of fitnesses, one per player
+        """
+        wins = self.wins[:self.size]
+        total = wins + self.losses[:self.size]
+
+        return np.divide(wins, total, out=np.zeros(self.size), where=total > 0)
+
+    def order(self, reverse = False):
+        """
+        Orders the players by fitness.
+        Players of equal fitness keep their order, like `list.sort()`.
+
+        Args:
+            reverse : (Optional) Whether to order from highest to lowest fitness
+
+        Return:
+            An array of positions in the population
+        """
+        fitness = self.fitness()
+
+        return np.argsort(-fitness if reverse else fitness, kind="stable")
+
+    def sort(self, reverse = False):
+        """
+        Sorts the players by fitness, in place.
+
+        Args:
+            reverse : (Optional) Whether to sort from highest to lowest fitness
+        """
+        self.reorder(self.order(reverse))
+
+    def add_tallies(self, wins, losses):
+        """
+        Adds a tournament's wins and losses to the players' counters.
+
+        Args:
+            wins : Array of the wins of every player
+            losses : Array of the losses of every player
+        """
+        self.wins[:self.size] += wins
+        self.losses[:self.size] += losses
+
+    def matrix(self, trait):
+        """
+        Gets the genes of a trait for every player.
+
+        Args:
+            trait : The name of the trait
+
+        Return:
+            A matrix with one row of genes per player; a view, not a copy
+        """
+        return self.genes[self.traits.index(trait)][:self.size]
+
+    def genome(self, index):
+        """
+        Builds the genome of a player.
+
+        Args:
+            index : The position of the player
+
+        Return:
+            The player's `Genome`
+        """
+        return g.Genome(self.traits, [array(code, matrix[index].tobytes())
+                for code, matrix in zip(self.typecodes, self.genes)])
+
+    def strategy(self, index):
+        """
+        Builds the strategy of a player from the template.
+
+        Args:
+            index : The position of the player
+
+        Return:
+            A new strategy holding the player's genome
+        """
+        strat = copy(self.template)
+        strat.set_name(self.strategy_names[index])
+        strat.set_data(self.genome(index))
+
+        return strat
+
+    def index_of(self, index):
+        """
+        Converts a possibly negative position into a position in the population.
+
+        Args:
+            index : The position
+
+        Return:
+            The equivalent non-negative position
+        """
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("population index out of range")
+
+        return index
+
+    def __getitem__(self, index):
+        """
+        Gets a player, or a new population of a slice of the players.
+
+        Args:
+            index : A position or a slice
+
+        Return:
+            A `PlayerView`, or a `Population`
+        """
+        if isinstance(index, slice):
+            return self.take(range(self.size)[index])
+
+        return PlayerView(self, self.index_of(index))
+
+    def __setitem__(self, index, players):
+        """
+        Overwrites a player, or a slice of the players with as many players.
+
+        Args:
+            index : A position or a slice
+            players : A player, or a sequence of players
+        """
+        if not isinstance(index, slice):
+            self.copy_player(self.index_of(index), players)
+            return
+
+        positions = range(self.size)[index]
+        if len(positions) != len(players):
+            raise ValueError("Expected {} players, got {}".format(len(positions), len(players)))
+
+        # Copied first, so a population can be assigned a slice of itself
+        players = list(players) if not isinstance(players, Population) else players.take(range(players.size))
+        for position, player in zip(positions, players):
+            self.copy_player(position, player)
+
+    def __len__(self):
+        """
+        Overrides the default implementation of `len()`.
+
+        Return:
+            The number of players
+        """
+        return self.size
+
+    def __iter__(self):
+        """
+        Iterates over the players, as views.
+        """
+        for index in range(self.size):
+            yield PlayerView(self, index)
+
+class PlayerView(p.Player):
+
+    __slots__ = ("population", "index", "cached_strategy")
+
+    def __init__(self, population, index):
+        """
+        Creates a view of a player in a population.
+
+        Args:
+            population : The population holding the player
+            index : The position of the player
+        """
+        self.population = population
+        self.index = index
+        self.cached_strategy = None
+
+    @property
+    def name(self):
+        """
+        The player's label.
+        """
+        return self.population.names[self.index]
+
+    @name.setter
+    def name(self, name):
+        self.population.names[self.index] = name
+
+    @property
+    def strategy(self):
+        """
+        The player's strategy, built the first time it is read from this view.
+        """
+        if self.cached_strategy is None:
+            self.cached_strategy = self.population.strategy(self.index)
+
+        return self.cached_strategy
+
+    @strategy.setter
+    def strategy(self, strategy):
+        pop = self.population
+        pop.set(self.index, self.name, strategy.name, [strategy.data[trait] for trait in pop.traits],
+                self.generation, self.wins, self.losses)
+        self.cached_strategy = strategy
+
+    @property
+    def generation(self):
+        """
+        The player's generation.
+        """
+        return int(self.population.generations[self.index])
+
+    @generation.setter
+    def generation(self, generation):
+        self.population.generations[self.index] = generation
+
+    @property
+    def wins(self):
+        """
+        The player's wins.
+        """
+        return int(self.population.wins[self.index])
+
+    @wins.setter
+    def wins(self, wins):
+        self.population.wins[self.index] = wins
+
+    @property
+    def losses(self):
+        """
+        The player's losses.
+        """
+        return int(self.population.losses[self.index])
+
+    @losses.setter
+    def losses(self, losses):
+        self.population.losses[self.index] = losses
+
+def fitness(pop):
+    """
+    Computes the fitness of every player of a population or list of players.
+
+    Args:
+        pop : A `Population`, or a sequence of players
+
+    Return:
+        An array of fitnesses, one per player
+    """
+    if isinstance(pop, Population):
+        return pop.fitness()
+
+    return np.fromiter((player.fitness() for player in pop), dtype=np.float64, count=len(pop))
+
+def select(pop, indices):
+    """
+    Gathers some players of a population or list of players, in the order given.
+
+    Args:
+        pop : A `Population`, or a sequence of players
+        indices : A sequence of positions
+
+    Return:
+        A `Population` if `pop` is one, else a list of players
+    """
+    if isinstance(pop, Population):
+        return pop.take(indices)
+
+    return [pop[k] for k in np.asarray(indices, dtype=np.int64).tolist()]
+
+def add_tallies(pop, wins, losses):
+    """
+    Adds a tournament's wins and losses to the counters of a population or list of players.
+
+    Args:
+        pop : A `Population`, or a sequence of players
+        wins : Array of the wins of every player
+        losses : Array of the losses of every player
+    """
+    if isinstance(pop, Population):
+        pop.add_tallies(wins, losses)
+        return
+
+    for player, player_wins, player_losses in zip(pop, wins.tolist(), losses.tolist()):
+        player.wins += player_wins
+        player.losses += player_losses
+
+def ranked(pop):
+    """
+    Sorts a population or list of players by fitness, from highest to lowest.
+    Players of equal fitness keep their order, like `sorted()`.
+
+    Args:
+        pop : A `Population`, or a sequence of players
+
+    Return:
+        A sorted `Population` if `pop` is one, else a sorted list
+    """
+    return select(pop, np.argsort(-fitness(pop), kind="stable"))
@@ -0,0 +1,156 @@
+##
+# This class profiles where the time goes inside games.
+# A `Game` given a profiler times each phase of play with a monotonic clock:
+# resetting the board, checking for the end of the game, asking a player for
+# a move, checking its legality, updating the board, telling the strategies
+# about the game (see `StrategyInterface.on_move()`) and declaring a winner.
+# Times and call counts are summed per ruleset class, except for moves and
+# strategy hooks, which are summed per strategy class.
+#
+# A game with a profiler wraps each phase in a timed function and then plays
+# the same loop as any other game. Games without a profiler skip all of
+# this, so profiling costs nothing unless it is switched on.
+#
+# Date: 2026-10-18
+##
+
+from time import perf_counter_ns
+
+# Phases of a game, in the order they happen
+PHASES = ("reset", "is_game_over", "move", "is_legal", "update_board", "hooks", "declare_winner")
+
+class Profiler:
+
+    def __init__(self):
+        """
+        Creates a profiler with no measurements.
+        """
+        # (owner, phase) -> [number of calls, total nanoseconds]
+        self.counters = {}
+        self.games = 0
+        self.game_ns = 0
+
+    def clock(self):
+        """
+        Reads the profiler's clock.
+
+        Return:
+            A monotonic time, in nanoseconds
+        """
+        return perf_counter_ns()
+
+    def add(self, owner, phase, elapsed):
+        """
+        Records one call of a phase.
+
+        Args:
+            owner : The ruleset or strategy whose class the time is charged to
+            phase : The phase of the game, from `PHASES`
+            elapsed : Time taken by the call, in nanoseconds
+        """
+        key = (type(owner).__name__, phase)
+        counter = self.counters.get(key)
+
+        if counter is None:
+            self.counters[key] = [1, elapsed]
+        else:
+            counter[0] += 1
+            counter[1] += elapsed
+
+    def timed(self, owner, phase, function):
+        """
+        Wraps a function so that every call is recorded as a call of a phase.
+
+        Args:
+            owner : The ruleset or strategy whose class the time is charged to
+            phase : The phase of the game, from `PHASES`
+            function : The function to time
+
+        Return:
+            A function taking the same arguments and returning the same result
+        """
+        clock = self.clock
+        add = self.add
+
+        def timed_function(*args):
+            start = clock()
+            result = function(*args)
+            add(owner, phase, clock() - start)
+
+            return result
+
+        return timed_function
+
+    def add_game(self, elapsed):
+        """
+        Records a whole game.
+
+        Args:
+            elapsed : Time taken by the game, in nanoseconds
+        """
+        self.games += 1
+        self.game_ns += elapsed
+
+    def merge(self, other):
+        """
+        Adds another profiler's measurements to this one's, such as one used
+        in another process.
+
+        Args:
+            other : The profiler to merge in
+        """
+        for (owner, phase), (calls, elapsed) in other.counters.items():
+            counter = self.counters.setdefault((owner, phase), [0, 0])
+            counter[0] += calls
+            counter[1] += elapsed
+
+        self.games += other.games
+        self.game_ns += other.game_ns
+
+    def clear(self):
+        """
+        Discards every measurement.
+        """
+        self.counters.clear()
+        self.games = 0
+        self.game_ns = 0
+
+    def report(self):
+        """
+        Summarizes the measurements, slowest phase first.
+
+        Return:
+            A list of dictionaries, one per class and phase, holding the number
+            of calls, the total and mean time, and the share of the total game time
+        """
+        rows = []
+        for (owner, phase), (calls, elapsed) in self.counters.items():
+            rows.append({
+                "owner": owner,
+                "phase": phase,
+                "calls": calls,
+                "total_s": elapsed / 1e9,
+                "mean_us": elapsed / calls / 1e3,
+                "share": elapsed / self.game_ns if self.game_ns else 0.0,
+                })
+
+        rows.sort(key=lambda row: row["total_s"], reverse=True)
+
+        return rows
+
+    def __str__(self):
+        """
+        Overrides the default implementation of `str()`.
+        Formats the report as a table.
+
+        Return:
+            The report, as a string
+        """
+        lines = ["{} games, {:.3f}s".format(self.games, self.game_ns / 1e9),
+                "{:<28} {:<16} {:>10} {:>10} {:>10} {:>7}".format(
+                    "Class", "Phase", "Calls", "Total (s)", "Mean (us)", "Share")]
+
+        for row in self.report():
+            lines.append("{owner:<28} {phase:<16} {calls:>10} {total_s:>10.3f} {mean_us:>10.2f} {share:>7.1%}".format(**row))
+
+        return "\n".join(lines)
@@ -5,6 +5,8 @@
 #
 # Date: 2021-02-06
 ##
+import asyncio
+
 class Referee:
 
     def __init__(self, board, rules):
@@ -50,6 +52,63 @@ class Referee:
         # Return the move, which is either valid or None
         return proposed_move
 
+    def ask_for_move_profiled(self, player, board, profiler):
+        """
+        Retrieves a proposed move like `ask_for_move()`, timing the player's
+        move and the legality check separately.
+
+        Args:
+            player : Player whose turn it is
+            board : The game board
+            profiler : The `Profiler` to record the times with
+
+        Return:
+            The players move, or None if the move failed.
+        """
+        clock = profiler.clock
+
+        start = clock()
+        proposed_move = player.move(board)
+        profiler.add(player.strategy, "move", clock() - start)
+
+        start = clock()
+        legal = self.rules.is_legal(self.board, proposed_move)
+        profiler.add(self.rules, "is_legal", clock() - start)
+
+        return proposed_move if legal else None
+
+    async def ask_for_move_async(self, player, board, timeout = None):
+        """
+        Retrieves a proposed move from the current player without blocking other games.
+        A player who does not answer in time, whose engine exits or stops
+        accepting requests, or whose answer is not a move of the game, is
+        treated as making an illegal move.
+
+        Args:
+            player : Player whose turn it is
+            board : The game board
+            timeout : (Optional) Number of seconds the player may take
+
+        Return:
+            The players move, or None if the move failed.
+        """
+        try:
+            proposed_move = await asyncio.wait_for(player.move_async(board), timeout)
+        except (asyncio.TimeoutError, EOFError, ConnectionError):
+            return None
+
+        # An answer that does not fit the game at all is as illegal as any other
+        try:
+            legal = self.rules.is_legal(board, proposed_move)
+        except (TypeError, ValueError, KeyError, IndexError):
+            legal = False
+
+        # If the move was illegal, the player's move is None
+        if not legal:
+            proposed_move = None
+
+        return proposed_move
+
     def is_game_over(self, board):
         """
         Checks to see if the game is over.
@@ -0,0 +1,340 @@
+##
+# This class solves any finite two-player game by retrograde analysis.
+# Every position reachable from the ruleset's initial state is visited exactly
+# once and stored in compact integer arrays, with its moves as a list of child
+# positions. Positions are then labeled, working backwards from the end-game
+# states, as a WIN or a LOSS for the player to move. Positions that can never
+# be forced to an end (cycles) are labeled as a DRAW.
+#
+# A solver needs three functions besides the ruleset:
+#   - `encode(board)` returns the board's state as a non-negative integer
+#   - `decode(code, board)` loads a state produced by `encode()` into a board
+#   - `legal_moves(board)` returns every legal move on a board; defaults to
+#     the ruleset's own `legal_moves()`
+#
+# Date: 2026-10-18
+##
+
+from array import array
+from bisect import bisect_left
+from collections import deque
+from .player import Player
+
+# Labels of a position, from the point of view of the player to move
+UNKNOWN = 0
+WIN = 1
+LOSS = 2
+DRAW = 3
+
+class RetrogradeSolver:
+
+    def __init__(self, ruleset, encode, decode, legal_moves = None, size = None):
+        """
+        Solver constructor.
+
+        Args:
+            ruleset : The ruleset of the game to solve
+            encode : Function that encodes a board's state as an integer
+            decode : Function that loads an encoded state into a board
+            legal_moves : (Optional) Function that lists the legal moves on a board.
+                          Defaults to `ruleset.legal_moves`
+            size : (Optional) An upper bound on the codes returned by `encode()`.
+                   If given, positions are indexed by a flat array instead of a dictionary
+        """
+        self.ruleset = ruleset
+        self.encode = encode
+        self.decode = decode
+        self.legal_moves = legal_moves if legal_moves is not None else ruleset.legal_moves
+        self.size = size
+
+        # Stand-ins for the players, so the ruleset can be asked who won
+        self.players = [Player("P1", None), Player("P2", None)]
+
+        # Sorted position keys, with their labels and distances to the end of the game
+        self.keys = array("q")
+        self.labels = bytearray()
+        self.depths = array("I")
+
+        self.board = ruleset.create_board(record=False)
+        self.board.reset()
+
+    def solve(self, board = None, to_move = 0):
+        """
+        Explores every position reachable from a starting position, then labels them.
+
+        Args:
+            board : (Optional) The board to start from; the ruleset's initial state if omitted
+            to_move : (Optional) Index of the player to move in the starting position
+
+        Return:
+            The label of the starting position
+        """
+        if board is None:
+            board = self.board
+            board.reset()
+
+        code = self.encode(board)
+        keys, offsets, children, labels, depths = self.explore(code << 1 | to_move)
+        self.propagate(offsets, children, labels, depths)
+
+        # The move lists are only needed while labeling; keep positions sorted by key
+        del offsets, children
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self.keys = array("q", (keys[idx] for idx in order))
+        self.labels = bytearray(labels[idx] for idx in order)
+        self.depths = array("I", (depths[idx] for idx in order))
+
+        return self.labels[self.lookup(code, to_move)]
+
+    def explore(self, start):
+        """
+        Visits every position reachable from a starting position, breadth first.
+        A position's key is its encoded state, shifted left once, with the low
+        bit holding the index of the player to move.
+
+        Args:
+            start : The key of the starting position
+
+        Return:
+            A tuple of the position keys, the offsets and list of their children,
+            and their labels and depths; only end-game positions are labeled
+        """
+        board = self.board
+        ruleset = self.ruleset
+
+        keys = array("q", [start])
+        offsets = array("q", [0])
+        children = array("i")
+        labels = bytearray()
+
+        if self.size is None:
+            index = {start: 0}
+        else:
+            # Entry `key` holds the position's index plus one; 0 means unvisited
+            index = array("i", bytes(4 * (self.size << 1)))
+            index[start] = 1
+
+        position = 0
+        while position < len(keys):
+            key = keys[position]
+            code, to_move = key >> 1, key & 1
+            position += 1
+
+            self.decode(code, board)
+            if ruleset.is_game_over(board):
+                labels.append(self.outcome(board, to_move))
+                offsets.append(len(children))
+                continue
+
+            # A player without legal moves cannot avoid losing
+            moves = list(self.legal_moves(board))
+            labels.append(UNKNOWN if moves else LOSS)
+
+            player = self.players[to_move]
+            for move in moves:
+                self.decode(code, board)
+                ruleset.update_board(board, player, move)
+                child = self.encode(board) << 1 | (1 - to_move)
+
+                if self.size is None:
+                    child_index = index.setdefault(child, len(keys))
+                else:
+                    child_index = index[child] - 1
+                    if child_index < 0:
+                        child_index = len(keys)
+                        index[child] = child_index + 1
+
+                if child_index == len(keys):
+                    keys.append(child)
+                children.append(child_index)
+
+            offsets.append(len(children))
+
+        return keys, offsets, children, labels, array("I", bytes(4 * len(keys)))
+
+    def outcome(self, board, to_move):
+        """
+        Asks the ruleset who won an end-game position.
+
+        Args:
+            board : The board holding the end-game position
+            to_move : Index of the player to move
+
+        Return:
+            WIN if the player to move has won, else LOSS
+        """
+        # The default `declare_winner()` reads the last mover from the move log
+        board.log.clear()
+        for _ in range(2 - to_move):
+            board.log.append(0, 0)
+
+        winner = self.ruleset.declare_winner(board, self.players)
+
+        return WIN if winner is self.players[to_move] else LOSS
+
+    def propagate(self, offsets, children, labels, depths):
+        """
+        Labels every position by backward induction from the end-game positions.
+        A position is a WIN if some move leads to a LOSS, and a LOSS once every
+        move leads to a WIN. Positions left unlabeled are a DRAW.
+
+        Args:
+            offsets : Offsets of every position's children
+            children : Child positions, grouped by parent
+            labels : Labels of the positions; updated in place
+            depths : Number of moves until the end of the game; updated in place
+        """
+        num_positions = len(labels)
+
+        # Invert the move lists, so every position knows the positions leading to it
+        parent_offsets = array("q", bytes(8 * (num_positions + 1)))
+        for child in children:
+            parent_offsets[child + 1] += 1
+        for idx in range(num_positions):
+            parent_offsets[idx + 1] += parent_offsets[idx]
+
+        parents = array("i", bytes(4 * len(children)))
+        fill = array("q", parent_offsets)
+        for parent in range(num_positions):
+            for child in children[offsets[parent]:offsets[parent + 1]]:
+                parents[fill[child]] = parent
+                fill[child] += 1
+        del fill
+
+        # Number of each position's moves not yet known to lead to a WIN
+        remaining = array("i", (offsets[idx + 1] - offsets[idx] for idx in range(num_positions)))
+
+        queue = deque(idx for idx in range(num_positions) if labels[idx] != UNKNOWN)
+        while queue:
+            child = queue.popleft()
+            child_lost = labels[child] == LOSS
+
+            for parent in parents[parent_offsets[child]:parent_offsets[child + 1]]:
+                if labels[parent] != UNKNOWN:
+                    continue
+
+                # Positions are solved in order of depth, so the first label found is the fastest
+                if child_lost:
+                    labels[parent] = WIN
+                else:
+                    remaining[parent] -= 1
+                    if remaining[parent]:
+                        continue
+                    labels[parent] = LOSS
+
+                depths[parent] = depths[child] + 1
+                queue.append(parent)
+
+        for idx in range(num_positions):
+            if labels[idx] == UNKNOWN:
+                labels[idx] = DRAW
+
+    def lookup(self, code, to_move):
+        """
+        Looks up a solved position.
+
+        Args:
+            code : The encoded state of the position
+            to_move : Index of the player to move
+
+        Return:
+            The index of the position in the solved arrays, or None if it was never reached
+        """
+        key = code << 1 | to_move
+        idx = bisect_left(self.keys, key)
+
+        return idx if idx < len(self.keys) and self.keys[idx] == key else None
+
+    def label(self, board, to_move):
+        """
+        Gets the label of a board's position.
+
+        Args:
+            board : The board to look up
+            to_move : Index of the player to move
+
+        Return:
+            WIN, LOSS or DRAW for the player to move, or UNKNOWN if the position was never reached
+        """
+        idx = self.lookup(self.encode(board), to_move)
+
+        return UNKNOWN if idx is None else self.labels[idx]
+
+    def best_move(self, board, to_move):
+        """
+        Finds a perfect-play move: the fastest win, else a draw, else the slowest loss.
+        The board is left unchanged.
+
+        Args:
+            board : The board to move on
+            to_move : Index of the player to move
+
+        Return:
+            The best move, or None if there are no legal moves
+        """
+        scratch = self.board
+        code = self.encode(board)
+        self.decode(code, scratch)
+
+        best = None
+        best_rank = None
+        for move in list(self.legal_moves(scratch)):
+            self.ruleset.update_board(scratch, self.players[to_move], move)
+            idx = self.lookup(self.encode(scratch), 1 - to_move)
+            self.decode(code, scratch)
+
+            label = UNKNOWN if idx is None else self.labels[idx]
+            depth = 0 if idx is None else self.depths[idx]
+
+            # Rank moves by the opponent's label, then by the number of moves until the end
+            if label == LOSS:
+                rank = (3, -depth)
+            elif label == DRAW:
+                rank = (2, 0)
+            elif label == WIN:
+                rank = (1, depth)
+            else:
+                rank = (0, 0)
+
+            if best_rank is None or rank > best_rank:
+                best, best_rank = move, rank
+
+        return best
+
+    def is_optimal(self, board, to_move, move):
+        """
+        Determines if a move keeps the best result the player to move can force.
+        Useful as an oracle when judging evolved strategies.
+
+        Args:
+            board : The board before the move
+            to_move : Index of the player to move
+            move : The move being judged
+
+        Return:
+            True if the move does not worsen the player's result, else False
+        """
+        scratch = self.board
+        code = self.encode(board)
+        self.decode(code, scratch)
+        self.ruleset.update_board(scratch, self.players[to_move], move)
+        child = self.lookup(self.encode(scratch), 1 - to_move)
+
+        label = self.label(board, to_move)
+        child_label = UNKNOWN if child is None else self.labels[child]
+
+        if label == WIN:
+            return child_label == LOSS
+        if label == DRAW:
+            return child_label in (LOSS, DRAW)
+
+        return True
+
+    def __len__(self):
+        """
+        Overrides the default implementation of `len()`.
+
+        Return:
+            The number of solved positions
+        """
+        return len(self.keys)
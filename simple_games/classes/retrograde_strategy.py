@@ -0,0 +1,37 @@
+##
+# A strategy that plays perfectly using the solution of a game found by a
+# `RetrogradeSolver`: it wins as fast as possible from won positions and
+# loses as slowly as possible from lost ones.
+# The solver must have been solved from a position that leads to the boards
+# this strategy is asked to move on.
+#
+# Date: 2026-10-18
+##
+
+from .strategy_interface import StrategyInterface
+
+class RetrogradeStrategy(StrategyInterface):
+
+    def __init__(self, name, solver):
+        """
+        Strategy constructor.
+
+        Args:
+            name : The name of the strategy
+            solver : A solved `RetrogradeSolver` of the game being played
+        """
+        super().__init__(name)
+        self.solver = solver
+
+    def move(self, board):
+        """
+        Make a perfect-play move.
+
+        Args:
+            board : The board being played on
+
+        Return:
+            A proposed move.
+        """
+        # Players alternate turns, so the mover is known from the number of moves made
+        return self.solver.best_move(board, board.log.count % 2)
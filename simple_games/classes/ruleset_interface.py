@@ -5,6 +5,23 @@
 #
 # Date: 2021-02-06
 ##
+from numbers import Integral
+
+from . import board as b
+
+def is_integer(value):
+    """
+    Determines if a value is an integer, such as a number of a move.
+    Booleans are not; NumPy integers are.
+
+    Args:
+        value : The value
+
+    Return:
+        True if the value is an integer, else False
+    """
+    return isinstance(value, Integral) and not isinstance(value, bool)
+
 class RulesetInterface:
 
     def __init__(self, name, initial_state, bounds = None):
@@ -20,6 +37,22 @@ class RulesetInterface:
         self.initial_state = initial_state
         self.bounds = bounds
 
+    def create_board(self, record = True):
+        """
+        Creates a new board to play this game on.
+        Rulesets that benefit from a specialized board can override this.
+
+        Args:
+            record : (Optional) Whether the board keeps a history of the moves made
+
+        Return:
+            A board holding this ruleset's initial state and bounds
+        """
+        board = b.Board(self.initial_state, self.bounds, record, self)
+        board.key = board.initial_key = self.zobrist_key(board)
+
+        return board
+
     def is_legal(self, board, proposed_move):
         """
         Determines if the move proposed is legal.
@@ -33,6 +66,38 @@ class RulesetInterface:
         """
         pass
 
+    def legal_moves(self, board):
+        """
+        Lists every legal move on a board.
+        The list is generated once per position by `generate_moves()` and
+        cached on the board until the next move is made, so strategies and
+        solvers asking about the same position share one computation.
+        The list must not be modified.
+
+        Args:
+            board : The board being played on
+
+        Return:
+            A list of legal moves
+        """
+        if board.moves is None:
+            board.moves = self.generate_moves(board)
+
+        return board.moves
+
+    def generate_moves(self, board):
+        """
+        Generates every legal move on a board.
+        Called by `legal_moves()` at most once per position.
+
+        Args:
+            board : The board being played on
+
+        Return:
+            A list of legal moves
+        """
+        pass
+
     def is_game_over(self, board):
         """
         Determines if the game is over.
@@ -48,7 +113,7 @@ class RulesetInterface:
     def update_board(self, board, player, move):
         """
         Update the board based on the player's given move.
-        Also updates the board's `data` field to log move history.
+        Also logs the move, encoded by `encode_move()`, using `board.record()`.
 
         Args:
             board : The board being played on
@@ -71,6 +136,130 @@ class RulesetInterface:
         Return:
             The winning player of the game
         """
-        last_entry = list(board.data.values())[-1][0]
+        # Rulesets that still log their history in `board.data` themselves
+        if not board.log.count:
+            last_entry = list(board.data.values())[-1][0]
+
+            return players[0] if players[0].name is last_entry else players[1]
+
+        return players[board.log.last_player()]
+
+    def playout(self, board, rng):
+        """
+        Plays random legal moves on a board until the game is over, as the
+        simulations of a tree search do. The board is left at the end of the game.
+        Rulesets with a faster way to finish a game at random can override this.
+
+        Args:
+            board : The board being played on
+            rng : The `random.Random` to draw moves with
+
+        Return:
+            Index of the winning player; 0 for the player who moved first in the game
+        """
+        while not self.is_game_over(board):
+            moves = self.legal_moves(board)
+
+            # A player with no legal move can only make an illegal one, and loses
+            if not moves:
+                return 1 - board.log.count % 2
+
+            self.update_board(board, None, moves[rng.randrange(len(moves))])
+
+        return self.declare_winner(board, (0, 1))
+
+    def playouts(self, board, count, rng):
+        """
+        Plays many random games at once from a board's position, without changing the board.
+        Rulesets that can simulate games in bulk, such as with NumPy, override this;
+        by default it returns None, and callers play games one at a time with `playout()`.
+
+        Args:
+            board : The board being played on
+            count : Number of games to play
+            rng : The `numpy.random.Generator` to draw moves with
+
+        Return:
+            Number of games won by the player who moved first in the game, or None if unsupported
+        """
+        return None
+
+    def encode_move(self, move):
+        """
+        Encodes a move as an integer for the board's move log.
+
+        Args:
+            move : The move being encoded
+
+        Return:
+            The move, as an integer
+        """
+        return move
+
+    def decode_move(self, code):
+        """
+        Decodes a move encoded by `encode_move()`.
+
+        Args:
+            code : The move, as an integer
+
+        Return:
+            The move
+        """
+        return code
+
+    def state_key(self, board):
+        """
+        Gets the key a board's state is filed under in a decoded move history.
+
+        Args:
+            board : The board being played on
+
+        Return:
+            A hashable representation of the board's state
+        """
+        return str(board.state)
+
+    def zobrist_key(self, board):
+        """
+        Computes the Zobrist key of a board's state from scratch (see `zobrist.py`).
+        Rulesets that compute keys keep `board.key` up to date in `update_board()`,
+        so this is only needed for a new board or a state loaded by other means.
+
+        Args:
+            board : The board being played on
+
+        Return:
+            The state's 64-bit key, or None if the ruleset does not compute keys
+        """
+        return None
+
+    def decode_history(self, board, players):
+        """
+        Decodes a board's move log into a dictionary indexed by the state of
+        the board before every move, with values of the form
+        `(player name, move made)`. The winner, if declared, is listed under
+        the "winner" key.
+
+        Args:
+            board : The board that was played on
+            players : List of players in the game
+
+        Return:
+            The move history as a dictionary
+        """
+        # Replay the moves on a scratch board to recover every intermediate state
+        replay = self.create_board(record=False)
+        replay.reset()
+
+        history = {}
+        for player_index, code in board.log:
+            player = players[player_index]
+            move = self.decode_move(code)
+
+            history[self.state_key(replay)] = (player.name, move)
+            self.update_board(replay, player, move)
+
+        history.update(board.data)
 
-        return players[0] if players[0].name is last_entry else players[1]
+        return history
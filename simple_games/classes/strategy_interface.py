@@ -11,8 +11,14 @@
 # Date: 2021-02-06
 ##
 
+from .genome import Genome
+
 class StrategyInterface:
 
+    # Whether two strategies always play the same game against each other.
+    # Only deterministic strategies have their match outcomes cached.
+    deterministic = False
+
     def __init__(self, name, data = None):
         """
         Strategy constructor.
@@ -36,6 +42,53 @@ class StrategyInterface:
         """
         pass
 
+    async def move_async(self, board):
+        """
+        Make a move based on the strategy, without blocking other games.
+        Strategies that wait on something, such as an external engine, should
+        override this; by default it simply calls `move()`.
+
+        Args:
+            board : The board being played on
+
+        Return:
+            A proposed move.
+        """
+        return self.move(board)
+
+    def on_game_start(self, board):
+        """
+        Called when a game the strategy plays in starts, once the board is reset.
+        Strategies that keep state from one move to the next, rather than
+        reading the whole board on every turn, can set it up here; by default it does nothing.
+
+        Args:
+            board : The board being played on
+        """
+        pass
+
+    def on_move(self, board, move):
+        """
+        Called once either player's move has been applied to the board, so the
+        strategy can update its state; by default it does nothing.
+        A strategy playing both sides of a game is told of every move twice.
+
+        Args:
+            board : The board being played on
+            move : The move that was made
+        """
+        pass
+
+    def on_game_end(self, board, won):
+        """
+        Called when a game the strategy plays in is over; by default it does nothing.
+
+        Args:
+            board : The board being played on
+            won : Whether the strategy's player won the game
+        """
+        pass
+
     def set_name(self, name):
         """
         Update the strategy's name.
@@ -54,6 +107,20 @@ class StrategyInterface:
         """
         self.data = data
 
+    def genome_hash(self):
+        """
+        Hashes the strategy's data, which serves as its genome.
+        Only the values are hashed, in order, so the hash is stable across processes.
+
+        Return:
+            An integer hash of the strategy's data
+        """
+        # Genomes cache their hash
+        if isinstance(self.data, Genome):
+            return hash(self.data)
+
+        return hash(tuple(tuple(trait) for trait in self.data.values()))
+
     def __str__(self):
         """
         Overrides the default implementation of `str()`.
@@ -0,0 +1,87 @@
+##
+# A stub engine for testing engine support (see `engine.py`).
+# It plays Toothpick Takeaway, Unbalanced Rook and graph coloring legally but
+# naively, telling the games apart by the shape of the board's state:
+#   - Toothpick Takeaway: takes one toothpick
+#   - Unbalanced Rook: moves one tile, down if possible
+#   - Graph coloring: colors the first uncolored vertex with its lowest available color
+#
+# Usage: python stub_engine.py [--delay SECONDS] [--hang-after MOVES] [--exit-after MOVES] [--answer JSON]
+#
+# Date: 2026-10-18
+##
+
+import argparse
+import json
+import sys
+import time
+
+def choose_move(position):
+    """
+    Chooses a move for a position.
+
+    Args:
+        position : The position, as sent by the host: its state, bounds and player to move
+
+    Return:
+        The move, or None if the stub cannot find one
+    """
+    state, bounds = position["state"], position["bounds"]
+
+    if isinstance(state, int):
+        return 1
+
+    if isinstance(state, dict):
+        direction = "D" if state["D"] < bounds["D"] else "R"
+        return {"direction": direction, "tiles": 1}
+
+    for vtx, vertex in enumerate(state):
+        if vertex["color"] == 0:
+            adj_colors = {state[adj]["color"] for adj in vertex["adj"]}
+            for color in range(1, bounds + 1):
+                if color not in adj_colors:
+                    return {"vertex": vtx, "color": color}
+
+    return None
+
+def main():
+    """
+    Answers move requests until told to quit or its input is closed.
+    """
+    parser = argparse.ArgumentParser(description="A stub engine for testing engine support.")
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds to wait before every answer")
+    parser.add_argument("--hang-after", type=int, default=None,
+            help="stop answering after this many moves, to test timeouts")
+    parser.add_argument("--exit-after", type=int, default=None,
+            help="exit without answering after this many moves, to test crashes")
+    parser.add_argument("--answer", default=None,
+            help="answer every request with this JSON instead of a move, to test bad answers")
+    args = parser.parse_args()
+
+    moves = 0
+    for line in sys.stdin:
+        command, _, argument = line.strip().partition(" ")
+
+        if command == "quit":
+            break
+
+        if command != "move":
+            print("error unknown command", flush=True)
+            continue
+
+        moves += 1
+        if args.exit_after is not None and moves > args.exit_after:
+            sys.exit(1)
+        if args.hang_after is not None and moves > args.hang_after:
+            time.sleep(3600)
+
+        if args.delay:
+            time.sleep(args.delay)
+
+        if args.answer is not None:
+            print(args.answer, flush=True)
+        else:
+            print(json.dumps(choose_move(json.loads(argument))), flush=True)
+
+if __name__ == "__main__":
+    main()
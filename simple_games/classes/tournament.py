@@ -6,14 +6,22 @@
 #
 # Date: 2021-03-06
 ##
-from random import sample 
-from . import board as b
+import random
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 from . import referee as r
 from . import game as g
+from . import player as p
+from . import match_cache as mc
+from . import population as pl
+
+# Largest value a per-match seed can take
+MAX_SEED = 2 ** 32
 
 class Tournament:
 
-    def __init__(self, ruleset, min_games, fitness):
+    def __init__(self, ruleset, min_games, fitness, workers = 1, seed = None, engine = None, cache = None, profiler = None,
+            round_robin = False, block_size = None):
         """
         Constructs a new, empty tournament
 
@@ -21,12 +29,33 @@ class Tournament:
             ruleset : The ruleset of the game in the tournament
             min_games : Minimal number of games each player must compete in during a tournament
             fitness : Initial fitness needed for a player to survive
+            workers : (Optional) Number of processes to play matches on
+            seed : (Optional) Master seed that every match seed is drawn from
+            engine : (Optional) A batch engine that plays all matches at once, such as `GCBatchEngine`
+            cache : (Optional) A `MatchCache` consulted before any match is played
+            profiler : (Optional) A `Profiler` timing every game played in this process
+            round_robin : (Optional) Whether every pairing is played once, into an outcome matrix,
+                          rather than sampling opponents for each population in turn
+            block_size : (Optional) With `round_robin`, pairs blocks of this many players at random
+                         instead of playing every pairing; see `schedule_blocks()`
         """
         self.ruleset = ruleset
         self.min_games = min_games
         self.fitness = fitness
+        self.workers = workers
+        self.seed = seed
+        self.engine = engine
+        self.cache = cache
+        self.profiler = profiler
+        self.round_robin = round_robin
+        self.block_size = block_size
+        self.ruleset_id = mc.ruleset_key(ruleset) if cache is not None else None
         self.trials = 0
-        self.board = b.Board(ruleset.initial_state, ruleset.bounds)
+        # Outcome of every pairing of the last round-robin tournament:
+        # 1 where Player 1 won, -1 where Player 2 won, 0 where they did not play
+        self.outcomes = None
+        # Nobody reads the move history during a tournament, so don't record it
+        self.board = ruleset.create_board(record=False)
         self.referee = r.Referee(self.board, ruleset)
 
 
@@ -40,15 +69,24 @@ class Tournament:
             p2_pop : Player 2 population to compete in the tournament
 
         Return:
-            Two lists, each containing the "best" Player 1s and Player 2s, respectively
+            Two lists or populations, each containing the "best" Player 1s and Player 2s, respectively
         """
-        # Create lists to hold the "best" players
-        best_p1s = self.eliminate(p1_pop, p2_pop, True)
-        best_p2s = self.eliminate(p2_pop, p1_pop, False)
+        # Every match seed is drawn from a single master seed, so the outcome
+        # does not depend on how many workers the matches are spread across
+        seed = self.seed if self.seed is not None else random.randrange(MAX_SEED)
+        rng = random.Random(seed)
+
+        if self.round_robin:
+            return self.compete_round_robin(p1_pop, p2_pop, rng)
+
+        # Find the "best" players; they are only gathered once both rounds are
+        # tallied, since the second round adds to the Player 1s' counters too
+        best_p1s = self.survivors(p1_pop, p2_pop, True, rng)
+        best_p2s = self.survivors(p2_pop, p1_pop, False, rng)
 
-        return sorted(best_p1s, reverse=True), sorted(best_p2s, reverse=True)
+        return pl.ranked(pl.select(p1_pop, best_p1s)), pl.ranked(pl.select(p2_pop, best_p2s))
 
-    def eliminate(self, player_pop, opponent_pop, player_is_p1):
+    def eliminate(self, player_pop, opponent_pop, player_is_p1, rng = None):
         """
         Competes all players against a random sample of opponents and eliminates
         players who do not meet the fitness criteria.
@@ -57,33 +95,324 @@ class Tournament:
             player_pop : Population of players to compete
             opponent_pop : Population of opponents to sample from
             player_is_p1 : Whether the `player_pop` is a Player 1 population
+            rng : (Optional) Random number generator used to schedule matches
 
         Return:
             A list of the "elite" players who passed the fitness criteria.
         """
-        # Create a list of elite/best players
-        elite = []
+        return pl.select(player_pop, self.survivors(player_pop, opponent_pop, player_is_p1, rng))
 
-        for player in player_pop:
+    def survivors(self, player_pop, opponent_pop, player_is_p1, rng = None):
+        """
+        Competes all players against a random sample of opponents, like `eliminate()`,
+        and finds the players who meet the fitness criteria.
+
+        Args:
+            player_pop : Population of players to compete
+            opponent_pop : Population of opponents to sample from
+            player_is_p1 : Whether the `player_pop` is a Player 1 population
+            rng : (Optional) Random number generator used to schedule matches
+
+        Return:
+            An array of the positions of the players who passed the fitness criteria
+        """
+        if rng is None:
+            rng = random.Random(self.seed if self.seed is not None else random.randrange(MAX_SEED))
+
+        matches = self.schedule(player_pop, opponent_pop, rng)
+
+        # Order each pairing based on p1/p2 status
+        if player_is_p1:
+            p1_pop, p2_pop = player_pop, opponent_pop
+            pairings = matches
+        else:
+            p1_pop, p2_pop = opponent_pop, player_pop
+            pairings = [(opponent, player, seed) for player, opponent, seed in matches]
+
+        p1_wins = self.play_matches(p1_pop, p2_pop, pairings)
+        merge_tallies(p1_pop, p2_pop, pairings, p1_wins)
+
+        # Only keep players whose fitness at least the threshold
+        return np.flatnonzero(pl.fitness(player_pop) >= self.fitness)
+
+    def compete_round_robin(self, p1_pop, p2_pop, rng):
+        """
+        Plays every pairing between both populations once, or the pairings of
+        randomly matched blocks of players, into the `outcomes` matrix.
+        Tallies, fitness and ranking are then computed over whole rows and
+        columns of the matrix at once.
+
+        Args:
+            p1_pop : Player 1 population to compete in the tournament
+            p2_pop : Player 2 population to compete in the tournament
+            rng : Random number generator used to schedule matches
+
+        Return:
+            Two lists, each containing the "best" Player 1s and Player 2s, respectively
+        """
+        if self.block_size is None:
+            pairings = [(i, j, rng.randrange(MAX_SEED)) for i in range(len(p1_pop)) for j in range(len(p2_pop))]
+        else:
+            pairings = self.schedule_blocks(len(p1_pop), len(p2_pop), rng)
+
+        p1_wins = self.play_matches(p1_pop, p2_pop, pairings)
+
+        self.outcomes = np.zeros((len(p1_pop), len(p2_pop)), dtype=np.int8)
+        if pairings:
+            rows, cols, _ = zip(*pairings)
+            self.outcomes[rows, cols] = np.where(np.fromiter(p1_wins, dtype=bool, count=len(pairings)), 1, -1)
+
+        won = self.outcomes == 1
+        lost = self.outcomes == -1
+
+        best_p1s = rank(p1_pop, won.sum(axis=1), lost.sum(axis=1), self.fitness)
+        best_p2s = rank(p2_pop, lost.sum(axis=0), won.sum(axis=0), self.fitness)
+
+        return best_p1s, best_p2s
+
+    def schedule_blocks(self, num_p1, num_p2, rng):
+        """
+        Splits both populations into blocks of `block_size` consecutive players
+        and pairs every block of Player 1s with enough blocks of Player 2s for
+        each player to face at least `min_games` opponents. Blocks of Player 2s
+        are dealt out in a random order, cycling through all of them, so every
+        block of Player 2s is paired about equally often. Every pairing within
+        two paired blocks is played, so the outcome matrix is filled in dense tiles.
+
+        Args:
+            num_p1 : Size of the Player 1 population
+            num_p2 : Size of the Player 2 population
+            rng : Random number generator used to pair blocks and draw seeds
+
+        Return:
+            A list of `(p1 index, p2 index, seed)` tuples
+        """
+        size = self.block_size
+        p2_blocks = rng.sample(range(0, num_p2, size), -(-num_p2 // size))
+        per_block = min(len(p2_blocks), -(-self.min_games // size))
+
+        pairings = []
+        for block, start in enumerate(range(0, num_p1, size)):
+            for k in range(per_block):
+                col_start = p2_blocks[(block * per_block + k) % len(p2_blocks)]
+                for i in range(start, min(start + size, num_p1)):
+                    for j in range(col_start, min(col_start + size, num_p2)):
+                        pairings.append((i, j, rng.randrange(MAX_SEED)))
+
+        return pairings
+
+    def schedule(self, player_pop, opponent_pop, rng):
+        """
+        Samples the opponents every player must face and assigns every match
+        its own seed.
+
+        Args:
+            player_pop : Population of players to compete
+            opponent_pop : Population of opponents to sample from
+            rng : Random number generator used to sample opponents and seeds
+
+        Return:
+            A list of `(player index, opponent index, seed)` tuples
+        """
+        matches = []
+        for i in range(len(player_pop)):
             # Get a random sample of opponents
             # The sample should be the smaller of the two:
             #   - Number of opponents available
             #   - The minimum games specified
-            opponent_sample = sample(opponent_pop, min(len(opponent_pop), self.min_games))
+            opponent_sample = rng.sample(range(len(opponent_pop)), min(len(opponent_pop), self.min_games))
 
             # Every player must play every opponent in the sample
-            for opponent in opponent_sample:
-                # Order the players based on p1/p2 status
-                players = [player, opponent] if player_is_p1 else [opponent, player]
+            for j in opponent_sample:
+                matches.append((i, j, rng.randrange(MAX_SEED)))
+
+        return matches
+
+    def play_matches(self, p1_pop, p2_pop, pairings):
+        """
+        Plays every pairing, reusing cached outcomes of pairings between
+        deterministic strategies wherever possible.
+
+        Args:
+            p1_pop : Player 1 population
+            p2_pop : Player 2 population
+            pairings : A list of `(p1 index, p2 index, seed)` tuples
+
+        Return:
+            A list of booleans; True wherever Player 1 won the pairing
+        """
+        if self.cache is None:
+            return self.play_uncached(p1_pop, p2_pop, pairings)
+
+        p1_strats = [player.strategy for player in p1_pop]
+        p2_strats = [player.strategy for player in p2_pop]
+
+        results = []
+        keys = []
+        uncached = []
+        for n, (i, j, _) in enumerate(pairings):
+            key = self.cache.key(p1_strats[i], p2_strats[j], self.ruleset_id)
+            p1_won = self.cache.get(key) if key is not None else None
+
+            if p1_won is None:
+                uncached.append(n)
+                keys.append(key)
+
+            results.append(p1_won)
+
+        played = self.play_uncached(p1_pop, p2_pop, [pairings[n] for n in uncached])
+
+        for n, key, p1_won in zip(uncached, keys, played):
+            results[n] = p1_won
+            if key is not None:
+                self.cache.put(key, p1_won)
+
+        return results
+
+    def play_uncached(self, p1_pop, p2_pop, pairings):
+        """
+        Plays every pairing, either through the batch engine, on this
+        tournament's board, or sharded across a pool of worker processes.
+
+        Args:
+            p1_pop : Player 1 population
+            p2_pop : Player 2 population
+            pairings : A list of `(p1 index, p2 index, seed)` tuples
+
+        Return:
+            A list of booleans; True wherever Player 1 won the pairing
+        """
+        if not pairings:
+            return []
+
+        # Players of a `Population` build their strategy when it is read, so read each once
+        p1_strats = [player.strategy for player in p1_pop]
+        p2_strats = [player.strategy for player in p2_pop]
+
+        if self.engine is not None:
+            return list(self.engine.play_matches(p1_strats, p2_strats, pairings))
+
+        if self.workers <= 1 or len(pairings) < 2:
+            return [play_match(self.referee, self.board, p1_strats[i], p2_strats[j], seed,
+                    self.profiler) for i, j, seed in pairings]
+
+        # Split the pairings into one contiguous shard per worker
+        shard_size = -(-len(pairings) // self.workers)
+        shards = [pairings[k:k + shard_size] for k in range(0, len(pairings), shard_size)]
+
+        with ProcessPoolExecutor(max_workers=len(shards), initializer=_init_worker,
+                initargs=(self.ruleset, p1_strats, p2_strats)) as executor:
+            results = executor.map(_play_shard, shards)
+
+            # Each shard comes back as one byte per pairing
+            return [won == 1 for shard in results for won in shard]
+
+def play_match(referee, board, p1_strat, p2_strat, seed, profiler = None):
+    """
+    Plays a single seeded game between two strategies without disturbing the
+    global random state or any player's win/loss counters.
+
+    Args:
+        referee : The referee moderating the game
+        board : The board to play on
+        p1_strat : Strategy of Player 1
+        p2_strat : Strategy of Player 2
+        seed : Seed for any randomness used during the game
+        profiler : (Optional) A `Profiler` to time the game with
+
+    Return:
+        True if Player 1 won the game, else False
+    """
+    # Stand-in players, so only the returned tally reaches the real players
+    p1 = p.Player("Player 1", p1_strat)
+    p2 = p.Player("Player 2", p2_strat)
+
+    state = random.getstate()
+    random.seed(seed)
+
+    # At present, we don't need the board's data, so we throw it away
+    _ = g.Game(referee, board, [p1, p2], profiler).play()
+
+    random.setstate(state)
+
+    return p1.wins > 0
+
+def rank(pop, wins, losses, threshold):
+    """
+    Adds a tournament's wins and losses to a population's counters, then keeps
+    the players whose fitness is at least the threshold, fittest first.
+
+    Args:
+        pop : The population
+        wins : Array of the wins of every player in the tournament
+        losses : Array of the losses of every player in the tournament
+        threshold : Fitness needed for a player to survive
+
+    Return:
+        The surviving players, sorted by fitness from highest to lowest;
+        a `Population` if `pop` is one, else a list
+    """
+    pl.add_tallies(pop, wins, losses)
+    fitness = pl.fitness(pop)
+
+    # A stable sort keeps tied players in population order, like `sorted()`
+    order = np.argsort(-fitness, kind="stable")
+    order = order[fitness[order] >= threshold]
+
+    return pl.select(pop, order)
+
+def merge_tallies(p1_pop, p2_pop, pairings, p1_wins):
+    """
+    Merges match outcomes into the win/loss counters of both populations.
+
+    Args:
+        p1_pop : Player 1 population
+        p2_pop : Player 2 population
+        pairings : A list of `(p1 index, p2 index, seed)` tuples
+        p1_wins : A list of booleans; True wherever Player 1 won the pairing
+    """
+    if not pairings:
+        return
+
+    rows, cols, _ = zip(*pairings)
+    won = np.fromiter(p1_wins, dtype=bool, count=len(pairings))
+    lost = ~won
+
+    # Count every player's wins and losses, then add them all at once
+    pl.add_tallies(p1_pop, np.bincount(rows, weights=won, minlength=len(p1_pop)).astype(np.int64),
+            np.bincount(rows, weights=lost, minlength=len(p1_pop)).astype(np.int64))
+    pl.add_tallies(p2_pop, np.bincount(cols, weights=lost, minlength=len(p2_pop)).astype(np.int64),
+            np.bincount(cols, weights=won, minlength=len(p2_pop)).astype(np.int64))
+
+# Board, referee and strategies owned by a worker process
+_worker = {}
+
+def _init_worker(ruleset, p1_strats, p2_strats):
+    """
+    Gives a worker process its own board, referee and copies of the strategies.
+
+    Args:
+        ruleset : The ruleset of the game in the tournament
+        p1_strats : Strategies of the Player 1 population
+        p2_strats : Strategies of the Player 2 population
+    """
+    board = ruleset.create_board(record=False)
+    _worker["board"] = board
+    _worker["referee"] = r.Referee(board, ruleset)
+    _worker["p1_strats"] = p1_strats
+    _worker["p2_strats"] = p2_strats
 
-                # Create and play the game
-                game = g.Game(self.referee, self.board, players)
+def _play_shard(shard):
+    """
+    Plays a shard of pairings inside a worker process.
 
-                # At present, we don't need this data, so we throw it away
-                _ = game.play()
+    Args:
+        shard : A list of `(p1 index, p2 index, seed)` tuples
 
-            # Only append players whose fitness at least the threshold
-            if player.fitness() >= self.fitness:
-                elite.append(player)
+    Return:
+        A bytes object holding 1 wherever Player 1 won the pairing, else 0
+    """
+    referee, board = _worker["referee"], _worker["board"]
+    p1_strats, p2_strats = _worker["p1_strats"], _worker["p2_strats"]
 
-        return elite
+    return bytes(play_match(referee, board, p1_strats[i], p2_strats[j], seed) for i, j, seed in shard)
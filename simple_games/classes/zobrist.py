@@ -0,0 +1,130 @@
+##
+# Zobrist hashing of board states.
+# A state is described by features (a vertex, a direction, a pile of
+# toothpicks) that each take one of a few values (a color, a position, a
+# count). Every (feature, value) pair is given a random 64-bit number, and the
+# key of a state is the XOR of the numbers of its pairs. When a move changes
+# one feature, the key is updated in constant time by XORing out the old
+# value's number and XORing in the new one's.
+#
+# The numbers are derived from their feature and value by a fixed mixing
+# function rather than drawn from a random generator, so every process
+# computes the same keys, and keys can be saved or compared across runs.
+# Keys describe positions only, not whose turn it is.
+#
+# Date: 2026-10-18
+##
+
+from functools import lru_cache
+
+# Keys are 64-bit unsigned integers
+MASK = (1 << 64) - 1
+
+# Seed that every number is derived from
+SEED = 0x5A0B2157
+
+def mix(x):
+    """
+    Scrambles a 64-bit integer (the splitmix64 finalizer).
+    Distinct inputs always give distinct outputs.
+
+    Args:
+        x : The integer to scramble
+
+    Return:
+        The scrambled integer
+    """
+    x = (x + 0x9E3779B97F4A7C15) & MASK
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK
+
+    return x ^ (x >> 31)
+
+class ZobristTable:
+
+    def __init__(self, num_features, num_values):
+        """
+        Creates the numbers of every pair of a feature and a value.
+        Values beyond `num_values` still have numbers; they are just not precomputed.
+
+        Args:
+            num_features : Number of features of a state
+            num_values : Number of values each feature usually takes, from 0
+        """
+        self.num_features = num_features
+        self.num_values = num_values
+        self.table = [[self.number(feature, value) for value in range(num_values)]
+                for feature in range(num_features)]
+
+    def number(self, feature, value):
+        """
+        Computes the number of a pair of a feature and a value.
+
+        Args:
+            feature : Index of the feature
+            value : The feature's value, a non-negative integer below 2 ** 32
+
+        Return:
+            The pair's 64-bit number
+        """
+        return mix(SEED ^ (feature << 32) ^ value)
+
+    def value(self, feature, value):
+        """
+        Looks up the number of a pair of a feature and a value.
+
+        Args:
+            feature : Index of the feature
+            value : The feature's value
+
+        Return:
+            The pair's 64-bit number
+        """
+        row = self.table[feature]
+
+        return row[value] if value < len(row) else self.number(feature, value)
+
+    def delta(self, feature, old, new):
+        """
+        Computes what a key must be XORed with when a feature changes value.
+
+        Args:
+            feature : Index of the feature
+            old : The feature's value before the change
+            new : The feature's value after the change
+
+        Return:
+            The number to XOR the key with
+        """
+        return self.value(feature, old) ^ self.value(feature, new)
+
+    def key(self, values):
+        """
+        Computes the key of a state from scratch.
+
+        Args:
+            values : The value of every feature, in order
+
+        Return:
+            The state's 64-bit key
+        """
+        key = 0
+        for feature, value in enumerate(values):
+            key ^= self.value(feature, value)
+
+        return key
+
+@lru_cache(maxsize=None)
+def table(num_features, num_values):
+    """
+    Gets the shared table of a number of features and values.
+    Tables are deterministic, so every board of the same shape can share one.
+
+    Args:
+        num_features : Number of features of a state
+        num_values : Number of values each feature usually takes, from 0
+
+    Return:
+        A `ZobristTable`
+    """
+    return ZobristTable(num_features, num_values)
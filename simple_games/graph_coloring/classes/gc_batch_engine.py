@@ -0,0 +1,185 @@
+##
+# Batched Graph Coloring Engine
+# Plays many graph coloring games at once between order-based strategies
+# (such as `GCDataStrategy` and `GCRandomInitStrategy`).
+# Every game is a row of a `(N, V)` color matrix played against one shared
+# adjacency matrix, so each half-move is a handful of array operations for all
+# `N` games instead of `N` Python loops over `board.state`.
+# The outcome of every game is identical to playing it with `Game.play`.
+#
+# Date: 2026-10-18
+##
+
+import numpy as np
+
+class GCBatchEngine:
+
+    def __init__(self, ruleset, batch_size = 4096):
+        """
+        Engine constructor.
+
+        Args:
+            ruleset : The graph coloring ruleset the games are played under
+            batch_size : (Optional) Maximum number of games held in memory at once
+        """
+        self.ruleset = ruleset
+        self.batch_size = batch_size
+        self.num_vertices = len(ruleset.initial_state)
+        self.bounds = ruleset.bounds
+
+        # Dense adjacency matrix shared by every game
+        self.adj = np.zeros((self.num_vertices, self.num_vertices), dtype=bool)
+        for vtx, vertex in enumerate(ruleset.initial_state):
+            self.adj[vtx, list(vertex["adj"])] = True
+
+    def encode(self, strategies):
+        """
+        Stacks the vertex and color orderings of order-based strategies.
+
+        Args:
+            strategies : A list of strategies with "vertices" and "colors" data
+
+        Return:
+            A tuple of `(vertex orders, color orders)` integer matrices
+        """
+        vertices = np.array([list(strat.data["vertices"]) for strat in strategies], dtype=np.int64)
+        colors = np.array([list(strat.data["colors"]) for strat in strategies], dtype=np.int64)
+
+        if vertices.ndim != 2 or colors.ndim != 2:
+            raise ValueError("All strategies must have orderings of the same length")
+
+        return vertices, colors
+
+    def play_matches(self, p1_strats, p2_strats, pairings):
+        """
+        Plays every pairing between two lists of strategies.
+
+        Args:
+            p1_strats : Strategies of the Player 1 population
+            p2_strats : Strategies of the Player 2 population
+            pairings : A list of `(p1 index, p2 index, ...)` tuples
+
+        Return:
+            A boolean array; True wherever Player 1 won the pairing
+        """
+        p1_vertices, p1_colors = self.encode(p1_strats)
+        p2_vertices, p2_colors = self.encode(p2_strats)
+
+        p1_idx = np.array([pairing[0] for pairing in pairings], dtype=np.int64)
+        p2_idx = np.array([pairing[1] for pairing in pairings], dtype=np.int64)
+
+        return self.play((p1_vertices[p1_idx], p1_colors[p1_idx]),
+                (p2_vertices[p2_idx], p2_colors[p2_idx]))
+
+    def play(self, p1_orders, p2_orders):
+        """
+        Plays one game per row of the provided orderings, in batches.
+
+        Args:
+            p1_orders : A tuple of `(vertex orders, color orders)` for Player 1
+            p2_orders : A tuple of `(vertex orders, color orders)` for Player 2
+
+        Return:
+            A boolean array; True wherever Player 1 won the game
+        """
+        num_games = len(p1_orders[0])
+        p1_wins = np.empty(num_games, dtype=bool)
+
+        for start in range(0, num_games, self.batch_size):
+            batch = slice(start, start + self.batch_size)
+            p1_wins[batch] = self.play_batch(
+                    (p1_orders[0][batch], p1_orders[1][batch]),
+                    (p2_orders[0][batch], p2_orders[1][batch]))
+
+        return p1_wins
+
+    def play_batch(self, p1_orders, p2_orders):
+        """
+        Plays one game per row of the provided orderings, all at once.
+        Mirrors `Game.play`: the game-over check comes before every move, and a
+        player who cannot propose a legal move loses immediately.
+
+        Args:
+            p1_orders : A tuple of `(vertex orders, color orders)` for Player 1
+            p2_orders : A tuple of `(vertex orders, color orders)` for Player 2
+
+        Return:
+            A boolean array; True wherever Player 1 won the game
+        """
+        num_games = len(p1_orders[0])
+        rows = np.arange(num_games)
+
+        # Color 0 means uncolored; make room for any color a strategy may propose
+        num_colors = max(self.bounds, p1_orders[1].max(initial=0), p2_orders[1].max(initial=0)) + 1
+
+        colors = np.zeros((num_games, self.num_vertices), dtype=np.int64)
+        # forbidden[n, v, c] is True if a neighbor of `v` is colored `c` in game `n`
+        forbidden = np.zeros((num_games, self.num_vertices, num_colors), dtype=bool)
+
+        active = np.ones(num_games, dtype=bool)
+        p1_wins = np.zeros(num_games, dtype=bool)
+
+        orders = (p1_orders, p2_orders)
+        turn = 0
+        while active.any():
+            # Game over check for every game still in progress
+            uncolored = colors == 0
+            colored = ~uncolored.any(axis=1)
+            dead = (uncolored & forbidden[:, :, 1:self.bounds + 1].all(axis=2)).any(axis=1)
+            over = active & (colored | dead)
+
+            # Player 1 wins if and only if the graph is fully colored
+            p1_wins[over] = colored[over]
+            active &= ~over
+            if not active.any():
+                break
+
+            # Every still-active game asks the current player for a move
+            vertex_order, color_order = orders[turn]
+            vtx, color, found = self.choose_moves(colors, forbidden, vertex_order, color_order)
+
+            # A missing or illegal move loses the game for the current player
+            legal = found & (colors[rows, vtx] == 0) & ~forbidden[rows, vtx, color]
+            lost = active & ~legal
+            p1_wins[lost] = turn == 1
+            active &= ~lost
+
+            # Apply the moves of the games that continue
+            moving = np.flatnonzero(active)
+            colors[moving, vtx[moving]] = color[moving]
+            forbidden[moving, :, color[moving]] |= self.adj[vtx[moving]]
+
+            turn = 1 - turn
+
+        return p1_wins
+
+    def choose_moves(self, colors, forbidden, vertex_order, color_order):
+        """
+        Picks the move each order-based strategy would make: the first uncolored
+        vertex in its vertex ordering with an available color, colored with the
+        first available color in its color ordering.
+
+        Args:
+            colors : The `(N, V)` color matrix
+            forbidden : The `(N, V, C)` forbidden color tensor
+            vertex_order : The `(N, V)` vertex orderings of the moving players
+            color_order : The `(N, K)` color orderings of the moving players
+
+        Return:
+            A tuple of `(vertices, colors, found)` arrays, one entry per game
+        """
+        rows = np.arange(len(colors))
+
+        # available[n, v, j] is True if the j-th color in the ordering fits `v`
+        color_index = np.broadcast_to(color_order[:, None, :],
+                (len(colors), self.num_vertices, color_order.shape[1]))
+        available = ~np.take_along_axis(forbidden, color_index, axis=2)
+
+        playable = (colors == 0) & available.any(axis=2)
+        playable_in_order = np.take_along_axis(playable, vertex_order, axis=1)
+
+        found = playable_in_order.any(axis=1)
+        vtx = vertex_order[rows, playable_in_order.argmax(axis=1)]
+        color = color_order[rows, available[rows, vtx].argmax(axis=1)]
+
+        return vtx, color, found
@@ -0,0 +1,349 @@
+##
+# Graph Coloring Bitboard
+# A board for the graph coloring game that keeps the whole coloring in a few
+# integers used as bitmasks, where bit `v` stands for vertex `v`:
+#   - `uncolored` has a bit set for every uncolored vertex
+#   - `color_masks[c]` has a bit set for every vertex colored `c`
+#   - `blocked[c]` has a bit set for every vertex next to a vertex colored `c`,
+#     which therefore cannot be colored `c`
+# Together with the topology's `neighbor_masks`, legality, end-game checks and
+# finding a playable vertex are each a handful of ANDs and ORs, however many
+# vertices the graph has. Graphs of up to 64 vertices fit in a machine word,
+# but Python's integers let the same code handle larger graphs.
+#
+# `state` is built from the masks when it is read, for strategies and tools
+# that expect a list of `{"color", "adj"}` vertices; strategies that only use
+# `ordered_move()` and `legal_moves()` never pay for it.
+# `key` is the Zobrist key of the coloring, with one feature per vertex, and
+# matches the key of a `GCBoard` with the same coloring.
+#
+# Date: 2026-10-18
+##
+
+import sys
+sys.path.append("../..")
+from classes.board import Board
+from classes import move_log as ml
+from classes import zobrist
+from graph_coloring.classes.gc_topology import GCTopology
+
+class GCBitBoard(Board):
+
+    def __init__(self, initial_state = None, bounds = None, record = True, topology = None, rules = None):
+        """
+        The board constructor initializes the game state and its bitmasks.
+
+        Args:
+            initial_state : The initial graph, as a list of `{"color", "adj"}` vertices
+            bounds : The number of colors available in the game
+            record : (Optional) Whether to keep a history of the moves made
+            topology : (Optional) The graph's shared topology; built from `initial_state` if omitted
+            rules : (Optional) The ruleset of the game, used to list legal moves
+        """
+        self.topology = topology if topology is not None else GCTopology.from_state(initial_state)
+        self.bounds = bounds
+        self.game_colors = tuple(range(1, bounds + 1))
+        self.zobrist = zobrist.table(self.topology.num_vertices, bounds + 1)
+
+        # Setting `state` loads the initial coloring into the masks
+        super().__init__(initial_state, bounds, record, rules)
+
+        # A game never lasts longer than one move per vertex
+        self.log = ml.MoveLog(self.topology.num_vertices, record)
+
+        # Snapshot of the initial masks that every reset restores
+        self.initial_masks = (self.uncolored, list(self.color_masks), list(self.blocked))
+        self.key = self.initial_key = self.zobrist.key(self.colors)
+
+    @property
+    def state(self):
+        """
+        The coloring as a list of `{"color", "adj"}` vertices, built from the
+        masks the first time it is read after a move.
+
+        Return:
+            The board's state
+        """
+        if self.state_cache is None:
+            adjacency = self.initial_state
+            self.state_cache = [{"color": color, "adj": vertex["adj"]}
+                    for color, vertex in zip(self.colors, adjacency)]
+
+        return self.state_cache
+
+    @state.setter
+    def state(self, state):
+        """
+        Loads a coloring, given as a list of `{"color", "adj"}` vertices, into the masks.
+
+        Args:
+            state : The coloring to load
+        """
+        self.load([vertex["color"] for vertex in state])
+
+    @property
+    def colors(self):
+        """
+        The color of every vertex; 0 for uncolored vertices.
+
+        Return:
+            A list of colors, one per vertex
+        """
+        colors = [0] * self.topology.num_vertices
+        for color, mask in enumerate(self.color_masks):
+            while mask:
+                low = mask & -mask
+                colors[low.bit_length() - 1] = color
+                mask ^= low
+
+        return colors
+
+    def load(self, colors):
+        """
+        Rebuilds the masks from the color of every vertex.
+
+        Args:
+            colors : A list of colors, one per vertex; 0 for uncolored vertices
+        """
+        neighbor_masks = self.topology.neighbor_masks
+        num_colors = max([self.bounds] + list(colors)) + 1
+
+        self.uncolored = 0
+        self.color_masks = [0] * num_colors
+        self.blocked = [0] * num_colors
+
+        for vtx, color in enumerate(colors):
+            if color == 0:
+                self.uncolored |= 1 << vtx
+            else:
+                self.color_masks[color] |= 1 << vtx
+                self.blocked[color] |= neighbor_masks[vtx]
+
+        self.key = self.zobrist.key(colors)
+        self.cursors = {}
+        self.state_cache = None
+        self.moves = None
+
+    def reset(self):
+        """
+        Resets the board to its original state, by restoring a few integers.
+        """
+        uncolored, color_masks, blocked = self.initial_masks
+        self.uncolored = uncolored
+        self.color_masks[:] = color_masks
+        self.blocked[:] = blocked
+        del self.color_masks[len(color_masks):]
+        del self.blocked[len(blocked):]
+
+        self.key = self.initial_key
+        self.cursors.clear()
+        self.state_cache = None
+        self.data = {}
+        self.log.clear()
+        self.moves = None
+
+    def dead(self):
+        """
+        Finds the uncolored vertices that can no longer be colored with any of the game's colors.
+
+        Return:
+            A mask of the dead vertices
+        """
+        dead = self.uncolored
+        blocked = self.blocked
+        for color in self.game_colors:
+            dead &= blocked[color]
+
+        return dead
+
+    def playable(self):
+        """
+        Finds the uncolored vertices that can still be colored with one of the game's colors.
+
+        Return:
+            A mask of the playable vertices
+        """
+        return self.uncolored & ~self.dead()
+
+    def is_legal(self, vtx, color):
+        """
+        Determines if a vertex can be colored with a given color.
+
+        Args:
+            vtx : The vertex to color
+            color : The color to use
+
+        Return:
+            True if the vertex is uncolored and no neighbor has that color, else False
+        """
+        blocked = self.blocked
+        return (color >= 1 and self.uncolored >> vtx & 1 == 1
+                and (color >= len(blocked) or not blocked[color] >> vtx & 1))
+
+    def is_game_over(self):
+        """
+        Determines if the game is over.
+
+        Return:
+            True if every vertex is colored or some vertex cannot be colored, else False
+        """
+        return self.uncolored == 0 or self.dead() != 0
+
+    def is_colored(self):
+        """
+        Determines if the graph is fully colored.
+
+        Return:
+            True if there are no uncolored vertices, else False
+        """
+        return self.uncolored == 0
+
+    def color_vertex(self, vtx, color):
+        """
+        Colors a vertex and updates the masks.
+
+        Args:
+            vtx : The vertex to color
+            color : The color to use
+        """
+        # A vertex may still be colored with a color beyond the game's bounds
+        while color >= len(self.color_masks):
+            self.color_masks.append(0)
+            self.blocked.append(0)
+
+        bit = 1 << vtx
+        row = self.zobrist.table[vtx]
+        self.key ^= row[0] ^ row[color] if color < len(row) else self.zobrist.delta(vtx, 0, color)
+        self.uncolored &= ~bit
+        self.color_masks[color] |= bit
+        self.blocked[color] |= self.topology.neighbor_masks[vtx]
+        self.state_cache = None
+
+    def generate_moves(self):
+        """
+        Generates every legal move, by vertex and then by color.
+
+        Return:
+            A list of `{"vertex", "color"}` moves
+        """
+        blocked = self.blocked
+        colors = self.game_colors
+
+        moves = []
+        mask = self.uncolored
+        while mask:
+            low = mask & -mask
+            vtx = low.bit_length() - 1
+            mask ^= low
+
+            moves.extend({"vertex": vtx, "color": color} for color in colors if not blocked[color] & low)
+
+        return moves
+
+    def ordered_move(self, vertices, colors):
+        """
+        Finds the move an order-based strategy makes: the first vertex in its
+        vertex ordering that can be colored, colored with the first legal color
+        in its color ordering.
+        Colored vertices are skipped with a single bit test each.
+        The search resumes from where the last search with the same orderings
+        stopped, as vertices it skipped can never be colored with them again,
+        so a whole game costs one pass over the ordering.
+
+        Args:
+            vertices : The strategy's vertex ordering
+            colors : The strategy's color ordering
+
+        Return:
+            A `{"vertex", "color"}` move, or None if no move is available
+        """
+        orderings = (id(vertices), id(colors))
+        entry = self.cursors.get(orderings)
+        if entry is None or entry[0] is not vertices or entry[1] is not colors:
+            entry = self.cursors[orderings] = [vertices, colors, 0]
+
+        uncolored = self.uncolored
+        blocked = self.blocked
+
+        cursor = entry[2]
+        while cursor < len(vertices):
+            vtx = vertices[cursor]
+            if uncolored >> vtx & 1:
+                for color in colors:
+                    if color >= len(blocked) or not blocked[color] >> vtx & 1:
+                        entry[2] = cursor
+                        return {"vertex": vtx, "color": color}
+
+            cursor += 1
+
+        entry[2] = cursor
+        return None
+
+    def play_orders(self, p1_orders, p2_orders):
+        """
+        Plays a whole game between two order-based strategies from the initial
+        coloring, on masks held in local variables, without going through a
+        `Game`, a `Referee` or the board's own masks, which are left untouched.
+        Mirrors `Game.play`: the game-over check comes before every move, every
+        move is the one `ordered_move()` would find, and a player who cannot
+        propose a legal move loses immediately.
+
+        Args:
+            p1_orders : A tuple of `(vertex ordering, color ordering)` for Player 1
+            p2_orders : A tuple of `(vertex ordering, color ordering)` for Player 2
+
+        Return:
+            True if Player 1 won the game, else False
+        """
+        uncolored, _, blocked = self.initial_masks
+        neighbor_masks = self.topology.neighbor_masks
+        game_colors = self.game_colors
+
+        # Make room for any color a strategy may propose
+        num_colors = max(len(blocked) - 1, max(p1_orders[1], default=0), max(p2_orders[1], default=0)) + 1
+        blocked = blocked + [0] * (num_colors - len(blocked))
+
+        # The initial coloring may already have left a vertex next to every color
+        changed = uncolored
+
+        orders = (p1_orders, p2_orders)
+        cursors = [0, 0]
+        turn = 0
+        while uncolored:
+            # Only the uncolored vertices next to the last move can have died; Player 2 wins if one did
+            dead = changed
+            for color in game_colors:
+                dead &= blocked[color]
+                if not dead:
+                    break
+            if dead:
+                return False
+
+            # Resume the current player's search where its last one stopped
+            vertices, colors = orders[turn]
+            cursor = cursors[turn]
+            move = None
+            while cursor < len(vertices):
+                vtx = vertices[cursor]
+                if uncolored >> vtx & 1:
+                    for color in colors:
+                        if not blocked[color] >> vtx & 1:
+                            move = color
+                            break
+                    if move is not None:
+                        break
+
+                cursor += 1
+
+            # A missing or illegal move loses the game for the current player
+            if move is None or move < 1:
+                return turn == 1
+
+            cursors[turn] = cursor
+            uncolored &= ~(1 << vtx)
+            blocked[move] |= neighbor_masks[vtx]
+            changed = neighbor_masks[vtx] & uncolored
+            turn ^= 1
+
+        # The graph is fully colored; Player 1 wins
+        return True
@@ -0,0 +1,58 @@
+##
+# Bitboard Graph Coloring Engine
+# Plays graph coloring games between order-based strategies (such as
+# `GCDataStrategy` and `GCRandomInitStrategy`) entirely on bitmasks.
+# Every game is played by `GCBitBoard.play_orders()`, which keeps the coloring
+# in a few local integers and finds every move with a mask scan, skipping the
+# per-move `Game`, `Referee`, hooks and `state` of a game played on a board.
+# The outcome of every game is identical to playing it with `Game.play`.
+#
+# Date: 2026-10-18
+##
+
+import sys
+sys.path.append("../..")
+from graph_coloring.classes.gc_bitboard import GCBitBoard
+
+class GCBitBoardEngine:
+
+    def __init__(self, ruleset):
+        """
+        Engine constructor.
+
+        Args:
+            ruleset : The graph coloring ruleset the games are played under
+        """
+        self.ruleset = ruleset
+        self.board = GCBitBoard(ruleset.initial_state, ruleset.bounds, False, ruleset.topology, ruleset)
+
+    def encode(self, strategies):
+        """
+        Reads the vertex and color orderings of order-based strategies.
+
+        Args:
+            strategies : A list of strategies with "vertices" and "colors" data
+
+        Return:
+            A list of `(vertex ordering, color ordering)` tuples of integers
+        """
+        return [(list(map(int, strat.data["vertices"])), list(map(int, strat.data["colors"])))
+                for strat in strategies]
+
+    def play_matches(self, p1_strats, p2_strats, pairings):
+        """
+        Plays every pairing between two lists of strategies.
+
+        Args:
+            p1_strats : Strategies of the Player 1 population
+            p2_strats : Strategies of the Player 2 population
+            pairings : A list of `(p1 index, p2 index, ...)` tuples
+
+        Return:
+            A list of booleans; True wherever Player 1 won the pairing
+        """
+        p1_orders = self.encode(p1_strats)
+        p2_orders = self.encode(p2_strats)
+
+        play_orders = self.board.play_orders
+        return [play_orders(p1_orders[pairing[0]], p2_orders[pairing[1]]) for pairing in pairings]
@@ -0,0 +1,234 @@
+##
+# Graph Coloring Board
+# A board for the graph coloring game that keeps incremental bookkeeping of the
+# coloring, so legality and end-game checks never rescan the whole graph.
+# For every vertex it tracks a bitmask of the colors used by its neighbors
+# (bit `c` is set if some neighbor is colored `c`), along with the number of
+# uncolored vertices and the number of "dead" vertices: uncolored vertices
+# that can no longer be colored with any of the game's colors.
+#
+# The graph's structure lives in a `GCTopology` shared by every board of that
+# graph. The only per-game state is the flat `colors` list and the bookkeeping
+# above, so resetting the board never copies the graph.
+# `state` is kept as a list of `{"color", "adj"}` vertices for strategies that
+# read it; it mirrors `colors` and shares the adjacency lists of the initial state.
+# `key` is the Zobrist key of the coloring, with one feature per vertex.
+#
+# Date: 2026-10-18
+##
+
+import sys
+sys.path.append("../..")
+from classes.board import Board
+from classes import move_log as ml
+from classes import zobrist
+from graph_coloring.classes.gc_topology import GCTopology
+
+class GCBoard(Board):
+
+    def __init__(self, initial_state = None, bounds = None, record = True, topology = None, rules = None):
+        """
+        The board constructor initializes the game state and its bookkeeping.
+
+        Args:
+            initial_state : The initial graph, as a list of `{"color", "adj"}` vertices
+            bounds : The number of colors available in the game
+            record : (Optional) Whether to keep a history of the moves made
+            topology : (Optional) The graph's shared topology; built from `initial_state` if omitted
+            rules : (Optional) The ruleset of the game, used to list legal moves
+        """
+        super().__init__(initial_state, bounds, record, rules)
+
+        self.topology = topology if topology is not None else GCTopology.from_state(initial_state)
+
+        # A game never lasts longer than one move per vertex
+        self.log = ml.MoveLog(self.topology.num_vertices, record)
+
+        # Bits 1 through `bounds` set; a vertex is dead once all of them are forbidden
+        self.full_mask = ((1 << bounds) - 1) << 1
+
+        self.state = [{"color": vertex["color"], "adj": vertex["adj"]} for vertex in initial_state]
+        self.colors = [vertex["color"] for vertex in initial_state]
+        self.recount()
+
+        self.zobrist = zobrist.table(self.topology.num_vertices, max([bounds] + self.colors) + 1)
+        self.key = self.zobrist.key(self.colors)
+
+        # Snapshot of the initial bookkeeping that every reset restores
+        self.initial_colors = list(self.colors)
+        self.initial_forbidden = list(self.forbidden)
+        self.initial_counts = (self.uncolored, self.dead)
+        self.initial_key = self.key
+
+        # Vertices colored since the last reset, in order
+        self.colored = []
+
+    def reset(self):
+        """
+        Resets the board to its original state.
+        Only the vertices colored during the game are touched, and nothing is allocated.
+        """
+        state = self.state
+        for vtx in self.colored:
+            state[vtx]["color"] = 0
+        self.colored.clear()
+
+        self.colors[:] = self.initial_colors
+        self.forbidden[:] = self.initial_forbidden
+        self.uncolored, self.dead = self.initial_counts
+        self.key = self.initial_key
+
+        self.cursors.clear()
+        self.data = {}
+        self.log.clear()
+        self.moves = None
+
+    def recount(self):
+        """
+        Rebuilds the bookkeeping from scratch using the current colors.
+        """
+        colors = self.colors
+        neighbors = self.topology.neighbors
+        self.forbidden = [0] * len(colors)
+        self.uncolored = 0
+
+        for vtx, color in enumerate(colors):
+            if color == 0:
+                self.uncolored += 1
+            else:
+                for neighbor in neighbors[vtx]:
+                    self.forbidden[neighbor] |= 1 << color
+
+        full = self.full_mask
+        self.dead = sum(1 for vtx, color in enumerate(colors)
+                if color == 0 and self.forbidden[vtx] & full == full)
+
+        # Cursors into the orderings of `ordered_move()`, which only hold while vertices are only ever colored
+        self.cursors = {}
+
+    def is_legal(self, vtx, color):
+        """
+        Determines if a vertex can be colored with a given color.
+        Runs in constant time.
+
+        Args:
+            vtx : The vertex to color
+            color : The color to use
+
+        Return:
+            True if the vertex is uncolored and no neighbor has that color, else False
+        """
+        return (color >= 1 and self.colors[vtx] == 0
+                and not self.forbidden[vtx] >> color & 1)
+
+    def generate_moves(self):
+        """
+        Generates every legal move, by vertex and then by color.
+        Runs in time proportional to the number of vertices times the number of colors.
+
+        Return:
+            A list of `{"vertex", "color"}` moves
+        """
+        colors = range(1, self.bounds + 1)
+        forbidden = self.forbidden
+
+        return [{"vertex": vtx, "color": color}
+                for vtx, vtx_color in enumerate(self.colors) if vtx_color == 0
+                for color in colors if not forbidden[vtx] >> color & 1]
+
+    def ordered_move(self, vertices, colors):
+        """
+        Finds the move an order-based strategy makes: the first vertex in its
+        vertex ordering that can be colored, colored with the first legal color
+        in its color ordering.
+        The search resumes from where the last search with the same orderings
+        stopped, as vertices it skipped can never be colored with them again,
+        so a whole game costs one pass over the ordering.
+
+        Args:
+            vertices : The strategy's vertex ordering
+            colors : The strategy's color ordering
+
+        Return:
+            A `{"vertex", "color"}` move, or None if no move is available
+        """
+        orderings = (id(vertices), id(colors))
+        entry = self.cursors.get(orderings)
+        if entry is None or entry[0] is not vertices or entry[1] is not colors:
+            entry = self.cursors[orderings] = [vertices, colors, 0]
+
+        board_colors = self.colors
+        forbidden = self.forbidden
+
+        cursor = entry[2]
+        while cursor < len(vertices):
+            vtx = vertices[cursor]
+            if board_colors[vtx] == 0:
+                for color in colors:
+                    if not forbidden[vtx] >> color & 1:
+                        entry[2] = cursor
+                        return {"vertex": vtx, "color": color}
+
+            cursor += 1
+
+        entry[2] = cursor
+        return None
+
+    def is_game_over(self):
+        """
+        Determines if the game is over.
+        Runs in constant time.
+
+        Return:
+            True if every vertex is colored or some vertex cannot be colored, else False
+        """
+        return self.uncolored == 0 or self.dead > 0
+
+    def is_colored(self):
+        """
+        Determines if the graph is fully colored.
+        Runs in constant time.
+
+        Return:
+            True if there are no uncolored vertices, else False
+        """
+        return self.uncolored == 0
+
+    def color_vertex(self, vtx, color):
+        """
+        Colors a vertex and updates the bookkeeping of its neighborhood.
+        Runs in time proportional to the degree of the vertex.
+
+        Args:
+            vtx : The vertex to color
+            color : The color to use
+        """
+        colors = self.colors
+        forbidden = self.forbidden
+        full = self.full_mask
+        bit = 1 << color
+
+        # A vertex may still be colored with a color beyond the game's bounds
+        if forbidden[vtx] & full == full:
+            self.dead -= 1
+
+        row = self.zobrist.table[vtx]
+        if color < len(row):
+            self.key ^= row[colors[vtx]] ^ row[color]
+        else:
+            self.key ^= self.zobrist.delta(vtx, colors[vtx], color)
+
+        colors[vtx] = color
+        self.state[vtx]["color"] = color
+        self.colored.append(vtx)
+        self.uncolored -= 1
+
+        for neighbor in self.topology.neighbors[vtx]:
+            mask = forbidden[neighbor]
+            if not mask & bit:
+                forbidden[neighbor] = mask | bit
+
+                # The neighbor just lost its last available color
+                if (colors[neighbor] == 0 and mask & full != full
+                        and (mask | bit) & full == full):
+                    self.dead += 1
@@ -0,0 +1,310 @@
+##
+# Graph Coloring Sparse Board
+# A board for the graph coloring game on large sparse graphs. The graph is read
+# from the topology's compressed sparse row arrays (`indptr` and `indices`),
+# and the whole per-game state lives in two small NumPy arrays:
+#   - `colors` holds the color of every vertex (0 for uncolored vertices), in
+#     one byte per vertex, or two if the initial coloring uses colors above 127
+#   - `forbidden` holds a bitmask per vertex of the colors used by its
+#     neighbors (bit `c` is set if some neighbor is colored `c`), in the
+#     narrowest unsigned type that fits the game's colors
+# along with the number of uncolored vertices and the number of "dead"
+# vertices, as in `GCBoard`. Coloring a vertex updates its neighborhood with a
+# few array operations, so moves cost time proportional to the vertex's degree
+# and legality and end-game checks take constant time, however large the graph.
+# A board takes a few bytes per vertex, and resetting it copies two arrays.
+#
+# Order-based strategies ask for their move through `ordered_move()`, which
+# keeps a cursor into every ordering it is given during a game: vertices
+# before the cursor are colored or cannot be colored with the ordering's
+# colors, which stays true until the board is reset, so a whole game costs
+# one pass over the ordering.
+#
+# `state` is built from `colors` when it is read, as in `GCBitBoard`.
+# `key` is the Zobrist key of the coloring, and matches the key of a `GCBoard`
+# with the same coloring.
+#
+# Date: 2026-10-18
+##
+
+import sys
+sys.path.append("../..")
+from classes.board import Board
+from classes import move_log as ml
+from classes import zobrist
+from graph_coloring.classes.gc_topology import GCTopology
+
+import numpy as np
+
+# Mask types by the number of bits they hold; colors beyond the widest are
+# checked against the colors of the neighbors instead
+MASK_TYPES = ((8, np.uint8), (16, np.uint16), (32, np.uint32), (64, np.uint64))
+
+class GCCSRBoard(Board):
+
+    def __init__(self, initial_state = None, bounds = None, record = True, topology = None, rules = None):
+        """
+        The board constructor initializes the game state and its bookkeeping.
+
+        Args:
+            initial_state : The initial graph, as a list of `{"color", "adj"}` vertices
+            bounds : The number of colors available in the game, at most 63
+            record : (Optional) Whether to keep a history of the moves made
+            topology : (Optional) The graph's shared topology; built from `initial_state` if omitted
+            rules : (Optional) The ruleset of the game, used to list legal moves
+        """
+        self.topology = topology if topology is not None else GCTopology.from_state(initial_state)
+        self.indptr, self.indices = self.topology.csr
+        self.num_vertices = self.topology.num_vertices
+
+        if bounds > 63:
+            raise ValueError("A sparse board supports at most 63 colors, not {}".format(bounds))
+
+        self.bounds = bounds
+        self.game_colors = np.arange(1, bounds + 1)
+        self.mask_bits, self.mask_type = next((bits, kind) for bits, kind in MASK_TYPES if bits > bounds)
+
+        # Colors take one byte each, unless the initial coloring uses larger ones
+        top = max([bounds] + [vertex["color"] for vertex in initial_state])
+        self.color_type = np.int8 if top <= np.iinfo(np.int8).max else np.int16
+        self.max_color = int(np.iinfo(self.color_type).max)
+
+        # Bits 1 through `bounds` set; a vertex is dead once all of them are forbidden
+        self.full_mask = ((1 << bounds) - 1) << 1
+        self.zobrist = zobrist.table(self.num_vertices, bounds + 1)
+
+        # Setting `state` loads the initial coloring and its bookkeeping
+        self.state_cache = None
+        super().__init__(initial_state, bounds, record, rules)
+
+        # A game never lasts longer than one move per vertex; no room is needed if nothing is recorded
+        self.log = ml.MoveLog(self.num_vertices if record else 1, record)
+
+        # Snapshot of the initial bookkeeping that every reset restores
+        self.initial_colors = self.colors.copy()
+        self.initial_forbidden = self.forbidden.copy()
+        self.initial_counts = (self.uncolored, self.dead)
+        self.key = self.initial_key = self.zobrist.key(self.colors.tolist())
+
+    @property
+    def state(self):
+        """
+        The coloring as a list of `{"color", "adj"}` vertices, built from
+        `colors` the first time it is read after a move.
+
+        Return:
+            The board's state
+        """
+        if self.state_cache is None:
+            self.state_cache = [{"color": color, "adj": vertex["adj"]}
+                    for color, vertex in zip(self.colors.tolist(), self.initial_state)]
+
+        return self.state_cache
+
+    @state.setter
+    def state(self, state):
+        """
+        Loads a coloring, given as a list of `{"color", "adj"}` vertices.
+
+        Args:
+            state : The coloring to load
+        """
+        self.load([vertex["color"] for vertex in state])
+
+    def load(self, colors):
+        """
+        Rebuilds the bookkeeping from the color of every vertex.
+
+        Args:
+            colors : A sequence of colors, one per vertex; 0 for uncolored vertices
+        """
+        self.colors = np.array(colors, dtype=self.color_type).reshape(self.num_vertices)
+        self.forbidden = np.zeros(self.num_vertices, dtype=self.mask_type)
+
+        # Every edge from a colored vertex forbids its color at the other end
+        sources = np.repeat(self.colors, np.diff(self.indptr))
+        tracked = (sources > 0) & (sources < self.mask_bits)
+        if tracked.any():
+            bits = np.left_shift(1, sources[tracked].astype(self.mask_type), dtype=self.mask_type)
+            np.bitwise_or.at(self.forbidden, self.indices[tracked], bits)
+
+        full = self.full_mask
+        uncolored = self.colors == 0
+        self.uncolored = int(np.count_nonzero(uncolored))
+        self.dead = int(np.count_nonzero(uncolored & ((self.forbidden & full) == full)))
+
+        self.key = self.zobrist.key(self.colors.tolist())
+        self.cursors = {}
+        self.state_cache = None
+        self.moves = None
+
+    def reset(self):
+        """
+        Resets the board to its original state, by copying back two arrays.
+        """
+        self.colors[:] = self.initial_colors
+        self.forbidden[:] = self.initial_forbidden
+        self.uncolored, self.dead = self.initial_counts
+        self.key = self.initial_key
+
+        self.cursors.clear()
+        self.state_cache = None
+        self.data = {}
+        self.log.clear()
+        self.moves = None
+
+    def neighbors(self, vtx):
+        """
+        Gets the neighbors of a vertex.
+
+        Args:
+            vtx : The vertex
+
+        Return:
+            An array of the vertex's neighbors; a view, not a copy
+        """
+        return self.indices[self.indptr[vtx]:self.indptr[vtx + 1]]
+
+    def is_free(self, vtx, color):
+        """
+        Determines if none of a vertex's neighbors has a given color.
+
+        Args:
+            vtx : The vertex
+            color : The color, at least 1
+
+        Return:
+            True if no neighbor has that color, else False
+        """
+        if color < self.mask_bits:
+            return not self.forbidden[vtx] >> color & 1
+
+        return not (self.colors[self.neighbors(vtx)] == color).any()
+
+    def is_legal(self, vtx, color):
+        """
+        Determines if a vertex can be colored with a given color.
+        Runs in constant time for the game's colors. Colors too large for
+        `colors` to hold are never legal.
+
+        Args:
+            vtx : The vertex to color
+            color : The color to use
+
+        Return:
+            True if the vertex is uncolored and no neighbor has that color, else False
+        """
+        return (1 <= color <= self.max_color and self.colors[vtx] == 0
+                and self.is_free(vtx, color))
+
+    def generate_moves(self):
+        """
+        Generates every legal move, by vertex and then by color.
+        The legal colors of every uncolored vertex are found in bulk.
+
+        Return:
+            A list of `{"vertex", "color"}` moves
+        """
+        uncolored = np.flatnonzero(self.colors == 0)
+        masks = self.forbidden[uncolored]
+        legal = (np.right_shift.outer(masks, self.game_colors.astype(self.mask_type)) & 1) == 0
+
+        rows, columns = np.nonzero(legal)
+        return [{"vertex": vtx, "color": color}
+                for vtx, color in zip(uncolored[rows].tolist(), self.game_colors[columns].tolist())]
+
+    def ordered_move(self, vertices, colors):
+        """
+        Finds the move an order-based strategy makes: the first vertex in its
+        vertex ordering that can be colored, colored with the first legal color
+        in its color ordering.
+        The search resumes from where the last search with the same orderings
+        stopped, as vertices it skipped can never be colored with them again.
+
+        Args:
+            vertices : The strategy's vertex ordering
+            colors : The strategy's color ordering
+
+        Return:
+            A `{"vertex", "color"}` move, or None if no move is available
+        """
+        orderings = (id(vertices), id(colors))
+        entry = self.cursors.get(orderings)
+        if entry is None or entry[0] is not vertices or entry[1] is not colors:
+            entry = self.cursors[orderings] = [vertices, colors, 0]
+
+        board_colors = self.colors
+        is_free = self.is_free
+
+        cursor = entry[2]
+        while cursor < len(vertices):
+            vtx = vertices[cursor]
+            if board_colors[vtx] == 0:
+                for color in colors:
+                    if is_free(vtx, color):
+                        entry[2] = cursor
+                        return {"vertex": vtx, "color": color}
+
+            cursor += 1
+
+        entry[2] = cursor
+        return None
+
+    def is_game_over(self):
+        """
+        Determines if the game is over.
+        Runs in constant time.
+
+        Return:
+            True if every vertex is colored or some vertex cannot be colored, else False
+        """
+        return self.uncolored == 0 or self.dead > 0
+
+    def is_colored(self):
+        """
+        Determines if the graph is fully colored.
+        Runs in constant time.
+
+        Return:
+            True if there are no uncolored vertices, else False
+        """
+        return self.uncolored == 0
+
+    def color_vertex(self, vtx, color):
+        """
+        Colors a vertex and updates the bookkeeping of its neighborhood.
+        Runs in time proportional to the degree of the vertex.
+
+        Args:
+            vtx : The vertex to color
+            color : The color to use
+        """
+        forbidden = self.forbidden
+        full = self.full_mask
+
+        # A vertex may still be colored with a color beyond the game's bounds
+        if forbidden[vtx] & full == full:
+            self.dead -= 1
+
+        old = int(self.colors[vtx])
+        row = self.zobrist.table[vtx]
+        if color < len(row):
+            self.key ^= row[old] ^ row[color]
+        else:
+            self.key ^= self.zobrist.delta(vtx, old, color)
+
+        self.colors[vtx] = color
+        self.uncolored -= 1
+        self.state_cache = None
+
+        if color < self.mask_bits:
+            bit = 1 << color
+            neighbors = self.neighbors(vtx)
+            masks = forbidden[neighbors]
+            forbidden[neighbors] = masks | bit
+
+            # Uncolored neighbors that just lost their last available color
+            if bit & full:
+                lost = (masks & full) == full ^ bit
+                if lost.any():
+                    self.dead += int(np.count_nonzero(self.colors[neighbors[lost]] == 0))
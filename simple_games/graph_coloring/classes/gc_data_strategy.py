@@ -3,6 +3,13 @@
 # Attempts to follow the vertex coloring provided by the `data` parameter.
 # The `data` parameter is a dictionary consisting of a vertex ordering and a color ordering.
 #
+# On boards without bookkeeping of their own, the strategy keeps a cursor into
+# its vertex ordering and the colors used around every vertex during a game,
+# updated through the game's hooks as moves are made. Colored vertices and
+# vertices that can no longer be colored never become playable again, so the
+# cursor only moves forward, and a whole game costs one pass over the ordering
+# rather than one pass per move.
+#
 # Authors: Daniel Hammer, Nicholas O'Kelley, Andrew Penland, Andrew Shelton
 #
 # Date: 2021-02-27
@@ -16,6 +23,9 @@ from classes.strategy_interface import StrategyInterface
 
 class GCDataStrategy(StrategyInterface):
 
+    # Follows fixed orderings, so its games are fully determined by its data
+    deterministic = True
+
     def __init__(self, name, data = None):
         """
         Strategy constructor.
@@ -27,6 +37,49 @@ class GCDataStrategy(StrategyInterface):
         self.name = name
         self.data = data
 
+        # Bookkeeping of the game being played, if any
+        self.session = None
+
+    def on_game_start(self, board):
+        """
+        Starts the bookkeeping of a new game from the board's initial coloring.
+        Boards that keep their own bookkeeping already find moves quickly, so
+        none is kept for them.
+
+        Args:
+            board : The board being played on
+        """
+        if hasattr(board, "ordered_move"):
+            self.session = None
+            return
+
+        neighbors = [vertex["adj"] for vertex in board.state]
+        colors = [vertex["color"] for vertex in board.state]
+
+        self.session = GCOrderSession(board, self.data["vertices"], self.data["colors"], neighbors, colors)
+
+    def on_move(self, board, move):
+        """
+        Records a move made by either player.
+
+        Args:
+            board : The board being played on
+            move : The move that was made
+        """
+        session = self.session
+        if session is not None and session.board is board:
+            session.record(move["vertex"], move["color"])
+
+    def on_game_end(self, board, won):
+        """
+        Drops the bookkeeping of the game that just ended.
+
+        Args:
+            board : The board being played on
+            won : Whether the strategy's player won the game
+        """
+        self.session = None
+
     def move(self, board):
         """
         Attempts to make a move by following the vertex coloring provided by
@@ -38,6 +91,15 @@ class GCDataStrategy(StrategyInterface):
         Return:
             A proposed move.
         """
+        # Follow the cursor, if this game is being kept track of
+        session = self.session
+        if session is not None and session.board is board:
+            return session.next_move()
+
+        # Boards that keep their own bookkeeping can find the move faster
+        if hasattr(board, "ordered_move"):
+            return board.ordered_move(self.data["vertices"], self.data["colors"])
+
         # Iterate over the vertex ordering
         for vtx in self.data["vertices"]:
             # If the vertex is uncolored
@@ -53,3 +115,76 @@ class GCDataStrategy(StrategyInterface):
                         return {"vertex": vtx, "color": color}
 
         return None
+
+class GCOrderSession:
+
+    __slots__ = ("board", "vertices", "colors", "neighbors", "colored", "used", "cursor")
+
+    def __init__(self, board, vertices, colors, neighbors, initial_colors):
+        """
+        Sets up the bookkeeping of an order-based strategy for one game.
+
+        Args:
+            board : The board being played on
+            vertices : The strategy's vertex ordering
+            colors : The strategy's color ordering
+            neighbors : The neighbors of every vertex
+            initial_colors : The color of every vertex when the game starts; 0 for uncolored vertices
+        """
+        self.board = board
+        self.vertices = vertices
+        self.colors = colors
+        self.neighbors = neighbors
+
+        # Whether every vertex is colored, and a mask of the colors of its neighbors
+        self.colored = [color != 0 for color in initial_colors]
+        self.used = [0] * len(initial_colors)
+        for vtx, color in enumerate(initial_colors):
+            if color != 0:
+                for adj in neighbors[vtx]:
+                    self.used[adj] |= 1 << color
+
+        # Every vertex before the cursor in the ordering is colored or cannot be colored
+        self.cursor = 0
+
+    def record(self, vtx, color):
+        """
+        Records that a vertex was colored.
+
+        Args:
+            vtx : The vertex that was colored
+            color : Its color
+        """
+        self.colored[vtx] = True
+
+        bit = 1 << color
+        used = self.used
+        for adj in self.neighbors[vtx]:
+            used[adj] |= bit
+
+    def next_move(self):
+        """
+        Finds the first vertex in the ordering that can be colored, colored with
+        the first color in the ordering that none of its neighbors use.
+
+        Return:
+            A `{"vertex", "color"}` move, or None if no move is available
+        """
+        vertices = self.vertices
+        colored = self.colored
+        used = self.used
+
+        cursor = self.cursor
+        while cursor < len(vertices):
+            vtx = vertices[cursor]
+            if not colored[vtx]:
+                mask = used[vtx]
+                for color in self.colors:
+                    if not mask >> color & 1:
+                        self.cursor = cursor
+                        return {"vertex": vtx, "color": color}
+
+            cursor += 1
+
+        self.cursor = cursor
+        return None
@@ -0,0 +1,275 @@
+##
+# Graph Loader
+# Reads graphs from files into a `GCTopology` or an initial graph coloring
+# state, so large benchmark graphs need not be written out by hand.
+# Four formats are understood:
+#   - "edges": one edge per line, as two vertex numbers counted from 0
+#     (`u v` or `u,v`); anything after them, such as a weight, is ignored
+#   - "dimacs": the DIMACS `.col` format; a `p edge <vertices> <edges>` line,
+#     then one `e <u> <v>` line per edge, with vertices counted from 1
+#   - "adjacency": one line per vertex listing its neighbors, counted from 0
+#     (an empty line for a vertex without any); a line may instead start with
+#     its vertex number and a colon (`v: u w`)
+#   - "matrix": a dense adjacency matrix of 0s and 1s, one row per line
+# Lines starting with `#`, `%` or `c` (DIMACS) are comments. Edges are
+# undirected; duplicate edges and self-loops are dropped.
+#
+# Files are memory-mapped and their numbers are extracted in bulk with regular
+# expressions and NumPy, rather than line by line. The parsed graph is saved
+# next to the file in a binary sidecar (`<file>.npz`) holding its compressed
+# sparse row arrays, and later loads read the sidecar instead, as long as the
+# file's size and modification time are unchanged.
+#
+# Date: 2026-10-18
+##
+
+import mmap
+import os
+import re
+import tempfile
+
+import sys
+sys.path.append("../..")
+from graph_coloring.classes.gc_topology import GCTopology, to_csr
+
+import numpy as np
+
+# Format of a file, by its extension; any other extension is read as an edge list
+EXTENSIONS = {".col": "dimacs", ".dimacs": "dimacs", ".adj": "adjacency", ".adjlist": "adjacency",
+        ".mat": "matrix", ".matrix": "matrix"}
+
+# Extension of the binary sidecar, and the version of its layout
+SIDECAR = ".npz"
+SIDECAR_VERSION = 1
+
+# An edge at the start of a line of an edge list
+EDGE = re.compile(rb"^[ \t]*(\d+)[ \t,;]+(\d+)", re.M)
+
+# An edge line of a DIMACS file, and its problem line
+DIMACS_EDGE = re.compile(rb"^e[ \t]+(\d+)[ \t]+(\d+)", re.M)
+DIMACS_PROBLEM = re.compile(rb"^p[ \t]+\S+[ \t]+(\d+)", re.M)
+
+# Any line that is a comment, with its line break
+COMMENT = re.compile(rb"^[ \t]*[#%].*(?:\r?\n)?", re.M)
+
+def load_topology(path, fmt = None, num_vertices = None, cache = True):
+    """
+    Loads a graph's topology from a file.
+
+    Args:
+        path : The graph file
+        fmt : (Optional) The file's format; "edges", "dimacs", "adjacency" or
+              "matrix". Guessed from the extension if omitted
+        num_vertices : (Optional) Number of vertices of an edge list, if some have no edges
+        cache : (Optional) Whether to read and write the binary sidecar
+
+    Return:
+        The graph's `GCTopology`
+    """
+    return GCTopology.from_csr(*load_csr(path, fmt, num_vertices, cache))
+
+def load_state(path, fmt = None, num_vertices = None, cache = True):
+    """
+    Loads a graph from a file as an uncolored graph coloring board state.
+
+    Args:
+        path : The graph file
+        fmt : (Optional) The file's format; see `load_topology()`
+        num_vertices : (Optional) Number of vertices of an edge list, if some have no edges
+        cache : (Optional) Whether to read and write the binary sidecar
+
+    Return:
+        A list of `{"color", "adj"}` vertices, all uncolored
+    """
+    return load_topology(path, fmt, num_vertices, cache).to_state()
+
+def load_csr(path, fmt = None, num_vertices = None, cache = True):
+    """
+    Loads a graph from a file in compressed sparse row form, where the
+    neighbors of vertex `v` are `indices[indptr[v]:indptr[v + 1]]`, in increasing order.
+
+    Args:
+        path : The graph file
+        fmt : (Optional) The file's format; see `load_topology()`
+        num_vertices : (Optional) Number of vertices of an edge list, if some have no edges
+        cache : (Optional) Whether to read and write the binary sidecar
+
+    Return:
+        A tuple of the `indptr` and `indices` arrays
+    """
+    if fmt is None:
+        fmt = EXTENSIONS.get(os.path.splitext(path)[1].lower(), "edges")
+    if fmt not in PARSERS:
+        raise ValueError("Unknown graph format {}; expected one of {}".format(fmt, list(PARSERS)))
+
+    # The sidecar is only trusted for the same file, format and vertex count
+    stat = os.stat(path)
+    source = np.array([stat.st_size, stat.st_mtime_ns, SIDECAR_VERSION, -1 if num_vertices is None else num_vertices])
+    sidecar = path + SIDECAR
+
+    if cache:
+        csr = read_sidecar(sidecar, source, fmt)
+        if csr is not None:
+            return csr
+
+    with open(path, "rb") as graph_file:
+        # Empty files cannot be memory-mapped
+        data = (mmap.mmap(graph_file.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size
+                else b"")
+        try:
+            count, sources, targets = PARSERS[fmt](data)
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+    if num_vertices is not None:
+        count = max(count, num_vertices)
+
+    indptr, indices = to_csr(count, sources, targets)
+
+    if cache:
+        write_sidecar(sidecar, source, fmt, indptr, indices)
+
+    return indptr, indices
+
+def parse_edges(data):
+    """
+    Parses an edge list.
+
+    Args:
+        data : The file's contents, as bytes or a memory map
+
+    Return:
+        A tuple of the number of vertices, and arrays of the edges' endpoints
+    """
+    edges = np.array(EDGE.findall(data), dtype=np.int64).reshape(-1, 2)
+    count = int(edges.max()) + 1 if len(edges) else 0
+
+    return count, edges[:, 0], edges[:, 1]
+
+def parse_dimacs(data):
+    """
+    Parses a DIMACS `.col` file.
+
+    Args:
+        data : The file's contents, as bytes or a memory map
+
+    Return:
+        A tuple of the number of vertices, and arrays of the edges' endpoints
+    """
+    problem = DIMACS_PROBLEM.search(data)
+    if problem is None:
+        raise ValueError("DIMACS file has no problem line")
+
+    # Vertices are counted from 1
+    edges = np.array(DIMACS_EDGE.findall(data), dtype=np.int64).reshape(-1, 2) - 1
+    count = max(int(problem.group(1)), int(edges.max()) + 1 if len(edges) else 0)
+
+    return count, edges[:, 0], edges[:, 1]
+
+def parse_adjacency(data):
+    """
+    Parses an adjacency list.
+
+    Args:
+        data : The file's contents, as bytes or a memory map
+
+    Return:
+        A tuple of the number of vertices, and arrays of the edges' endpoints
+    """
+    lines = COMMENT.sub(b"", data[:]).replace(b",", b" ").splitlines()
+    while lines and not lines[-1].strip():
+        lines.pop()
+
+    # Every line's neighbors, then the vertex each one belongs to
+    vertices = []
+    neighbors = []
+    for vtx, line in enumerate(lines):
+        label, colon, rest = line.partition(b":")
+        if colon:
+            vtx, line = int(label), rest
+        tokens = line.split()
+        vertices.append(np.full(len(tokens), vtx, dtype=np.int64))
+        neighbors.append(tokens)
+
+    sources = np.concatenate(vertices) if vertices else np.zeros(0, dtype=np.int64)
+    targets = np.array([token for tokens in neighbors for token in tokens], dtype=np.int64)
+    count = max(len(lines), int(sources.max()) + 1 if len(sources) else 0,
+            int(targets.max()) + 1 if len(targets) else 0)
+
+    return count, sources, targets
+
+def parse_matrix(data):
+    """
+    Parses a dense adjacency matrix.
+
+    Args:
+        data : The file's contents, as bytes or a memory map
+
+    Return:
+        A tuple of the number of vertices, and arrays of the edges' endpoints
+    """
+    rows = [line.split() for line in COMMENT.sub(b"", data[:]).replace(b",", b" ").splitlines() if line.strip()]
+    count = len(rows)
+
+    if any(len(row) != count for row in rows):
+        raise ValueError("Adjacency matrix is not square")
+
+    matrix = np.array(rows, dtype=np.int64).reshape(count, count)
+    sources, targets = np.nonzero(matrix)
+
+    return count, sources, targets
+
+# Parser of every format
+PARSERS = {"edges": parse_edges, "dimacs": parse_dimacs, "adjacency": parse_adjacency, "matrix": parse_matrix}
+
+def read_sidecar(sidecar, source, fmt):
+    """
+    Reads a graph from its binary sidecar, if the sidecar matches the file.
+
+    Args:
+        sidecar : The sidecar file
+        source : Array describing the graph file, as written by `write_sidecar()`
+        fmt : The graph file's format
+
+    Return:
+        A tuple of the `indptr` and `indices` arrays, or None if there is no matching sidecar
+    """
+    try:
+        with np.load(sidecar) as arrays:
+            if not np.array_equal(arrays["source"], source) or str(arrays["format"]) != fmt:
+                return None
+
+            return arrays["indptr"], arrays["indices"]
+    except (OSError, KeyError, ValueError):
+        return None
+
+def write_sidecar(sidecar, source, fmt, indptr, indices):
+    """
+    Writes a graph's binary sidecar atomically.
+    A sidecar that cannot be written, such as in a read-only directory, is skipped.
+
+    Args:
+        sidecar : The sidecar file
+        source : Array describing the graph file: its size, modification time,
+                 the sidecar version and the requested vertex count
+        fmt : The graph file's format
+        indptr : The graph's `indptr` array
+        indices : The graph's `indices` array
+    """
+    directory = os.path.dirname(os.path.abspath(sidecar))
+
+    try:
+        handle, temp_path = tempfile.mkstemp(dir=directory, prefix=".graph-")
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(handle, "wb") as temp:
+            np.savez(temp, source=source, format=np.array(fmt), indptr=indptr, indices=indices)
+        os.replace(temp_path, sidecar)
+    except OSError:
+        os.unlink(temp_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
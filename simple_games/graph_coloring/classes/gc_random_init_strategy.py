@@ -1,6 +1,7 @@
 ##
 # Randomly Initialized Strategy
-# Generates random vertex and color orderings on initialization
+# Generates random vertex and color orderings on initialization, then plays
+# them like a `GCDataStrategy`
 #
 # Authors: Daniel Hammer, Nicholas O'Kelley, Andrew Penland, Andrew Shelton
 #
@@ -11,9 +12,13 @@ from random import sample
 
 import sys
 sys.path.append("../..")
-from classes.strategy_interface import StrategyInterface
+from classes.genome import Genome
+from graph_coloring.classes.gc_data_strategy import GCDataStrategy
 
-class GCRandomInitStrategy(StrategyInterface):
+class GCRandomInitStrategy(GCDataStrategy):
+
+    # Orderings are only shuffled on creation, so its games are fully determined by its data
+    deterministic = True
 
     def __init__(self, name, data = None):
         """
@@ -29,32 +34,4 @@ class GCRandomInitStrategy(StrategyInterface):
         for key in list(data.keys()):
             new_data[key] = sample(data[key], len(data[key]))
 
-        self.name = name
-        self.data = new_data
-
-    def move(self, board):
-        """
-        Attempts to make a move by following the vertex coloring provided by
-        the `data` field.
-
-        Args:
-            board : The board being played on
-
-        Return:
-            A proposed move.
-        """
-        # Iterate over the vertex ordering
-        for vtx in self.data["vertices"]:
-            # If the vertex is uncolored
-            if board.state[vtx]["color"] == 0:
-                # Get the vertex's neighbors' colors
-                adj_colors = [board.state[adj]["color"] for adj in board.state[vtx]["adj"]]
-
-                # Iterate over the color ordering
-                for color in self.data["colors"]:
-
-                    # If the color is available, use it
-                    if color not in adj_colors:
-                        return {"vertex": vtx, "color": color}
-
-        return None
+        super().__init__(name, Genome.from_data(new_data))
@@ -1,13 +1,15 @@
 ##
 # Random Strategy
-# Randomly chooses a vertex and color.
+# Randomly chooses a legal vertex and color.
+# On boards that cannot list their legal moves, it guesses instead, and may
+# make an illegal move.
 #
 # Authors: Daniel Hammer, Nicholas O'Kelley, Andrew Penland, Andrew Shelton
 #
 # Date: 2021-02-27
 ##
 
-from random import randrange
+from random import choice, randrange
 
 import sys
 sys.path.append("../..")
@@ -28,14 +30,18 @@ class GCRandomStrategy(StrategyInterface):
 
     def move(self, board):
         """
-        Randomly pick a vertex and color
+        Randomly pick a legal vertex and color
 
         Args:
             board : The board being played on
 
         Return:
-            A proposed move.
+            A proposed move, or None if there are no legal moves
         """
+        moves = board.legal_moves()
+        if moves is not None:
+            return choice(moves) if moves else None
+
         vtx = randrange(0, len(board.state))
         color = randrange(1, board.bounds + 1)
         return {"vertex": vtx, "color": color}
@@ -13,11 +13,27 @@
 
 import sys
 sys.path.append("../..")
-from classes.ruleset_interface import RulesetInterface
+from classes.ruleset_interface import RulesetInterface, is_integer
+from classes import zobrist
+from graph_coloring.classes.gc_board import GCBoard
+from graph_coloring.classes.gc_bitboard import GCBitBoard
+from graph_coloring.classes.gc_csr_board import GCCSRBoard
+from graph_coloring.classes.gc_topology import GCTopology
+
+import numpy as np
+
+# Number of bits a color takes up in an encoded move
+COLOR_BITS = 16
+
+# Board classes a ruleset can play on, by backend name
+BACKENDS = {"lists": GCBoard, "bitboard": GCBitBoard, "csr": GCCSRBoard}
+
+# Boards that keep their own bookkeeping of the coloring
+INCREMENTAL_BOARDS = tuple(BACKENDS.values())
 
 class GCRuleset(RulesetInterface):
 
-    def __init__(self, name, initial_state, bounds = None):
+    def __init__(self, name, initial_state, bounds = None, backend = "lists", topology = None):
         """
         Rulset constructor.
 
@@ -25,10 +41,37 @@ class GCRuleset(RulesetInterface):
             name : The name of the ruleset
             initial_state : The initial state of the board
             bounds : (Optional) The bounds of the board
+            backend : (Optional) The board class games are played on; "lists" for `GCBoard`,
+                      "bitboard" for `GCBitBoard`, the board `GCBitBoardEngine` plays on,
+                      or "csr" for `GCCSRBoard`, which suits large sparse graphs
+            topology : (Optional) The graph's topology, such as one loaded by `gc_loader`;
+                       built from `initial_state` if omitted
         """
+        if backend not in BACKENDS:
+            raise ValueError("Unknown backend {}; expected one of {}".format(backend, list(BACKENDS)))
+
         self.name = name
         self.initial_state = initial_state
         self.bounds = bounds
+        self.backend = backend
+
+        # Every board created by this ruleset shares the same topology
+        self.topology = topology if topology is not None else GCTopology.from_state(initial_state)
+        self.zobrist = zobrist.table(self.topology.num_vertices, (bounds or 0) + 1)
+
+    def create_board(self, record = True):
+        """
+        Creates a new board to play this game on.
+        The board keeps incremental bookkeeping of the coloring, which lets
+        every check below run without rescanning the graph.
+
+        Args:
+            record : (Optional) Whether the board keeps a history of the moves made
+
+        Return:
+            A board of the ruleset's backend, holding this ruleset's initial state and bounds
+        """
+        return BACKENDS[self.backend](self.initial_state, self.bounds, record, self.topology, self)
 
     def is_legal(self, board, proposed_move):
         """
@@ -44,9 +87,17 @@ class GCRuleset(RulesetInterface):
         Return:
             True if the move was legal, else False.
         """
-        if not proposed_move:
+        # Moves from outside the process, such as engines, may have any shape
+        if (not isinstance(proposed_move, dict) or not is_integer(proposed_move.get("vertex"))
+                or not is_integer(proposed_move.get("color"))):
+            return False
+
+        if not 0 <= proposed_move["vertex"] < self.topology.num_vertices or proposed_move["color"] < 1:
             return False
 
+        if isinstance(board, INCREMENTAL_BOARDS):
+            return board.is_legal(proposed_move["vertex"], proposed_move["color"])
+
         # If the vertex was not uncolored, the move is invalid
         if board.state[proposed_move["vertex"]]["color"] != 0:
             return False
@@ -60,6 +111,30 @@ class GCRuleset(RulesetInterface):
 
         return True
 
+    def generate_moves(self, board):
+        """
+        Generates every legal move on a board: every uncolored vertex paired
+        with every color none of its neighbors use.
+        Called by `legal_moves()`, which caches the list until the next move.
+
+        Args:
+            board : The board being played on
+
+        Return:
+            A list of `{"vertex", "color"}` moves, by vertex and then by color
+        """
+        if isinstance(board, INCREMENTAL_BOARDS):
+            return board.generate_moves()
+
+        moves = []
+        for vtx, vertex in enumerate(board.state):
+            if vertex["color"] == 0:
+                neighbor_colors = {board.state[neighbor]["color"] for neighbor in vertex["adj"]}
+                moves.extend({"vertex": vtx, "color": color}
+                        for color in range(1, board.bounds + 1) if color not in neighbor_colors)
+
+        return moves
+
     def is_game_over(self, board):
         """
         Determines if the game is over.
@@ -72,6 +147,9 @@ class GCRuleset(RulesetInterface):
         Return:
             True if the state of the board is an end-game state, else False.
         """
+        if isinstance(board, INCREMENTAL_BOARDS):
+            return board.is_game_over()
+
         # Case 1: The graph is entirely colored; Player 1 wins
         vertex_colors = [board.state[vtx]["color"] for vtx in range(len(board.state))]
         if 0 not in vertex_colors:
@@ -97,16 +175,47 @@ class GCRuleset(RulesetInterface):
     def update_board(self, board, player, move):
         """
         Update the board based on the player's given move.
-        Also updates the board's `data` field to log move history.
+        Also logs the move in the board's move history.
 
         Args:
             board : The board being played on
             player : The player who made the move
             move : The move being made
         """
-        board.data[str(board.state)] = (player.name, move)
+        board.record(move["vertex"] << COLOR_BITS | move["color"])
+
+        if isinstance(board, INCREMENTAL_BOARDS):
+            board.color_vertex(move["vertex"], move["color"])
+        else:
+            if board.key is not None:
+                board.key ^= self.zobrist.delta(move["vertex"], board.state[move["vertex"]]["color"], move["color"])
+
+            board.state[move["vertex"]]["color"] = move["color"]
 
-        board.state[move["vertex"]]["color"] = move["color"]
+    def zobrist_key(self, board):
+        """
+        Computes the Zobrist key of a board's coloring from scratch.
+        Boards created by this ruleset keep their own key up to date.
+
+        Args:
+            board : The board being played on
+
+        Return:
+            The coloring's 64-bit key
+        """
+        return self.zobrist.key([vertex["color"] for vertex in board.state])
+
+    def decode_move(self, code):
+        """
+        Decodes a move logged by `update_board()`.
+
+        Args:
+            code : The move, as an integer
+
+        Return:
+            The move, as a dictionary
+        """
+        return {"vertex": code >> COLOR_BITS, "color": code & ((1 << COLOR_BITS) - 1)}
 
     def declare_winner(self, board, players):
         """
@@ -121,9 +230,121 @@ class GCRuleset(RulesetInterface):
         Return:
             The winning player of the game
         """
-        if 0 not in [board.state[vtx]["color"] for vtx in range(len(board.state))]:
+        if isinstance(board, INCREMENTAL_BOARDS):
+            colored = board.is_colored()
+        else:
+            colored = 0 not in [board.state[vtx]["color"] for vtx in range(len(board.state))]
+
+        if colored:
             winner = players[0]
         else:
             winner = players[1]
 
         return winner
+
+    def playout(self, board, rng):
+        """
+        Plays random moves on a board until the game is over. Every move colors
+        a random uncolored vertex with a random color none of its neighbors use,
+        so that the games follow the same odds as those of `playouts()`.
+
+        Args:
+            board : The board being played on
+            rng : The `random.Random` to draw moves with
+
+        Return:
+            Index of the winning player; 0 for Player 1
+        """
+        if isinstance(board, INCREMENTAL_BOARDS):
+            colors = board.colors
+        else:
+            colors = [vertex["color"] for vertex in board.state]
+
+        # Coloring the uncolored vertices in a random order picks a random one at every move
+        uncolored = [vtx for vtx, color in enumerate(colors) if color == 0]
+        rng.shuffle(uncolored)
+
+        for vtx in uncolored:
+            if self.is_game_over(board):
+                break
+
+            free = [color for color in range(1, self.bounds + 1)
+                    if self.is_legal(board, {"vertex": vtx, "color": color})]
+            self.update_board(board, None, {"vertex": vtx, "color": rng.choice(free)})
+
+        return self.declare_winner(board, (0, 1))
+
+    def playouts(self, board, count, rng):
+        """
+        Plays many random games at once from a board's position, without changing the board.
+        Every move colors a random uncolored vertex with a random color none of
+        its neighbors use, as in `playout()`. The colorings of all the games are held in matrices
+        with one row per game, and each move is made in every game with a few
+        array operations, touching only the neighborhoods of the colored vertices.
+        Only boards of this ruleset's backends, with at most 62 colors, are supported.
+
+        Args:
+            board : The board being played on
+            count : Number of games to play
+            rng : The `numpy.random.Generator` to draw moves with
+
+        Return:
+            Number of games won by Player 1, or None if the board is not supported
+        """
+        bounds = self.bounds
+        if not isinstance(board, INCREMENTAL_BOARDS) or bounds > 62:
+            return None
+
+        indptr, indices = self.topology.csr
+        degrees = np.diff(indptr)
+        game_colors = np.arange(1, bounds + 1)
+        full = ((1 << bounds) - 1) << 1
+
+        # The game colors forbidden at every vertex by the colors of its neighbors
+        colors = np.asarray(board.colors, dtype=np.int64)
+        game_colored = (colors >= 1) & (colors <= bounds)
+        bits = np.where(game_colored, np.left_shift(1, np.where(game_colored, colors, 0)), 0)
+        forbidden = np.zeros(len(colors), dtype=np.int64)
+        np.bitwise_or.at(forbidden, np.repeat(np.arange(len(colors)), degrees), bits[indices])
+
+        uncolored = np.flatnonzero(colors == 0)
+        if len(uncolored) == 0:
+            return count
+        if ((forbidden[uncolored] & full) == full).any():
+            return 0
+
+        # Coloring the uncolored vertices in a random order picks a random one at every move
+        order = uncolored[np.argsort(rng.random((count, len(uncolored))), axis=1)]
+        forbidden = np.tile(forbidden & full, (count, 1))
+        colored = np.tile(colors != 0, (count, 1))
+        live = np.arange(count)
+        lost = np.zeros(count, dtype=bool)
+
+        for step in range(len(uncolored)):
+            vertices = order[live, step]
+            masks = forbidden[live, vertices]
+            colored[live, vertices] = True
+
+            # Random scores, plus one for the free colors, so the best score is a random free color
+            free = (np.right_shift.outer(masks, game_colors) & 1) == 0
+            new_bits = np.left_shift(1, game_colors[np.argmax(rng.random(free.shape) + free, axis=1)])
+
+            # The neighbors of every game's vertex, one game after another
+            counts = degrees[vertices]
+            games = np.repeat(live, counts)
+            offsets = np.repeat(indptr[vertices] - np.cumsum(counts) + counts, counts)
+            neighbors = indices[np.arange(counts.sum()) + offsets]
+
+            updated = forbidden[games, neighbors] | np.repeat(new_bits, counts)
+            forbidden[games, neighbors] = updated
+
+            # An uncolored neighbor left without a color ends its game, and Player 2 wins
+            dead = ((updated & full) == full) & ~colored[games, neighbors]
+            if dead.any():
+                lost[games[dead]] = True
+                live = live[~lost[live]]
+                if len(live) == 0:
+                    break
+
+        # The games still going colored every vertex
+        return len(live)
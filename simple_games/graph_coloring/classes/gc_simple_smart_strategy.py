@@ -11,7 +11,7 @@
 # Date: 2021-02-27
 ##
 
-from random import choice
+from random import choice, randrange
 
 import sys
 sys.path.append("../..")
@@ -19,6 +19,9 @@ from classes.strategy_interface import StrategyInterface
 
 class GCSimpleSmartStrategy(StrategyInterface):
 
+    # Picks colors at random, so its match outcomes must never be cached
+    deterministic = False
+
     def __init__(self, name, data = None):
         """
         Strategy constructor.
@@ -42,6 +45,19 @@ class GCSimpleSmartStrategy(StrategyInterface):
         Return:
             A proposed move.
         """
+        moves = board.legal_moves()
+        if moves is not None:
+            if not moves:
+                return None
+
+            # Legal moves are listed by vertex, so the lowest vertex's colors come first
+            vtx = moves[0]["vertex"]
+            count = 1
+            while count < len(moves) and moves[count]["vertex"] == vtx:
+                count += 1
+
+            return moves[randrange(count)]
+
         game_colors = range(1, board.bounds + 1)
         for vtx in range(len(board.state)):
             if board.state[vtx]["color"] == 0:
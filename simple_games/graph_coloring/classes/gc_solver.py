@@ -0,0 +1,537 @@
+##
+# Graph Coloring Solver
+# Solves the two-player graph coloring game exactly: given any position, it
+# decides which player wins with perfect play and finds an optimal move.
+#
+# The search is a negamax over win/loss values. Since every position is either
+# won or lost, a move that wins for the player to move cuts off the remaining
+# moves (alpha-beta pruning with a zero-width window). Solved positions are
+# stored in a transposition table under a canonical form of the coloring,
+# which merges positions that are equivalent under a graph automorphism or a
+# permutation of the colors. Positions where Player 2 can make a vertex
+# uncolorable in one move, or where no vertex can ever become uncolorable,
+# are recognized without searching.
+#
+# Moves are restricted to the game's `bounds` colors.
+#
+# Date: 2026-10-18
+##
+
+import sys
+sys.path.append("../..")
+from graph_coloring.classes.gc_topology import GCTopology
+
+class GCSolver:
+
+    def __init__(self, ruleset, max_automorphisms = 64, max_table_size = 4000000):
+        """
+        Solver constructor.
+
+        Args:
+            ruleset : The graph coloring ruleset to solve
+            max_automorphisms : (Optional) Maximum number of graph automorphisms used to reduce positions
+            max_table_size : (Optional) Maximum number of positions kept in the transposition table
+        """
+        self.ruleset = ruleset
+        self.topology = getattr(ruleset, "topology", None) or GCTopology.from_state(ruleset.initial_state)
+        self.bounds = ruleset.bounds
+        self.full_mask = ((1 << self.bounds) - 1) << 1
+        self.max_table_size = max_table_size
+
+        # Inverse permutations: position `i` of an image is vertex `perm[i]` of the original
+        self.automorphisms = [invert(perm) for perm in
+                find_automorphisms(self.topology, max_automorphisms)]
+
+        # Reducing by automorphisms only pays off while the remaining subtrees are large
+        self.symmetry_depth = self.topology.num_vertices // 2
+
+        # Number of game colors forbidden by each possible mask
+        self.saturation = [bin(mask & self.full_mask).count("1") for mask in range(1 << (self.bounds + 1))]
+
+        self.relabel_tables = {}
+        self.table = {}
+        self.nodes = 0
+
+    def solve(self, board = None, to_move = None):
+        """
+        Determines the winner of a position under perfect play.
+
+        Args:
+            board : (Optional) The board to solve; the empty graph if omitted
+            to_move : (Optional) Index of the player to move; inferred from the number of colored vertices if omitted
+
+        Return:
+            0 if Player 1 wins, or 1 if Player 2 wins
+        """
+        to_move = self.load(board, to_move)
+
+        return to_move if self.wins(to_move) else 1 - to_move
+
+    def best_move(self, board = None, to_move = None):
+        """
+        Finds an optimal move: a winning move if one exists, otherwise the
+        first legal move.
+
+        Args:
+            board : (Optional) The board to move on; the empty graph if omitted
+            to_move : (Optional) Index of the player to move; inferred from the number of colored vertices if omitted
+
+        Return:
+            The move, as a dictionary, or None if the game is over
+        """
+        to_move = self.load(board, to_move)
+
+        if self.uncolored == 0 or self.dead:
+            return None
+
+        moves = self.moves(to_move)
+        for vtx, color in moves:
+            self.play(vtx, color)
+            opponent_wins = self.wins(1 - to_move)
+            self.undo()
+
+            if not opponent_wins:
+                return {"vertex": vtx, "color": color}
+
+        # Every move loses; play any of them
+        vtx, color = self.moves(to_move, prune=False)[0]
+
+        return {"vertex": vtx, "color": color}
+
+    def load(self, board, to_move):
+        """
+        Loads a position into the solver's working state.
+
+        Args:
+            board : The board to load, or None for the empty graph
+            to_move : Index of the player to move, or None to infer it
+
+        Return:
+            Index of the player to move
+        """
+        if board is None:
+            colors = [vertex["color"] for vertex in self.ruleset.initial_state]
+        elif hasattr(board, "colors"):
+            colors = list(board.colors)
+        else:
+            colors = [vertex["color"] for vertex in board.state]
+
+        neighbors = self.topology.neighbors
+        full = self.full_mask
+
+        self.colors = bytearray(colors)
+        self.forbidden = [0] * len(colors)
+        self.color_counts = [0] * (self.bounds + 1)
+        self.undo_stack = []
+
+        for vtx, color in enumerate(colors):
+            if color:
+                if color <= self.bounds:
+                    self.color_counts[color] += 1
+                for neighbor in neighbors[vtx]:
+                    self.forbidden[neighbor] |= 1 << color
+
+        self.initial_uncolored = colors.count(0)
+        self.uncolored = self.initial_uncolored
+        self.dead = sum(1 for vtx, color in enumerate(colors)
+                if color == 0 and self.forbidden[vtx] & full == full)
+
+        if to_move is None:
+            initially_colored = sum(1 for vertex in self.ruleset.initial_state if vertex["color"])
+            to_move = (len(colors) - self.uncolored - initially_colored) % 2
+
+        # Forbidden bits beyond the game's colors never matter to the search
+        self.forbidden = [mask & full for mask in self.forbidden]
+
+        return to_move
+
+    def wins(self, to_move):
+        """
+        Determines if the player to move wins the loaded position.
+
+        Args:
+            to_move : Index of the player to move
+
+        Return:
+            True if the player to move wins with perfect play, else False
+        """
+        # Player 1 wins once the graph is colored; Player 2 once a vertex is dead
+        if self.uncolored == 0:
+            return to_move == 0
+        if self.dead:
+            return to_move == 1
+
+        # Wins in one move need no search
+        if to_move == 0 and self.uncolored == 1:
+            return True
+        if to_move == 1 and self.threatened():
+            return True
+
+        # Player 1 wins if no vertex can ever be made dead
+        if not self.endangered():
+            return to_move == 0
+
+        self.nodes += 1
+
+        key = self.key(to_move)
+        result = self.table.get(key)
+        if result is not None:
+            return result
+
+        result = False
+        for vtx, color in self.moves(to_move):
+            self.play(vtx, color)
+            opponent_wins = self.wins(1 - to_move)
+            self.undo()
+
+            # One winning move is enough; the remaining moves are cut off
+            if not opponent_wins:
+                result = True
+                break
+
+        if len(self.table) >= self.max_table_size:
+            self.table.clear()
+        self.table[key] = result
+
+        return result
+
+    def moves(self, to_move, prune = True):
+        """
+        Generates the legal moves of the loaded position, best first.
+        Colors that have not been used yet are interchangeable, so only the
+        lowest of them is tried.
+
+        Args:
+            to_move : Index of the player to move
+            prune : (Optional) Whether to leave out moves of Player 1 that lose immediately
+
+        Return:
+            A list of `(vertex, color)` tuples
+        """
+        colors = self.colors
+        forbidden = self.forbidden
+        neighbors = self.topology.neighbors
+
+        candidates = [color for color in range(1, self.bounds + 1) if self.color_counts[color]]
+        unused = [color for color in range(1, self.bounds + 1) if not self.color_counts[color]]
+        if unused:
+            candidates.append(unused[0])
+
+        # Player 1 has to defuse every threat at once, or Player 2 wins next move
+        threats = self.threats() if to_move == 0 and prune else None
+
+        scored = []
+        for vtx, color in enumerate(colors):
+            if color:
+                continue
+
+            saturation = self.saturation[forbidden[vtx]]
+            for color in candidates:
+                if forbidden[vtx] >> color & 1:
+                    continue
+                if threats and not self.defuses(threats, vtx, color):
+                    continue
+
+                # How much closer the move brings uncolored neighbors to being dead
+                damage = 0
+                for neighbor in neighbors[vtx]:
+                    if colors[neighbor] == 0 and not forbidden[neighbor] >> color & 1:
+                        damage += 1 + self.saturation[forbidden[neighbor]]
+
+                # Player 1 colors the most constrained vertices as harmlessly as possible;
+                # Player 2 does as much damage as possible
+                score = (saturation, -damage) if to_move == 0 else (damage, saturation)
+                scored.append((score, vtx, color))
+
+        scored.sort(key=lambda move: move[0], reverse=True)
+
+        return [(vtx, color) for _, vtx, color in scored]
+
+    def play(self, vtx, color):
+        """
+        Colors a vertex of the loaded position, remembering how to undo it.
+
+        Args:
+            vtx : The vertex to color
+            color : The color to use
+        """
+        colors = self.colors
+        forbidden = self.forbidden
+        full = self.full_mask
+        bit = 1 << color
+
+        changed = []
+        for neighbor in self.topology.neighbors[vtx]:
+            mask = forbidden[neighbor]
+            if not mask & bit:
+                changed.append(neighbor)
+                forbidden[neighbor] = mask | bit
+
+                if colors[neighbor] == 0 and (mask | bit) & full == full:
+                    self.dead += 1
+
+        colors[vtx] = color
+        self.color_counts[color] += 1
+        self.uncolored -= 1
+        self.undo_stack.append((vtx, changed))
+
+    def undo(self):
+        """
+        Reverts the most recent call to `play()`.
+        """
+        vtx, changed = self.undo_stack.pop()
+        colors = self.colors
+        forbidden = self.forbidden
+        full = self.full_mask
+        bit = 1 << colors[vtx]
+
+        for neighbor in changed:
+            if colors[neighbor] == 0 and forbidden[neighbor] & full == full:
+                self.dead -= 1
+            forbidden[neighbor] &= ~bit
+
+        self.color_counts[colors[vtx]] -= 1
+        colors[vtx] = 0
+        self.uncolored += 1
+
+    def threatened(self):
+        """
+        Determines if some uncolored vertex is one color away from being dead,
+        with an uncolored neighbor that can still take that color. Whoever
+        moves next as Player 2 can then win immediately.
+
+        Return:
+            True if such a vertex exists, else False
+        """
+        colors = self.colors
+        forbidden = self.forbidden
+        neighbors = self.topology.neighbors
+        almost_dead = self.bounds - 1
+
+        for vtx, mask in enumerate(forbidden):
+            if colors[vtx] == 0 and self.saturation[mask] == almost_dead:
+                missing = self.full_mask & ~mask
+                for neighbor in neighbors[vtx]:
+                    if colors[neighbor] == 0 and not forbidden[neighbor] & missing:
+                        return True
+
+        return False
+
+    def threats(self):
+        """
+        Finds the threats against Player 1: uncolored vertices one color away
+        from being dead, with uncolored neighbors (enablers) that can still
+        take the missing color. Player 2 wins next move by coloring an enabler
+        with it, unless Player 1 defuses every threat first.
+
+        Return:
+            A list of `(vertex, missing color bit, enablers)` tuples
+        """
+        colors = self.colors
+        forbidden = self.forbidden
+        neighbors = self.topology.neighbors
+        almost_dead = self.bounds - 1
+        found = []
+
+        for vtx, mask in enumerate(forbidden):
+            if colors[vtx] or self.saturation[mask] != almost_dead:
+                continue
+
+            missing = self.full_mask & ~mask
+            enablers = [neighbor for neighbor in neighbors[vtx]
+                    if colors[neighbor] == 0 and not forbidden[neighbor] & missing]
+            if enablers:
+                found.append((vtx, missing, enablers))
+
+        return found
+
+    def defuses(self, threats, vtx, color):
+        """
+        Determines if a move of Player 1 defuses every threat. A threat is
+        defused by coloring its vertex, or by leaving none of its enablers
+        able to take the missing color: each one is either colored by the
+        move, or next to the vertex colored with the missing color.
+        Coloring an enabler itself with the missing color kills the vertex.
+
+        Args:
+            threats : The threats, as returned by `threats()`
+            vtx : The vertex to color
+            color : The color to use
+
+        Return:
+            True if no threat is left after the move, else False
+        """
+        neighbors = self.topology.neighbors
+        bit = 1 << color
+
+        for threatened, missing, enablers in threats:
+            if vtx == threatened:
+                continue
+            if bit == missing and vtx in enablers:
+                return False
+
+            for enabler in enablers:
+                if enabler != vtx and not (bit == missing and vtx in neighbors[enabler]):
+                    return False
+
+        return True
+
+    def endangered(self):
+        """
+        Determines if some uncolored vertex could still be made dead: the
+        game colors forbidden to it plus its uncolored neighbors must number
+        at least as many as the game's colors.
+
+        Return:
+            True if such a vertex exists, else False
+        """
+        colors = self.colors
+        forbidden = self.forbidden
+        neighbors = self.topology.neighbors
+        saturation = self.saturation
+        bounds = self.bounds
+
+        for vtx, mask in enumerate(forbidden):
+            if colors[vtx] == 0 and len(neighbors[vtx]) >= bounds - saturation[mask]:
+                free = 0
+                for neighbor in neighbors[vtx]:
+                    if colors[neighbor] == 0:
+                        free += 1
+                if saturation[mask] + free >= bounds:
+                    return True
+
+        return False
+
+    def key(self, to_move):
+        """
+        Computes the transposition table key of the loaded position.
+        Colors are renumbered in order of first appearance. Early in the game,
+        the smallest such coloring among the images under the known
+        automorphisms is used instead.
+
+        Args:
+            to_move : Index of the player to move
+
+        Return:
+            A hashable key of the position
+        """
+        colors = bytes(self.colors)
+
+        if self.initial_uncolored - self.uncolored > self.symmetry_depth:
+            return (to_move, self.relabel(colors))
+
+        return (to_move, min(self.relabel(bytes(map(colors.__getitem__, perm)))
+                for perm in self.automorphisms))
+
+    def relabel(self, colors):
+        """
+        Renumbers the colors of a coloring in order of first appearance.
+
+        Args:
+            colors : The coloring, as bytes
+
+        Return:
+            The renumbered coloring, as bytes
+        """
+        order = tuple(sorted([color for color in range(1, self.bounds + 1) if color in colors],
+                key=colors.find))
+
+        table = self.relabel_tables.get(order)
+        if table is None:
+            table = bytearray(range(256))
+            for label, color in enumerate(order, 1):
+                table[color] = label
+            table = self.relabel_tables[order] = bytes(table)
+
+        return colors.translate(table)
+
+def find_automorphisms(topology, limit):
+    """
+    Finds automorphisms of a graph by backtracking, pruning with vertex degrees
+    and the adjacency of the vertices mapped so far. The identity always comes first.
+
+    Args:
+        topology : The graph's topology
+        limit : Maximum number of automorphisms to find
+
+    Return:
+        A list of permutations, where `perm[v]` is the image of vertex `v`
+    """
+    num_vertices = topology.num_vertices
+    neighbors = topology.neighbors
+    masks = [sum(1 << neighbor for neighbor in neighbors[vtx]) for vtx in range(num_vertices)]
+
+    # Vertices only map onto vertices with the same degree and neighbor degrees
+    signature = [(topology.degrees[vtx], tuple(sorted(topology.degrees[n] for n in neighbors[vtx])))
+            for vtx in range(num_vertices)]
+
+    # Map vertices in breadth-first order so adjacency constrains the search early
+    order = []
+    seen = set()
+    for root in sorted(range(num_vertices), key=lambda vtx: -topology.degrees[vtx]):
+        if root in seen:
+            continue
+        seen.add(root)
+        queue = [root]
+        for vtx in queue:
+            order.append(vtx)
+            for neighbor in neighbors[vtx]:
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    queue.append(neighbor)
+
+    identity = tuple(range(num_vertices))
+    found = [identity]
+    perm = [-1] * num_vertices
+    # Bitmask of the vertices used as images so far
+    state = {"image": 0}
+
+    def extend(depth):
+        if len(found) >= limit:
+            return
+        if depth == num_vertices:
+            if tuple(perm) != identity:
+                found.append(tuple(perm))
+            return
+
+        vtx = order[depth]
+        # Images of the already-mapped neighbors of `vtx`
+        mapped = 0
+        for neighbor in neighbors[vtx]:
+            if perm[neighbor] >= 0:
+                mapped |= 1 << perm[neighbor]
+
+        for target in range(num_vertices):
+            if state["image"] >> target & 1 or signature[target] != signature[vtx]:
+                continue
+            if masks[target] & state["image"] != mapped:
+                continue
+
+            perm[vtx] = target
+            state["image"] |= 1 << target
+            extend(depth + 1)
+            state["image"] &= ~(1 << target)
+            perm[vtx] = -1
+
+            if len(found) >= limit:
+                return
+
+    extend(0)
+
+    return found
+
+def invert(perm):
+    """
+    Inverts a permutation.
+
+    Args:
+        perm : A permutation, as a sequence
+
+    Return:
+        The inverse permutation, as a tuple
+    """
+    inverse = [0] * len(perm)
+    for src, dst in enumerate(perm):
+        inverse[dst] = src
+
+    return tuple(inverse)
@@ -0,0 +1,156 @@
+##
+# Graph Topology
+# The static structure of a graph coloring board: the vertex count, the
+# neighbors of every vertex and their degrees, and the neighbors of every
+# vertex as a bitmask (bit `u` of `neighbor_masks[v]` is set if `u` is a
+# neighbor of `v`).
+# The topology never changes during a game, so a single instance is built per
+# graph and shared by every board of that graph.
+# The bitmasks take space proportional to the square of the vertex count, so
+# they are only built when first read, by boards that need them.
+# The neighbors are also available in compressed sparse row form (`csr`), as
+# NumPy arrays, for boards of large graphs; these are built when first read
+# too, unless the topology was itself built from them.
+#
+# Date: 2026-10-18
+##
+
+import numpy as np
+
+class GCTopology:
+
+    __slots__ = ("num_vertices", "neighbors", "degrees", "masks", "arrays")
+
+    def __init__(self, adjacency):
+        """
+        Topology constructor.
+
+        Args:
+            adjacency : A list of neighbor lists, one per vertex
+        """
+        self.num_vertices = len(adjacency)
+        self.neighbors = tuple(tuple(adj) for adj in adjacency)
+        self.degrees = tuple(len(adj) for adj in self.neighbors)
+        self.masks = None
+        self.arrays = None
+
+    @property
+    def neighbor_masks(self):
+        """
+        The neighbors of every vertex as a bitmask, built the first time they are read.
+
+        Return:
+            A tuple of bitmasks, one per vertex
+        """
+        if self.masks is None:
+            self.masks = tuple(sum(1 << neighbor for neighbor in set(adj)) for adj in self.neighbors)
+
+        return self.masks
+
+    @property
+    def csr(self):
+        """
+        The neighbors of every vertex in compressed sparse row form, built the
+        first time they are read. The neighbors of vertex `v` are
+        `indices[indptr[v]:indptr[v + 1]]`, in increasing order and without
+        duplicates or self-loops.
+
+        Return:
+            A tuple of the `indptr` and `indices` arrays
+        """
+        if self.arrays is None:
+            sources = np.repeat(np.arange(self.num_vertices, dtype=np.int64), self.degrees)
+            targets = np.fromiter((neighbor for adj in self.neighbors for neighbor in adj),
+                    dtype=np.int64, count=len(sources))
+            self.arrays = to_csr(self.num_vertices, sources, targets)
+
+        return self.arrays
+
+    @classmethod
+    def from_state(cls, state):
+        """
+        Extracts the topology of a graph coloring board state.
+
+        Args:
+            state : A list of `{"color", "adj"}` vertices
+
+        Return:
+            The graph's topology
+        """
+        return cls([vertex["adj"] for vertex in state])
+
+    @classmethod
+    def from_csr(cls, indptr, indices):
+        """
+        Builds a topology from a graph in compressed sparse row form, where the
+        neighbors of vertex `v` are `indices[indptr[v]:indptr[v + 1]]`.
+        The arrays are kept as the topology's `csr`, so the neighbors of every
+        vertex should be distinct, as in the arrays `gc_loader` returns.
+
+        Args:
+            indptr : A sequence of offsets into `indices`, one per vertex plus one
+            indices : A sequence of the neighbors of every vertex, one vertex after another
+
+        Return:
+            The graph's topology
+        """
+        offsets = np.asarray(indptr).tolist()
+        neighbors = np.asarray(indices).tolist()
+
+        topology = cls([neighbors[start:end] for start, end in zip(offsets, offsets[1:])])
+        topology.arrays = (np.asarray(indptr), np.asarray(indices))
+
+        return topology
+
+    def to_state(self):
+        """
+        Builds an uncolored graph coloring board state of the graph.
+
+        Return:
+            A list of `{"color", "adj"}` vertices, all uncolored
+        """
+        return [{"color": 0, "adj": list(adj)} for adj in self.neighbors]
+
+    def __len__(self):
+        """
+        Overrides the default implementation of `len()`.
+
+        Return:
+            The number of vertices in the graph
+        """
+        return self.num_vertices
+
+def to_csr(num_vertices, sources, targets):
+    """
+    Builds the compressed sparse row form of an undirected graph from its edges.
+    Every edge is added in both directions; duplicates and self-loops are dropped.
+
+    Args:
+        num_vertices : The number of vertices
+        sources : Array of the first endpoint of every edge
+        targets : Array of the second endpoint of every edge
+
+    Return:
+        A tuple of the `indptr` and `indices` arrays
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+
+    if len(sources) and (min(sources.min(), targets.min()) < 0
+            or max(sources.max(), targets.max()) >= num_vertices):
+        raise ValueError("Edge endpoint out of range for {} vertices".format(num_vertices))
+
+    indptr = np.zeros(num_vertices + 1, dtype=np.int64)
+    if num_vertices == 0:
+        return indptr, np.zeros(0, dtype=np.int32)
+
+    loops = sources == targets
+    both = np.concatenate((sources[~loops], targets[~loops]))
+    other = np.concatenate((targets[~loops], sources[~loops]))
+
+    # Sorting the edges by source, then target, groups every vertex's neighbors in order
+    pairs = np.unique(both * num_vertices + other)
+    np.cumsum(np.bincount(pairs // num_vertices, minlength=num_vertices), out=indptr[1:])
+
+    # Neighbors fit in 32 bits for any graph that fits in memory
+    return indptr, (pairs % num_vertices).astype(np.int32 if num_vertices < 2 ** 31 else np.int64)
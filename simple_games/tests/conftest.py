@@ -0,0 +1,12 @@
+##
+# Test configuration. Puts `simple_games` on the import path, so tests import
+# modules the same way the games and benchmarks do (`classes.game`,
+# `graph_coloring.classes.gc_ruleset`).
+#
+# Date: 2026-10-18
+##
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
@@ -0,0 +1,115 @@
+##
+# Checks that an engine exiting, dropping its pipes or answering with something
+# that is not a move loses that game, as an illegal move would, rather than
+# aborting the tournament.
+#
+# Date: 2026-10-18
+##
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+from classes import engine as e
+from classes.async_tournament import AsyncTournament
+from classes.engine_strategy import EngineStrategy
+from classes.player import Player
+from classes.referee import Referee
+from classes.strategy_interface import StrategyInterface
+from graph_coloring.classes.gc_ruleset import GCRuleset
+from toothpick_takeaway.classes.toothpick_ruleset import ToothpickRuleset
+from unbalanced_rook.classes.rook_ruleset import RookRuleset
+
+STUB_ENGINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "classes", "stub_engine.py")
+
+# A path of 6 vertices, which the stub engines color without a dead vertex
+PATH = [{"color": 0, "adj": [adj for adj in (vtx - 1, vtx + 1) if 0 <= adj < 6]} for vtx in range(6)]
+
+# Answers that are valid JSON but not a move of the game, by game
+BAD_ANSWERS = [
+    ("graph_coloring", '{"vertex": 99, "color": 1}'),
+    ("graph_coloring", '{"vertex": -1, "color": 1}'),
+    ("graph_coloring", '{"vertex": 0, "color": 1.5}'),
+    ("graph_coloring", '"abc"'),
+    ("graph_coloring", "5"),
+    ("graph_coloring", '{"direction": "D"}'),
+    ("toothpick", "2.5"),
+    ("toothpick", '"abc"'),
+    ("toothpick", '{"vertex": 0, "color": 1}'),
+    ("rook", '{"direction": "D"}'),
+    ("rook", '{"direction": "D", "tiles": 1.5}'),
+    ("rook", '"abc"'),
+    ("rook", "5"),
+]
+
+def ruleset(game):
+    """
+    Builds the ruleset of a game the stub engine can play.
+
+    Args:
+        game : "graph_coloring", "toothpick" or "rook"
+
+    Return:
+        The ruleset
+    """
+    if game == "graph_coloring":
+        return GCRuleset("Path", PATH, 3)
+    if game == "toothpick":
+        return ToothpickRuleset("Toothpick Ruleset", 10, 2)
+
+    return RookRuleset("Rook Ruleset", {"D": 0, "R": 0}, {"D": 4, "R": 4})
+
+class BrokenPipeStrategy(StrategyInterface):
+
+    async def move_async(self, board):
+        """
+        Fails as writing to an engine that has exited does.
+
+        Args:
+            board : The board being played on
+        """
+        raise BrokenPipeError("Engine exited")
+
+def test_engine_exit_loses_game():
+    ruleset = GCRuleset("Path", PATH, 3)
+    crashing = e.EnginePool([sys.executable, STUB_ENGINE, "--exit-after", "1"], size=2)
+    healthy = e.EnginePool([sys.executable, STUB_ENGINE], size=2)
+    tournament = AsyncTournament(ruleset, 1, 0.5, move_timeout=10)
+
+    try:
+        p1_wins = e.run(tournament.play_async([EngineStrategy("Crashing", crashing)],
+                [EngineStrategy("Healthy", healthy)], [(0, 0, None)] * 4))
+        assert p1_wins == [False] * 4
+
+        # Without the crash, the same engines color the whole path
+        p1_wins = e.run(tournament.play_async([EngineStrategy("Healthy", healthy)],
+                [EngineStrategy("Healthy", healthy)], [(0, 0, None)] * 2))
+        assert p1_wins == [True] * 2
+    finally:
+        e.run(crashing.close())
+        e.run(healthy.close())
+
+def test_broken_pipe_is_illegal_move():
+    ruleset = GCRuleset("Path", PATH, 3)
+    board = ruleset.create_board()
+    player = Player("Player 1", BrokenPipeStrategy("Broken Pipe"))
+
+    move = asyncio.run(Referee(board, ruleset).ask_for_move_async(player, board, 1.0))
+
+    assert move is None
+
+@pytest.mark.parametrize("game, answer", BAD_ANSWERS)
+def test_bad_answer_loses_game(game, answer):
+    bad = e.EnginePool([sys.executable, STUB_ENGINE, "--answer", answer], size=2)
+    healthy = e.EnginePool([sys.executable, STUB_ENGINE], size=2)
+    tournament = AsyncTournament(ruleset(game), 1, 0.5, move_timeout=10)
+
+    try:
+        p1_wins = e.run(tournament.play_async([EngineStrategy("Bad", bad)],
+                [EngineStrategy("Healthy", healthy)], [(0, 0, None)] * 2))
+        assert p1_wins == [False] * 2
+    finally:
+        e.run(bad.close())
+        e.run(healthy.close())
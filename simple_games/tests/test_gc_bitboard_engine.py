@@ -0,0 +1,77 @@
+##
+# Checks that `GCBitBoardEngine` decides every game between order-based
+# strategies exactly as `Game.play` does, on every board backend.
+#
+# Date: 2026-10-18
+##
+
+import random
+
+import pytest
+
+from classes.tournament import Tournament, play_match
+from graph_coloring.classes.gc_ruleset import GCRuleset, BACKENDS
+from graph_coloring.classes.gc_data_strategy import GCDataStrategy
+from graph_coloring.classes.gc_bitboard_engine import GCBitBoardEngine
+
+def random_game(rng):
+    """
+    Builds a random graph with a few precolored vertices, and order-based
+    strategies for it, some of whose orderings skip or repeat entries.
+
+    Args:
+        rng : The random number generator to use
+
+    Return:
+        A tuple of the initial state, the number of colors and the strategies of both players
+    """
+    num_vertices = rng.randint(1, 16)
+    bounds = rng.randint(1, 4)
+
+    adj = [set() for _ in range(num_vertices)]
+    for _ in range(rng.randint(0, 2 * num_vertices)):
+        vtx, neighbor = rng.randrange(num_vertices), rng.randrange(num_vertices)
+        if vtx != neighbor:
+            adj[vtx].add(neighbor)
+            adj[neighbor].add(vtx)
+
+    state = [{"color": rng.choice([1, 2, bounds + 1]) if rng.random() < 0.1 else 0, "adj": sorted(neighbors)}
+            for neighbors in adj]
+
+    def strategy():
+        if rng.random() < 0.8:
+            vertices = rng.sample(range(num_vertices), num_vertices)
+            colors = rng.sample(range(1, bounds + 1), bounds)
+        else:
+            vertices = [rng.randrange(num_vertices) for _ in range(rng.randint(0, num_vertices))]
+            colors = [rng.randint(0, bounds + 1) for _ in range(rng.randint(0, bounds + 1))]
+
+        return GCDataStrategy("Data", {"vertices": vertices, "colors": colors})
+
+    return state, bounds, [strategy() for _ in range(4)], [strategy() for _ in range(4)]
+
+@pytest.mark.parametrize("backend", list(BACKENDS))
+def test_matches_game(backend):
+    rng = random.Random(0)
+
+    for _ in range(100):
+        state, bounds, p1_strats, p2_strats = random_game(rng)
+        rules = GCRuleset("test", state, bounds, backend=backend)
+        pairings = [(i, j, 0) for i in range(len(p1_strats)) for j in range(len(p2_strats))]
+
+        tournament = Tournament(rules, 1, 0.5)
+        expected = [play_match(tournament.referee, tournament.board, p1_strats[i], p2_strats[j], seed)
+                for i, j, seed in pairings]
+
+        assert GCBitBoardEngine(rules).play_matches(p1_strats, p2_strats, pairings) == expected
+
+def test_board_untouched():
+    rng = random.Random(1)
+    state, bounds, p1_strats, p2_strats = random_game(rng)
+    board = GCRuleset("test", state, bounds, backend="bitboard").create_board()
+    masks = (board.uncolored, list(board.color_masks), list(board.blocked))
+
+    board.play_orders((p1_strats[0].data["vertices"], p1_strats[0].data["colors"]),
+            (p2_strats[0].data["vertices"], p2_strats[0].data["colors"]))
+
+    assert (board.uncolored, board.color_masks, board.blocked) == masks
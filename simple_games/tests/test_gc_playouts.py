@@ -0,0 +1,100 @@
+##
+# Checks the random games of `GCRuleset.playout()` and `GCRuleset.playouts()`
+# against the exact odds of their move policy, on every board backend.
+#
+# Date: 2026-10-18
+##
+
+import random
+from functools import lru_cache
+
+import numpy as np
+import pytest
+
+from graph_coloring.classes.gc_ruleset import GCRuleset, BACKENDS
+
+# Graphs, initial colorings and numbers of colors; several end with isolated vertices
+POSITIONS = [
+    ([[2], [2], [0, 1], []], [0, 1, 0, 0], 2),
+    ([[2], [2], [0, 1]], [0, 1, 0], 2),
+    ([[1], [0, 2], [1, 3], [2], []], [0, 0, 0, 0, 0], 2),
+    ([[1, 2, 3], [0, 2], [0, 1, 3], [0, 2], [], []], [0, 2, 0, 0, 0, 0], 3),
+]
+
+# Games played per check, and how far the share of wins may stray from the exact odds
+GAMES = 20000
+TOLERANCE = 0.02
+
+def win_odds(adj, colors, bounds):
+    """
+    Computes the exact probability that Player 1 wins when every move colors
+    a uniformly random uncolored vertex with a uniformly random free color.
+
+    Args:
+        adj : The graph, as a list of neighbor lists
+        colors : The initial coloring; 0 for uncolored vertices
+        bounds : The number of colors
+
+    Return:
+        The probability that the graph ends up fully colored
+    """
+    @lru_cache(maxsize=None)
+    def odds(colors):
+        free = {vtx: [color for color in range(1, bounds + 1) if all(colors[n] != color for n in adj[vtx])]
+                for vtx, color in enumerate(colors) if color == 0}
+        if not free:
+            return 1.0
+        if any(not colors_left for colors_left in free.values()):
+            return 0.0
+
+        total = 0.0
+        for vtx, colors_left in free.items():
+            for color in colors_left:
+                total += odds(colors[:vtx] + (color,) + colors[vtx + 1:]) / len(colors_left)
+
+        return total / len(free)
+
+    return odds(tuple(colors))
+
+def ruleset(adj, colors, bounds, backend):
+    """
+    Builds a ruleset for a graph.
+
+    Args:
+        adj : The graph, as a list of neighbor lists
+        colors : The initial coloring
+        bounds : The number of colors
+        backend : The board backend
+
+    Return:
+        The ruleset
+    """
+    state = [{"color": color, "adj": neighbors} for color, neighbors in zip(colors, adj)]
+
+    return GCRuleset("test", state, bounds, backend=backend)
+
+@pytest.mark.parametrize("backend", list(BACKENDS))
+@pytest.mark.parametrize("adj, colors, bounds", POSITIONS)
+def test_playouts(adj, colors, bounds, backend):
+    rules = ruleset(adj, colors, bounds, backend)
+    board = rules.create_board(record=False)
+    key = board.key
+
+    wins = rules.playouts(board, GAMES, np.random.default_rng(0))
+
+    assert abs(wins / GAMES - win_odds(adj, colors, bounds)) < TOLERANCE
+    assert board.key == key
+
+@pytest.mark.parametrize("backend", list(BACKENDS))
+@pytest.mark.parametrize("adj, colors, bounds", POSITIONS)
+def test_playout(adj, colors, bounds, backend):
+    rules = ruleset(adj, colors, bounds, backend)
+    board = rules.create_board(record=False)
+    rng = random.Random(0)
+
+    wins = 0
+    for _ in range(GAMES):
+        board.reset()
+        wins += rules.playout(board, rng) == 0
+
+    assert abs(wins / GAMES - win_odds(adj, colors, bounds)) < TOLERANCE
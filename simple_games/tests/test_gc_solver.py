@@ -0,0 +1,106 @@
+##
+# Checks `GCSolver` against a brute-force minimax that searches every move
+# with no pruning, on small random graphs and on graphs the solver once got wrong.
+#
+# Date: 2026-10-18
+##
+
+import random
+from functools import lru_cache
+
+import pytest
+
+from graph_coloring.classes.gc_ruleset import GCRuleset
+from graph_coloring.classes.gc_solver import GCSolver
+
+# Graphs with 3 colors where Player 1 wins only by blocking the neighbors
+# that threaten a vertex, rather than coloring the vertex or its only threat
+BLOCKING_GRAPHS = [
+    [[1, 2], [0, 3, 4, 5, 6], [0, 3, 5, 6], [1, 2, 5], [1, 5], [1, 2, 3, 4], [1, 2]],
+    [[2, 4], [2, 3, 5], [0, 1, 3, 4, 5], [1, 2, 4], [0, 2, 3, 5], [1, 2, 4]],
+    [[1, 3, 5], [0, 2, 3, 4], [1, 5, 6], [0, 1, 5, 6], [1, 6], [0, 2, 3], [2, 3, 4]],
+    [[2, 4, 5], [2, 4, 5, 6], [0, 1, 6], [4, 5], [0, 1, 3, 6], [0, 1, 3], [1, 2, 4]],
+]
+
+def brute_force_winner(adj, bounds):
+    """
+    Determines the winner of the empty graph by searching every move.
+
+    Args:
+        adj : The graph, as a list of neighbor lists
+        bounds : The number of colors
+
+    Return:
+        0 if Player 1 wins, or 1 if Player 2 wins
+    """
+    num_vertices = len(adj)
+
+    @lru_cache(maxsize=None)
+    def winner(colors, to_move):
+        if all(colors):
+            return 0
+
+        free = [[color for color in range(1, bounds + 1) if all(colors[n] != color for n in adj[vtx])]
+                if not colors[vtx] else None for vtx in range(num_vertices)]
+        if any(colors_left == [] for colors_left in free):
+            return 1
+
+        for vtx in range(num_vertices):
+            for color in free[vtx] or ():
+                child = colors[:vtx] + (color,) + colors[vtx + 1:]
+                if winner(child, 1 - to_move) == to_move:
+                    return to_move
+
+        return 1 - to_move
+
+    return winner((0,) * num_vertices, 0)
+
+def random_graph(rng, num_vertices, density):
+    """
+    Builds a random graph where every edge is present with the same probability.
+
+    Args:
+        rng : The random number generator
+        num_vertices : The number of vertices
+        density : The probability of every edge
+
+    Return:
+        The graph, as a list of neighbor lists
+    """
+    adj = [[] for _ in range(num_vertices)]
+    for vtx in range(num_vertices):
+        for other in range(vtx + 1, num_vertices):
+            if rng.random() < density:
+                adj[vtx].append(other)
+                adj[other].append(vtx)
+
+    return adj
+
+def solve(adj, bounds):
+    """
+    Determines the winner of the empty graph with `GCSolver`.
+
+    Args:
+        adj : The graph, as a list of neighbor lists
+        bounds : The number of colors
+
+    Return:
+        0 if Player 1 wins, or 1 if Player 2 wins
+    """
+    state = [{"color": 0, "adj": neighbors} for neighbors in adj]
+
+    return GCSolver(GCRuleset("test", state, bounds)).solve()
+
+@pytest.mark.parametrize("adj", BLOCKING_GRAPHS)
+def test_blocking_defenses(adj):
+    assert solve(adj, 3) == brute_force_winner(adj, 3) == 0
+
+@pytest.mark.parametrize("seed", range(4))
+def test_random_graphs(seed):
+    rng = random.Random(seed)
+
+    for _ in range(100):
+        adj = random_graph(rng, rng.randint(3, 7), rng.uniform(0.2, 0.8))
+        bounds = rng.randint(2, 4)
+
+        assert solve(adj, bounds) == brute_force_winner(adj, bounds), (adj, bounds)
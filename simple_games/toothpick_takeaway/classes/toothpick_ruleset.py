@@ -10,7 +10,8 @@
 
 import sys
 sys.path.append("../..")
-from classes.ruleset_interface import RulesetInterface
+from classes.ruleset_interface import RulesetInterface, is_integer
+from classes import zobrist
 
 class ToothpickRuleset(RulesetInterface):
 
@@ -27,6 +28,9 @@ class ToothpickRuleset(RulesetInterface):
         self.initial_state = initial_state
         self.bounds = bounds
 
+        # The only feature of a state is the number of toothpicks remaining
+        self.zobrist = zobrist.table(1, initial_state + 1)
+
     def is_legal(self, board, proposed_move):
         """
         Determines if the move proposed is legal.
@@ -38,7 +42,7 @@ class ToothpickRuleset(RulesetInterface):
         Return:
             True if the move was legal, else False.
         """
-        if proposed_move is None:
+        if not is_integer(proposed_move):
             return False
 
         return proposed_move > 0 and proposed_move <= min(board.bounds, board.state)
@@ -58,12 +62,77 @@ class ToothpickRuleset(RulesetInterface):
     def update_board(self, board, player, move):
         """
         Update the board based on the player's given move.
-        Also updates the board's `data` field to log move history.
+        Also logs the move in the board's move history.
 
         Args:
             board : The board being played on
             player : The player who made the move
             move : The move being made
         """
-        board.data[board.state] = (player.name, move)
+        board.record(move)
+
+        if board.key is not None:
+            board.key ^= self.zobrist.delta(0, board.state, board.state - move)
+
         board.state -= move
+
+    def state_key(self, board):
+        """
+        Gets the key a board's state is filed under in a decoded move history.
+
+        Args:
+            board : The board being played on
+
+        Return:
+            The number of toothpicks remaining
+        """
+        return board.state
+
+    def generate_moves(self, board):
+        """
+        Generates every legal move on a board.
+        Called by `legal_moves()`, which caches the list until the next move.
+
+        Args:
+            board : The board being played on
+
+        Return:
+            A list of the numbers of toothpicks that can be picked up
+        """
+        return list(range(1, min(board.bounds, board.state) + 1))
+
+    def zobrist_key(self, board):
+        """
+        Computes the Zobrist key of a board's state from scratch.
+
+        Args:
+            board : The board being played on
+
+        Return:
+            The state's 64-bit key
+        """
+        return self.zobrist.key([board.state])
+
+    def encode_state(self, board):
+        """
+        Encodes a board's state as an integer, for `RetrogradeSolver`.
+
+        Args:
+            board : The board being played on
+
+        Return:
+            The number of toothpicks remaining
+        """
+        return board.state
+
+    def decode_state(self, code, board):
+        """
+        Loads a state encoded by `encode_state()` into a board.
+
+        Args:
+            code : The encoded state
+            board : The board to load the state into
+        """
+        board.state = code
+        board.moves = None
+        board.key = self.zobrist_key(board)
@@ -13,7 +13,11 @@
 
 import sys
 sys.path.append("..")
-from classes.ruleset_interface import RulesetInterface
+from classes.ruleset_interface import RulesetInterface, is_integer
+from classes import zobrist
+
+# Features of a state for Zobrist keys: the rook's row and column
+FEATURES = {"D": 0, "R": 1}
 
 class RookRuleset(RulesetInterface):
 
@@ -29,6 +33,7 @@ class RookRuleset(RulesetInterface):
         self.name = name
         self.initial_state = initial_state
         self.bounds = bounds
+        self.zobrist = zobrist.table(len(FEATURES), max(bounds.values()) + 1)
 
     def is_legal(self, board, proposed_move):
         """
@@ -45,8 +50,8 @@ class RookRuleset(RulesetInterface):
         legal = False
 
         # Check if the move supplied exists and is above 0
-        if (not proposed_move or not proposed_move["tiles"] or
-                not proposed_move["direction"] or proposed_move["tiles"] < 1):
+        if (not isinstance(proposed_move, dict) or not is_integer(proposed_move.get("tiles")) or
+                not proposed_move.get("direction") or proposed_move["tiles"] < 1):
             return legal
 
         if proposed_move["direction"] == "D":
@@ -73,14 +78,109 @@ class RookRuleset(RulesetInterface):
         """
         Updates the rook's position on the board by applying the move's
         direction and number of tiles.
-        Also updates the board's history, using the game state as an index.
+        Also logs the move in the board's move history.
 
         Args:
             board : The board being played on
             player : The player who made the move
             move : The move being made
         """
-        state = "{},{}".format(board.state["D"], board.state["R"])
-        board.data[state] = (player.name, move)
+        board.record(self.encode_move(move))
+
+        direction = move["direction"]
+        if board.key is not None:
+            board.key ^= self.zobrist.delta(FEATURES[direction], board.state[direction],
+                    board.state[direction] + move["tiles"])
+
+        board.state[direction] += move["tiles"]
+
+    def encode_move(self, move):
+        """
+        Encodes a move as an integer: the number of tiles, shifted left once,
+        with the low bit set for moves to the RIGHT.
+
+        Args:
+            move : The move being encoded
+
+        Return:
+            The move, as an integer
+        """
+        return move["tiles"] << 1 | (move["direction"] == "R")
+
+    def decode_move(self, code):
+        """
+        Decodes a move encoded by `encode_move()`.
+
+        Args:
+            code : The move, as an integer
+
+        Return:
+            The move, as a dictionary
+        """
+        return {"direction": "R" if code & 1 else "D", "tiles": code >> 1}
+
+    def state_key(self, board):
+        """
+        Gets the key a board's state is filed under in a decoded move history.
+
+        Args:
+            board : The board being played on
+
+        Return:
+            The rook's position, formatted as "D,R"
+        """
+        return "{},{}".format(board.state["D"], board.state["R"])
+
+    def generate_moves(self, board):
+        """
+        Generates every legal move on a board.
+        Called by `legal_moves()`, which caches the list until the next move.
 
-        board.state[move["direction"]] += move["tiles"]
+        Args:
+            board : The board being played on
+
+        Return:
+            A list of moves, as dictionaries
+        """
+        return ([{"direction": "D", "tiles": tiles}
+                    for tiles in range(1, board.bounds["D"] - board.state["D"] + 1)]
+                + [{"direction": "R", "tiles": tiles}
+                    for tiles in range(1, board.bounds["R"] - board.state["R"] + 1)])
+
+    def zobrist_key(self, board):
+        """
+        Computes the Zobrist key of a board's state from scratch.
+
+        Args:
+            board : The board being played on
+
+        Return:
+            The state's 64-bit key
+        """
+        return self.zobrist.key([board.state["D"], board.state["R"]])
+
+    def encode_state(self, board):
+        """
+        Encodes a board's state as an integer, for `RetrogradeSolver`.
+        Codes are below `(bounds["D"] + 1) * (bounds["R"] + 1)`.
+
+        Args:
+            board : The board being played on
+
+        Return:
+            The rook's position, as an integer
+        """
+        return board.state["D"] * (board.bounds["R"] + 1) + board.state["R"]
+
+    def decode_state(self, code, board):
+        """
+        Loads a state encoded by `encode_state()` into a board.
+
+        Args:
+            code : The encoded state
+            board : The board to load the state into
+        """
+        down, right = divmod(code, board.bounds["R"] + 1)
+        board.state = {"D": down, "R": right}
+        board.moves = None
+        board.key = self.zobrist_key(board)
@@ -30,8 +30,12 @@ class RookStrategy(StrategyInterface):
         """
         direction = random.choice(["D", "R"])
 
-        # Gets the max number of tiles possible to move
-        max_tiles = board.bounds[direction] - board.state[direction]
+        # Gets the max number of tiles possible to move, from the shared list of legal moves if there is one
+        moves = board.legal_moves()
+        if moves is not None:
+            max_tiles = sum(1 for move in moves if move["direction"] == direction)
+        else:
+            max_tiles = board.bounds[direction] - board.state[direction]
         if max_tiles < 1:
             return None
         move = random.randrange(1, max_tiles + 1)
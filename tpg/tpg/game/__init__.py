@@ -5,5 +5,8 @@ Defines the Game module, containing code pertaining to a single two-player game.
 from .player import Player
 from .game import Game
 from .board import Board
+from .graph_board import GraphTopology, GraphBoard
+from .profiler import Profiler
+from .mcts_player import MCTSPlayer
 
 #__all__ = ["game", "player", "board"]
@@ -10,8 +10,9 @@ defined and played upon.
 """
 
 from copy import deepcopy
-from typing import Any
+from typing import Any, List, Optional
 from abc import ABC, abstractmethod, ABCMeta
+from .zobrist import ZobristTable
 
 class Board(ABC):
     """
@@ -25,11 +26,23 @@ class Board(ABC):
         The current state of the game board.
     history : list
         A history of all moves made on this board
+    game : Game
+        The game being played on this board, which lists its legal moves; set by the game.
+    moves : list
+        The legal moves in the current position, cached by the game; None until listed.
+    zobrist : ZobristTable
+        The Zobrist numbers of the board's features; None for boards that are not hashed.
+    key : int
+        The Zobrist key of the current state; None for boards that are not hashed.
 
     Methods
     -------
     reset(self) : None
         Resets the board to its original state.
+    legal_moves(self) : list
+        Lists every legal move in the current position.
+    update_key(self, feature: int, old: int, new: int) : None
+        Updates the key after a feature of the state changes value.
     """
     
     def __init__(self, state: Any = None):
@@ -44,6 +57,11 @@ class Board(ABC):
         self.initial_state = deepcopy(state)
         self.state = state
         self.history = list()
+        self.game = None
+        self.moves: Optional[List[Any]] = None
+        self.zobrist: Optional[ZobristTable] = None
+        self.key: Optional[int] = None
+        self.initial_key: Optional[int] = None
 
     def reset(self) -> None:
         """
@@ -51,3 +69,41 @@ class Board(ABC):
         """
         self.state = deepcopy(self.initial_state)
         self.history = list()
+        self.moves = None
+        self.key = self.initial_key
+
+    def legal_moves(self) -> Optional[List[Any]]:
+        """
+        Lists every legal move in the current position, as determined by the
+        game being played on this board.
+
+        The list is shared by everyone asking about the same position, so it must not be modified.
+
+        Returns
+        -------
+            moves : list
+                The legal moves, or None if no game is being played on this board.
+        """
+        if self.game is None:
+            return None
+
+        return self.game.legal_moves()
+
+    def update_key(self, feature: int, old: int, new: int) -> None:
+        """
+        Updates the key after a feature of the state changes value, in constant time.
+
+        Subclasses that hash their state set up the zobrist table and initial key;
+        games call this from update_board() for each feature a move changes.
+
+        Parameters
+        ----------
+            feature : int
+                Index of the feature that changed.
+            old : int
+                The feature's value before the change.
+            new : int
+                The feature's value after the change.
+        """
+        if self.key is not None:
+            self.key ^= self.zobrist.delta(feature, old, new)
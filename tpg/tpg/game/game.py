@@ -10,7 +10,10 @@ eventually resulting in a winner and a loser (or a stalemate).
 
 from .player import Player
 from .board import Board
-from typing import Any
+from .profiler import Profiler
+from typing import Any, List, Optional
+from random import Random
+from types import SimpleNamespace
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 
@@ -32,6 +35,8 @@ class Game(ABC):
         The game board being played on.
     turn : int
         Number of turns elapsed (moves made) in this game.
+    profiler : Profiler
+        Times each phase of play when set; None disables profiling.
 
     Methods
     -------
@@ -44,11 +49,19 @@ class Game(ABC):
         Also updates the board's `history` field to log move history.
     declare_winner(self, players) : None
         Declare a winner based on the board's current state and game's rules.
+    legal_moves(self) : list
+        Lists every legal move in the current position, generating them at most once per position.
+    generate_moves(self) : list
+        Generates every legal move in the current position.
+    playout(self, rng: Random) : int
+        Plays random legal moves until the game is over, for tree search players.
+    playouts(self, count: int, rng: Random) : int
+        Plays many random games at once from the current position, if the game supports it.
     play(self, verbose: bool = False) : Board
         Executes the given game with the two provided players.
     """
 
-    def __init__(self, players: Sequence[Player, Player], board: Board):
+    def __init__(self, players: Sequence[Player, Player], board: Board, profiler: Optional[Profiler] = None):
         """
         Constructs a new Game instance to be played on by the provided players.
 
@@ -56,6 +69,10 @@ class Game(ABC):
         ----------
             players : Sequence
                 A sequence of the two players competing in this game.
+            board : Board
+                The game board to play on.
+            profiler (optional) : Profiler
+                Times each phase of play. Defaults to None, which disables profiling.
         """
         # Ensure players are of the proper type
         if not issubclass(type(players[0]), Player) or not issubclass(type(players[1]), Player):
@@ -76,7 +93,9 @@ class Game(ABC):
         self.current_opponent.goes_first = False
         self.winner = None
         self.board = board
+        self.board.game = self
         self.turn = 0
+        self.profiler = profiler
 
     @abstractmethod
     def is_move_legal(self, player: Player, move: Any) -> bool:
@@ -138,6 +157,92 @@ class Game(ABC):
         """
         raise NotImplementedError("Must implement abstract method declare_winner()")
 
+    def legal_moves(self) -> List[Any]:
+        """
+        Lists every legal move in the current position.
+
+        The list is generated by generate_moves() and cached on the board until
+        the next move is made, so players and the game asking about the same
+        position share one computation. The list must not be modified.
+
+        Returns
+        -------
+            moves : list
+                The legal moves.
+        """
+        if self.board.moves is None:
+            self.board.moves = self.generate_moves()
+
+        return self.board.moves
+
+    def generate_moves(self) -> List[Any]:
+        """
+        Generates every legal move in the current position.
+
+        Called by legal_moves() at most once per position. Games whose players
+        ask for legal moves must override this.
+
+        Returns
+        -------
+            moves : list
+                The legal moves.
+        """
+        raise NotImplementedError("Must implement generate_moves() to list legal moves")
+
+    def playout(self, rng: Random) -> int:
+        """
+        Plays random legal moves from the current position until the game is
+        over, as the simulations of a tree search do.
+
+        The current player must be the one who made the last move, as in play().
+        The board is left at the end of the game. Games with a faster way to
+        finish a game at random can override this.
+
+        Parameters
+        ----------
+            rng : Random
+                The random number generator to draw moves with.
+
+        Returns
+        -------
+            winner : int
+                Index of the winning player in `players`.
+        """
+        while not self.is_game_over():
+            self.turn += 1
+            self.current_player, self.current_opponent = self.current_opponent, self.current_player
+
+            # A player with no legal move can only make an illegal one, and loses
+            moves = self.legal_moves()
+            if not moves:
+                return 0 if self.current_opponent is self.players[0] else 1
+
+            self.update_board(self.current_player, moves[rng.randrange(len(moves))])
+            self.board.moves = None
+
+        return 0 if self.declare_winner() is self.players[0] else 1
+
+    def playouts(self, count: int, rng: Random) -> Optional[int]:
+        """
+        Plays many random games at once from the current position, without changing the board.
+
+        Games that can simulate games in bulk override this; by default it
+        returns None, and callers play games one at a time with playout().
+
+        Parameters
+        ----------
+            count : int
+                Number of games to play.
+            rng : Random
+                The random number generator to draw moves with.
+
+        Returns
+        -------
+            wins : int
+                Number of games won by the first of `players`, or None if unsupported.
+        """
+        return None
+
 
     '''
     def play(self, verbosity: int = 1) -> None:
@@ -203,6 +308,7 @@ class Game(ABC):
     def play(self, verbosity: int = 1) -> None:
         """
         Executes the given game with the two provided players.
+        If the game has a profiler, every phase is timed.
 
         Parameters
         ----------
@@ -213,28 +319,58 @@ class Game(ABC):
                 2 - Board state, current move at each turn.
                 3 - Final board state and move history at end of game.
         """
+        board = self.board
+        players = self.players
+
+        reset = board.reset
+        is_game_over = self.is_game_over
+        is_move_legal = self.is_move_legal
+        update_board = self.update_board
+        declare_winner = self.declare_winner
+
+        # Players make their moves and are told of the game through their own methods
+        agents = players
+
+        # Timing wraps each phase, leaving the loop itself the same
+        profiler = self.profiler
+        if profiler is not None:
+            game_start = profiler.clock()
+            reset = profiler.timed(self, "reset", reset)
+            is_game_over = profiler.timed(self, "is_game_over", is_game_over)
+            is_move_legal = profiler.timed(self, "is_move_legal", is_move_legal)
+            update_board = profiler.timed(self, "update_board", update_board)
+            declare_winner = profiler.timed(self, "declare_winner", declare_winner)
+            agents = [SimpleNamespace(move=profiler.timed(player, "move", player.move),
+                    **{name: profiler.timed(player, "hooks", getattr(player, name))
+                    for name in ("on_game_start", "on_move", "on_game_end")}) for player in players]
+
+        agent_of = {id(player): agent for player, agent in zip(players, agents)}
+
         if verbosity > 0:
             print(f"Starting game: {self.current_player.name} vs {self.current_opponent.name}")
 
-        self.board.reset()
+        reset()
+
+        for agent in agents:
+            agent.on_game_start(board)
 
         # dont worry about this
         self.turn = -1
         self.current_player, self.current_opponent = self.current_opponent, self.current_player
 
         # Loop until the end-game condition is met
-        while not self.is_game_over():
+        while not is_game_over():
             self.turn += 1
             self.current_player, self.current_opponent = self.current_opponent, self.current_player
             # Fetch a move from the current player
-            move = self.current_player.move(self.board)
+            move = agent_of[id(self.current_player)].move(board)
 
             if verbosity > 1:
-                print(f"\nBoard: {self.board.state}\nTurn #{self.turn}: {self.current_player.name} -> {move}")
+                print(f"\nBoard: {board.state}\nTurn #{self.turn}: {self.current_player.name} -> {move}")
 
             # If the move is NOT legal, the current opponent wins
             # Regardless of the end-game conditions, "foul behavior" is not permitted
-            if not self.is_move_legal(self.current_player, move):
+            if not is_move_legal(self.current_player, move):
                 self.winner = self.current_opponent
 
                 if verbosity > 0:
@@ -244,14 +380,25 @@ class Game(ABC):
                 break
 
             # If the move WAS legal, apply the move to the board
-            self.update_board(self.current_player, move)
+            update_board(self.current_player, move)
+            board.moves = None
+
+            # Both players learn of the move
+            for agent in agents:
+                agent.on_move(board, move)
 
         # Game loop has ended; declare winner and return board
-        self.winner = self.declare_winner()
+        self.winner = declare_winner()
+
+        for player, agent in zip(players, agents):
+            agent.on_game_end(board, player is self.winner)
+
+        if profiler is not None:
+            profiler.add_game(profiler.clock() - game_start)
 
         if verbosity > 0:
             print(f"Game Over - Winner: {self.winner.name}")
 
             if verbosity > 2:
-                print(f"Final State: {self.board.state}")
-                print(f"History: {self.board.history}")
+                print(f"Final State: {board.state}")
+                print(f"History: {board.history}")
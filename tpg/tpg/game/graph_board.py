@@ -0,0 +1,124 @@
+"""
+Graph Board
+
+Contains the class definitions of a graph's topology and of a game board played
+on a graph.
+
+The topology of a graph (its vertices and edges) never changes during a game,
+so it is stored once and shared by every board of that graph. The only
+per-game state of a graph board is a flat list holding one label per vertex,
+such as a color.
+"""
+
+from typing import Sequence, Tuple
+from .board import Board
+from .zobrist import table
+
+class GraphTopology:
+    """
+    Represents the immutable structure of a graph.
+
+    Attributes
+    ----------
+    num_vertices : int
+        The number of vertices in the graph.
+    neighbors : tuple
+        A tuple of neighbor tuples, one per vertex.
+    degrees : tuple
+        The degree of every vertex.
+    """
+
+    __slots__ = ("num_vertices", "neighbors", "degrees")
+
+    def __init__(self, adjacency: Sequence[Sequence[int]]):
+        """
+        Constructs a new GraphTopology from adjacency lists.
+
+        Parameters
+        ----------
+            adjacency : Sequence
+                A sequence of neighbor sequences, one per vertex.
+        """
+        self.num_vertices = len(adjacency)
+        self.neighbors = tuple(tuple(adj) for adj in adjacency)
+        self.degrees = tuple(len(adj) for adj in self.neighbors)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of vertices in the graph.
+        """
+        return self.num_vertices
+
+class GraphBoard(Board):
+    """
+    Represents a game board played on a graph.
+
+    Attributes
+    ----------
+    topology : GraphTopology
+        The graph being played on; shared with every other board of that graph.
+    state : list
+        The label of every vertex; 0 means unlabeled.
+    history : list
+        A history of all moves made on this board.
+    key : int
+        The Zobrist key of the labeling, with one feature per vertex.
+
+    Methods
+    -------
+    reset(self) : None
+        Resets every vertex to its initial label and erases the board's history.
+    set_label(self, vtx: int, label: int) : None
+        Labels a vertex, updating the board's key.
+    """
+
+    def __init__(self, topology: GraphTopology, state: Sequence[int] = None):
+        """
+        Constructs a new GraphBoard on the provided topology.
+
+        Parameters
+        ----------
+            topology : GraphTopology
+                The graph to play on.
+            state (optional) : Sequence
+                The initial label of every vertex. Defaults to all 0.
+        """
+        labels = list(state) if state is not None else [0] * topology.num_vertices
+
+        if len(labels) != topology.num_vertices:
+            raise ValueError(f"Expected {topology.num_vertices} vertex labels. Found {len(labels)}")
+
+        self.topology = topology
+        self.initial_state: Tuple[int, ...] = tuple(labels)
+        self.state = labels
+        self.history = list()
+        self.game = None
+        self.moves = None
+        self.zobrist = table(topology.num_vertices, max(labels, default=0) + 1)
+        self.key = self.initial_key = self.zobrist.key(labels)
+
+    def reset(self) -> None:
+        """
+        Resets every vertex to its initial label and erases the board's history.
+
+        Overwrites the existing state in place; neither the topology nor the
+        state is copied.
+        """
+        self.state[:] = self.initial_state
+        self.history.clear()
+        self.moves = None
+        self.key = self.initial_key
+
+    def set_label(self, vtx: int, label: int) -> None:
+        """
+        Labels a vertex, updating the board's key in constant time.
+
+        Parameters
+        ----------
+            vtx : int
+                The vertex to label.
+            label : int
+                The vertex's new label.
+        """
+        self.key ^= self.zobrist.delta(vtx, self.state[vtx], label)
+        self.state[vtx] = label
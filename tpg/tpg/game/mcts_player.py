@@ -0,0 +1,433 @@
+"""
+MCTS Player
+
+Contains the class definition of a player that searches for its moves with
+Monte Carlo tree search, in any game that can list its legal moves.
+
+Every iteration of the search walks down the tree from the current position,
+picking children by UCT (upper confidence bounds applied to trees), adds one
+untried move at the end of the walk, and plays a batch of random games from
+there through the game's playouts() if it has one, or playout() otherwise. The
+results are added to every node on the walk, and the most visited move is played.
+
+The player learns of every move through the game's hooks and keeps the subtree
+below the move actually played, so the search of one move carries over to the
+next. Positions are simulated on a copy of the game and its board, rebuilt by
+replaying the game's moves, and checked against the board's Zobrist key when it has one.
+"""
+
+from copy import copy, deepcopy
+from math import log, sqrt
+from random import Random
+from time import perf_counter
+from typing import Any, List, Optional
+from .board import Board
+from .player import Player
+
+class MCTSNode:
+    """
+    Represents a position in the search tree of an MCTSPlayer.
+
+    Attributes
+    ----------
+    move : Any
+        The move leading to this node from its parent.
+    parent : MCTSNode
+        The parent node; None for the root.
+    children : list
+        The nodes of the moves tried from this position.
+    untried : list
+        The moves not tried yet; None until the node is first reached.
+    player : int
+        Index of the player who made the move.
+    winner : int
+        Index of the winning player if the game is over here, else None.
+    visits : int
+        Number of games played through this node.
+    wins : int
+        Number of those games won by `player`.
+
+    Methods
+    -------
+    select(self, exploration: float) : MCTSNode
+        Picks the child with the best upper confidence bound.
+    child(self, move: Any) : MCTSNode
+        Finds the child reached by a move.
+    """
+
+    __slots__ = ("move", "parent", "children", "untried", "player", "winner", "visits", "wins")
+
+    def __init__(self, move: Any = None, parent: Optional["MCTSNode"] = None, player: int = 0):
+        """
+        Constructs a new MCTSNode.
+
+        Parameters
+        ----------
+            move (optional) : Any
+                The move leading to this node from its parent.
+            parent (optional) : MCTSNode
+                The parent node.
+            player (optional) : int
+                Index of the player who made the move.
+        """
+        self.move = move
+        self.parent = parent
+        self.children: List[MCTSNode] = list()
+        self.untried: Optional[List[Any]] = None
+        self.player = player
+        self.winner: Optional[int] = None
+        self.visits = 0
+        self.wins = 0
+
+    def select(self, exploration: float) -> "MCTSNode":
+        """
+        Picks the child with the best upper confidence bound.
+
+        Parameters
+        ----------
+            exploration : float
+                Weight of the exploration term.
+
+        Returns
+        -------
+            child : MCTSNode
+                The chosen child.
+        """
+        scale = exploration * sqrt(log(self.visits))
+
+        return max(self.children, key=lambda child: child.wins / child.visits + scale / sqrt(child.visits))
+
+    def child(self, move: Any) -> Optional["MCTSNode"]:
+        """
+        Finds the child reached by a move.
+
+        Parameters
+        ----------
+            move : Any
+                The move.
+
+        Returns
+        -------
+            child : MCTSNode
+                The child, or None if the move was never tried.
+        """
+        for child in self.children:
+            if child.move == move:
+                return child
+
+        return None
+
+class MCTSPlayer(Player):
+    """
+    Represents a player that searches for its moves with Monte Carlo tree search.
+
+    The game must implement generate_moves(). The search stops when either
+    budget runs out; at least one must be given.
+
+    Attributes
+    ----------
+    iterations : int
+        Number of iterations of the search per move; None for no limit.
+    time_limit : float
+        Number of seconds of search per move; None for no limit.
+    exploration : float
+        Weight of exploration in UCT.
+    batch_size : int
+        Number of random games played from every new node.
+    history : list
+        The moves made so far in the game being played.
+    root : MCTSNode
+        The search tree of the current position; None until the first search.
+
+    Methods
+    -------
+    move(self, board: Board) : Any
+        Searches for the best move in the board's position.
+    search(self, root: MCTSNode) : None
+        Runs one iteration of the search.
+    """
+
+    def __init__(self, name: str, iterations: Optional[int] = 200, time_limit: Optional[float] = None,
+            exploration: float = sqrt(2), batch_size: int = 8, seed: Any = None, generation: int = 0):
+        """
+        Constructs a new MCTSPlayer.
+
+        Parameters
+        ----------
+            name : str
+                A unique identifier for this player.
+            iterations (optional) : int
+                Number of iterations of the search per move, or None for no limit. Defaults to 200.
+            time_limit (optional) : float
+                Number of seconds of search per move, or None for no limit. Defaults to None.
+            exploration (optional) : float
+                Weight of exploration in UCT. Defaults to the square root of 2.
+            batch_size (optional) : int
+                Number of random games played from every new node. Defaults to 8.
+            seed (optional) : Any
+                Seed of the random games, for repeatable searches.
+            generation (optional) : int
+                The generation (or iteration) this player was born during.
+
+        Raises
+        ------
+            ValueError
+                If neither budget is given.
+        """
+        super().__init__(name, generation=generation)
+
+        if iterations is None and time_limit is None:
+            raise ValueError("MCTSPlayer needs an iteration or time budget")
+
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.batch_size = batch_size
+        self.rng = Random(seed)
+
+        self.board: Optional[Board] = None
+        self.history: List[Any] = list()
+        self.root: Optional[MCTSNode] = None
+
+        # Copy of the game the searches are simulated on, the game it copies,
+        # and the index of the game's first player
+        self.scratch = None
+        self.source = None
+        self.first = 0
+
+    def on_game_start(self, board: Board) -> None:
+        """
+        Starts a new tree for a new game.
+
+        Parameters
+        ----------
+            board : Board
+                The board the game is played on.
+        """
+        self.board = board
+        self.history = list()
+        self.root = None
+
+    def on_move(self, board: Board, move: Any) -> None:
+        """
+        Records a move made by either player, and keeps the subtree below it.
+
+        Parameters
+        ----------
+            board : Board
+                The board the game is played on.
+            move : Any
+                The move that was made.
+        """
+        # A player playing both sides is told of every move twice
+        if board is not self.board or len(self.history) > board.game.turn:
+            return
+
+        self.history.append(move)
+
+        if self.root is not None:
+            self.root = self.root.child(move)
+            if self.root is not None:
+                self.root.parent = None
+
+    def on_game_end(self, board: Board, won: bool) -> None:
+        """
+        Drops the tree of the game that just ended.
+
+        Parameters
+        ----------
+            board : Board
+                The board the game is played on.
+            won : bool
+                True if this player won the game.
+        """
+        self.board = None
+        self.history = list()
+        self.root = None
+
+    def move(self, board: Board) -> Any:
+        """
+        Searches for the best move in the board's position.
+
+        Parameters
+        ----------
+            board : Board
+                The board whereupon a move is being proposed.
+
+        Raises
+        ------
+            ValueError
+                If the board is not being played on, or the game's moves are unknown.
+
+        Returns
+        -------
+            move : Any
+                The most visited move, or None if there are no legal moves.
+        """
+        game = board.game
+        if game is None:
+            raise ValueError("MCTSPlayer needs a board that a game is being played on")
+
+        self.sync(board)
+
+        if self.time_limit is not None:
+            deadline = perf_counter() + self.time_limit
+
+        iteration = 0
+        while iteration == 0 or ((self.iterations is None or iteration < self.iterations)
+                and (self.time_limit is None or perf_counter() < deadline)):
+            self.search(self.root)
+            iteration += 1
+
+        if not self.root.children:
+            return None
+
+        return max(self.root.children, key=lambda child: child.visits).move
+
+    def sync(self, board: Board) -> None:
+        """
+        Sets up the copy of the game, and makes sure the moves and tree held
+        match the board's position.
+
+        Parameters
+        ----------
+            board : Board
+                The board being played on.
+        """
+        game = board.game
+
+        # Without the game's hooks, the moves are only known at the start of a game
+        if board is not self.board or len(self.history) != game.turn:
+            if game.turn != 0:
+                raise ValueError("MCTSPlayer needs the game's hooks to follow its moves")
+
+            self.on_game_start(board)
+
+        if self.source is not game:
+            self.scratch = copy(game)
+            self.scratch.profiler = None
+
+            # The copy of the board shares everything but its state with the board
+            self.scratch.board = copy(board)
+            self.scratch.board.state = deepcopy(board.state)
+            self.scratch.board.history = list()
+            self.scratch.board.game = self.scratch
+            self.source = game
+
+        # The player asked to move made the moves of the same parity
+        mover = 0 if game.current_player is game.players[0] else 1
+        self.first = mover ^ (len(self.history) % 2)
+
+        self.replay(self.history)
+        if board.key is not None and self.scratch.board.key != board.key:
+            raise ValueError("MCTSPlayer's copy of the game does not match the board")
+
+        if self.root is None:
+            self.root = MCTSNode(player=1 - mover)
+
+    def replay(self, moves: List[Any]) -> None:
+        """
+        Sets up the copy of the game in the position reached by a list of moves.
+
+        Parameters
+        ----------
+            moves : list
+                The moves made since the start of the game.
+        """
+        game = self.scratch
+        players = game.players
+
+        game.board.reset()
+        game.turn = -1
+
+        # The current player is the one who made the last move, as in play()
+        game.current_player, game.current_opponent = players[1 - self.first], players[self.first]
+
+        for move in moves:
+            game.turn += 1
+            game.current_player, game.current_opponent = game.current_opponent, game.current_player
+            game.update_board(game.current_player, move)
+            game.board.moves = None
+
+    def search(self, root: MCTSNode) -> None:
+        """
+        Runs one iteration of the search: selection, expansion, a batch of
+        random games, and backpropagation of their results.
+
+        Parameters
+        ----------
+            root : MCTSNode
+                The node of the current position.
+        """
+        game = self.scratch
+        path = list()
+
+        # Selection: follow UCT through fully expanded nodes
+        node = root
+        while node.winner is None and node.untried is not None and not node.untried and node.children:
+            node = node.select(self.exploration)
+            path.append(node.move)
+
+        # Expansion: list the node's moves when first reached, then add one
+        if node.winner is None:
+            self.replay(self.history + path)
+
+            if node.untried is None:
+                self.expand(node)
+
+        if node.winner is None and node.untried:
+            move = node.untried.pop()
+            path.append(move)
+
+            game.turn += 1
+            game.current_player, game.current_opponent = game.current_opponent, game.current_player
+            game.update_board(game.current_player, move)
+            game.board.moves = None
+
+            child = MCTSNode(move, node, 1 - node.player)
+            node.children.append(child)
+            node = child
+            self.expand(node)
+
+        # Simulation: a batch of random games, or the known result of a finished one
+        count = self.batch_size
+        if node.winner is not None:
+            wins = count if node.winner == 0 else 0
+        else:
+            wins = game.playouts(count, self.rng)
+
+            if wins is None:
+                wins = 0
+                for index in range(count):
+                    if index:
+                        self.replay(self.history + path)
+                    wins += game.playout(self.rng) == 0
+
+        # Backpropagation: every node counts the wins of the player who moved into it
+        while node is not None:
+            node.visits += count
+            node.wins += wins if node.player == 0 else count - wins
+            node = node.parent
+
+    def expand(self, node: MCTSNode) -> None:
+        """
+        Lists the moves of a node's position, held on the copy of the game, in
+        a random order, or records the winner if the game is over there.
+
+        Parameters
+        ----------
+            node : MCTSNode
+                The node.
+        """
+        game = self.scratch
+
+        if game.is_game_over():
+            node.winner = 0 if game.declare_winner() is game.players[0] else 1
+            return
+
+        node.untried = list(game.legal_moves())
+        self.rng.shuffle(node.untried)
+
+        # A player with no legal move can only make an illegal one, and loses
+        if not node.untried:
+            node.winner = node.player
@@ -30,6 +30,12 @@ class Player(ABC):
     -------
     move(self) : Any
         Determines a move for the Player to make in a game.
+    on_game_start(self, board: Board) : None
+        Called when a game starts, once the board is reset.
+    on_move(self, board: Board, move: Any) : None
+        Called once either player's move has been applied to the board.
+    on_game_end(self, board: Board, won: bool) : None
+        Called when a game is over.
     """
 
     def __init__(self, name: str, data: Any = None, generation: int = 0):
@@ -70,3 +76,44 @@ class Player(ABC):
                 A move to propose.
         """
         raise NotImplementedError("Must implement abstract method move()")
+
+    def on_game_start(self, board: Board) -> None:
+        """
+        Called when a game this player plays in starts, once the board is reset.
+
+        Players that keep state from one move to the next, rather than reading
+        the whole board on every turn, can set it up here. Does nothing by default.
+
+        Parameters
+        ----------
+            board : Board
+                The board the game is played on.
+        """
+        pass
+
+    def on_move(self, board: Board, move: Any) -> None:
+        """
+        Called once either player's move has been applied to the board, so the
+        player can update its state. Does nothing by default.
+
+        Parameters
+        ----------
+            board : Board
+                The board the game is played on.
+            move : Any
+                The move that was made.
+        """
+        pass
+
+    def on_game_end(self, board: Board, won: bool) -> None:
+        """
+        Called when a game this player plays in is over. Does nothing by default.
+
+        Parameters
+        ----------
+            board : Board
+                The board the game is played on.
+            won : bool
+                True if this player won the game.
+        """
+        pass
@@ -0,0 +1,194 @@
+"""
+Profiler
+
+Contains the class definition of a profiler of the phases of a game.
+
+A Game given a profiler times each phase of play with a monotonic clock:
+resetting the board, checking for the end of the game, asking a player for a
+move, checking the move's legality, updating the board, telling the players
+about the game (see Player.on_move()) and declaring a winner.
+A game with a profiler wraps each phase in a timed function and then plays the
+same loop as any other game. Games without a profiler skip all of this, so
+profiling costs nothing unless it is switched on.
+"""
+
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List, Tuple
+
+class Profiler:
+    """
+    Accumulates per-phase call counts and times across many games.
+
+    Times are charged to the class of the game for every phase except moves and
+    player hooks, which are charged to the class of the player.
+
+    Attributes
+    ----------
+    counters : dict
+        Maps an (owner class name, phase) pair to [number of calls, total nanoseconds].
+    games : int
+        Number of games profiled.
+    game_ns : int
+        Total time of the profiled games, in nanoseconds.
+
+    Methods
+    -------
+    clock(self) : int
+        Reads the profiler's monotonic clock, in nanoseconds.
+    add(self, owner: Any, phase: str, elapsed: int) : None
+        Records one call of a phase.
+    timed(self, owner: Any, phase: str, function: Callable) : Callable
+        Wraps a function so that every call is recorded as a call of a phase.
+    add_game(self, elapsed: int) : None
+        Records a whole game.
+    merge(self, other: Profiler) : None
+        Adds another profiler's measurements to this one's.
+    clear(self) : None
+        Discards every measurement.
+    report(self) : list
+        Summarizes the measurements, slowest phase first.
+    """
+
+    def __init__(self):
+        """
+        Constructs a new Profiler with no measurements.
+        """
+        self.counters: Dict[Tuple[str, str], List[int]] = {}
+        self.games = 0
+        self.game_ns = 0
+
+    def clock(self) -> int:
+        """
+        Reads the profiler's clock.
+
+        Returns
+        -------
+            now : int
+                A monotonic time, in nanoseconds.
+        """
+        return perf_counter_ns()
+
+    def add(self, owner: Any, phase: str, elapsed: int) -> None:
+        """
+        Records one call of a phase.
+
+        Parameters
+        ----------
+            owner : Any
+                The game or player whose class the time is charged to.
+            phase : str
+                The phase of the game.
+            elapsed : int
+                Time taken by the call, in nanoseconds.
+        """
+        key = (type(owner).__name__, phase)
+        counter = self.counters.get(key)
+
+        if counter is None:
+            self.counters[key] = [1, elapsed]
+        else:
+            counter[0] += 1
+            counter[1] += elapsed
+
+    def timed(self, owner: Any, phase: str, function: Callable) -> Callable:
+        """
+        Wraps a function so that every call is recorded as a call of a phase.
+
+        Parameters
+        ----------
+            owner : Any
+                The game or player whose class the time is charged to.
+            phase : str
+                The phase of the game.
+            function : Callable
+                The function to time.
+
+        Returns
+        -------
+            timed_function : Callable
+                A function taking the same arguments and returning the same result.
+        """
+        clock = self.clock
+        add = self.add
+
+        def timed_function(*args):
+            start = clock()
+            result = function(*args)
+            add(owner, phase, clock() - start)
+
+            return result
+
+        return timed_function
+
+    def add_game(self, elapsed: int) -> None:
+        """
+        Records a whole game.
+
+        Parameters
+        ----------
+            elapsed : int
+                Time taken by the game, in nanoseconds.
+        """
+        self.games += 1
+        self.game_ns += elapsed
+
+    def merge(self, other: "Profiler") -> None:
+        """
+        Adds another profiler's measurements to this one's, such as one used in another process.
+
+        Parameters
+        ----------
+            other : Profiler
+                The profiler to merge in.
+        """
+        for key, (calls, elapsed) in other.counters.items():
+            counter = self.counters.setdefault(key, [0, 0])
+            counter[0] += calls
+            counter[1] += elapsed
+
+        self.games += other.games
+        self.game_ns += other.game_ns
+
+    def clear(self) -> None:
+        """
+        Discards every measurement.
+        """
+        self.counters.clear()
+        self.games = 0
+        self.game_ns = 0
+
+    def report(self) -> List[Dict[str, Any]]:
+        """
+        Summarizes the measurements, slowest phase first.
+
+        Returns
+        -------
+            rows : list
+                One dictionary per class and phase, holding the number of calls,
+                the total and mean time, and the share of the total game time.
+        """
+        rows = [{
+            "owner": owner,
+            "phase": phase,
+            "calls": calls,
+            "total_s": elapsed / 1e9,
+            "mean_us": elapsed / calls / 1e3,
+            "share": elapsed / self.game_ns if self.game_ns else 0.0,
+            } for (owner, phase), (calls, elapsed) in self.counters.items()]
+
+        rows.sort(key=lambda row: row["total_s"], reverse=True)
+
+        return rows
+
+    def __str__(self) -> str:
+        """
+        Formats the report as a table.
+        """
+        lines = [f"{self.games} games, {self.game_ns / 1e9:.3f}s",
+                f"{'Class':<28} {'Phase':<16} {'Calls':>10} {'Total (s)':>10} {'Mean (us)':>10} {'Share':>7}"]
+
+        for row in self.report():
+            lines.append(f"{row['owner']:<28} {row['phase']:<16} {row['calls']:>10} "
+                    f"{row['total_s']:>10.3f} {row['mean_us']:>10.2f} {row['share']:>7.1%}")
+
+        return "\n".join(lines)
@@ -0,0 +1,185 @@
+"""
+Zobrist
+
+Contains the class definition of a table of Zobrist numbers, used to hash board
+states.
+
+A state is described by features (such as the vertices of a graph) that each
+take one of a few values (such as a label). Every (feature, value) pair is given
+a random 64-bit number, and the key of a state is the XOR of the numbers of its
+pairs. When a move changes one feature, the key is updated in constant time by
+XORing out the old value's number and XORing in the new one's.
+
+The numbers are derived from their feature and value by a fixed mixing function
+rather than drawn from a random generator, so every process computes the same
+keys. Keys describe positions only, not whose turn it is.
+"""
+
+from functools import lru_cache
+from typing import Iterable, List
+
+# Keys are 64-bit unsigned integers
+MASK = (1 << 64) - 1
+
+# Seed that every number is derived from
+SEED = 0x5A0B2157
+
+def mix(x: int) -> int:
+    """
+    Scrambles a 64-bit integer (the splitmix64 finalizer). Distinct inputs always give distinct outputs.
+
+    Parameters
+    ----------
+        x : int
+            The integer to scramble.
+
+    Returns
+    -------
+        mixed : int
+            The scrambled integer.
+    """
+    x = (x + 0x9E3779B97F4A7C15) & MASK
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK
+
+    return x ^ (x >> 31)
+
+class ZobristTable:
+    """
+    Holds the Zobrist numbers of every pair of a feature and a value.
+
+    Attributes
+    ----------
+    num_features : int
+        Number of features of a state.
+    num_values : int
+        Number of values each feature usually takes, from 0; larger values still
+        have numbers, they are just not precomputed.
+    table : list
+        The precomputed numbers, indexed by feature and then by value.
+
+    Methods
+    -------
+    number(self, feature: int, value: int) : int
+        Computes the number of a pair of a feature and a value.
+    value(self, feature: int, value: int) : int
+        Looks up the number of a pair of a feature and a value.
+    delta(self, feature: int, old: int, new: int) : int
+        Computes what a key must be XORed with when a feature changes value.
+    key(self, values: Iterable[int]) : int
+        Computes the key of a state from scratch.
+    """
+
+    def __init__(self, num_features: int, num_values: int):
+        """
+        Constructs a new ZobristTable.
+
+        Parameters
+        ----------
+            num_features : int
+                Number of features of a state.
+            num_values : int
+                Number of values each feature usually takes, from 0.
+        """
+        self.num_features = num_features
+        self.num_values = num_values
+        self.table: List[List[int]] = [[self.number(feature, value) for value in range(num_values)]
+                for feature in range(num_features)]
+
+    def number(self, feature: int, value: int) -> int:
+        """
+        Computes the number of a pair of a feature and a value.
+
+        Parameters
+        ----------
+            feature : int
+                Index of the feature.
+            value : int
+                The feature's value, a non-negative integer below 2 ** 32.
+
+        Returns
+        -------
+            number : int
+                The pair's 64-bit number.
+        """
+        return mix(SEED ^ (feature << 32) ^ value)
+
+    def value(self, feature: int, value: int) -> int:
+        """
+        Looks up the number of a pair of a feature and a value.
+
+        Parameters
+        ----------
+            feature : int
+                Index of the feature.
+            value : int
+                The feature's value.
+
+        Returns
+        -------
+            number : int
+                The pair's 64-bit number.
+        """
+        row = self.table[feature]
+
+        return row[value] if value < len(row) else self.number(feature, value)
+
+    def delta(self, feature: int, old: int, new: int) -> int:
+        """
+        Computes what a key must be XORed with when a feature changes value.
+
+        Parameters
+        ----------
+            feature : int
+                Index of the feature.
+            old : int
+                The feature's value before the change.
+            new : int
+                The feature's value after the change.
+
+        Returns
+        -------
+            delta : int
+                The number to XOR the key with.
+        """
+        return self.value(feature, old) ^ self.value(feature, new)
+
+    def key(self, values: Iterable[int]) -> int:
+        """
+        Computes the key of a state from scratch.
+
+        Parameters
+        ----------
+            values : Iterable
+                The value of every feature, in order.
+
+        Returns
+        -------
+            key : int
+                The state's 64-bit key.
+        """
+        key = 0
+        for feature, value in enumerate(values):
+            key ^= self.value(feature, value)
+
+        return key
+
+@lru_cache(maxsize=None)
+def table(num_features: int, num_values: int) -> ZobristTable:
+    """
+    Gets the shared table of a number of features and values. Tables are
+    deterministic, so every board of the same shape can share one.
+
+    Parameters
+    ----------
+        num_features : int
+            Number of features of a state.
+        num_values : int
+            Number of values each feature usually takes, from 0.
+
+    Returns
+    -------
+        table : ZobristTable
+            The shared table.
+    """
+    return ZobristTable(num_features, num_values)